@@ -1,15 +1,214 @@
+import functools
+import inspect
+import logging
 import time
 from argparse import Action
+from contextlib import nullcontext
+from urllib.parse import urljoin, urlsplit, urlunsplit
 
-from selenium.common import TimeoutException, ElementClickInterceptedException
+from selenium.common import (
+    TimeoutException, ElementClickInterceptedException, JavascriptException, NoSuchElementException,
+    StaleElementReferenceException,
+)
 from selenium.webdriver import ActionChains
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select
 
+from Utilities import DevTools
+from Utilities.DownloadWatcher import DownloadResult, DownloadWatcher
+
+logger = logging.getLogger(__name__)
+
+
+DOM_HELPERS_SCRIPT = """
+const FORM_TAGS = ["button", "input", "select", "textarea"];
+
+function isVisible(el) {
+    if (!el.isConnected) return false;
+    if (el.checkVisibility && !el.checkVisibility({checkOpacity: true, checkVisibilityCSS: true})) return false;
+    const style = getComputedStyle(el);
+    if (style.display === "none" || style.visibility !== "visible" || style.opacity === "0") return false;
+    const rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+}
+
+function isEnabled(el) {
+    const tag = el.tagName.toLowerCase();
+    if (FORM_TAGS.includes(tag)) return !el.matches(":disabled");
+    const ariaDisabled = el.getAttribute("aria-disabled");
+    if (ariaDisabled !== null) return ariaDisabled.toLowerCase() !== "true";
+    return !(el.getAttribute("class") || "").includes("ui-state-disabled");
+}
+
+// Matches Selenium's element_to_be_clickable: displayed and not a disabled form control.
+function isClickable(el) {
+    return isVisible(el) && !(FORM_TAGS.includes(el.tagName.toLowerCase()) && el.matches(":disabled"));
+}
+
+function checkCondition(xpath, condition) {
+    const el = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    switch (condition) {
+        case "present": return {ok: el !== null, element: el};
+        case "visible": return {ok: el !== null && isVisible(el), element: el};
+        case "clickable": return {ok: el !== null && isClickable(el), element: el};
+        case "invisible": return {ok: el === null || !isVisible(el), element: null};
+        default: throw new Error("Unknown wait condition: " + condition);
+    }
+}
+"""
+
+QUERY_ELEMENTS_SCRIPT = DOM_HELPERS_SCRIPT + """
+const queries = arguments[0], properties = arguments[1];
+
+function read(el, property) {
+    if (property.startsWith("./")) {
+        return document.evaluate(`normalize-space(${property})`, el, null, XPathResult.STRING_TYPE, null).stringValue;
+    }
+    switch (property) {
+        case "text": return isVisible(el) ? el.innerText.trim() : "";
+        case "visible": return isVisible(el);
+        case "selected": return Boolean(el.checked || el.selected);
+        case "enabled": return isEnabled(el);
+        case "tag": return el.tagName.toLowerCase();
+        case "value": return el.value === undefined ? null : el.value;
+        default: return property.startsWith("@") ? el.getAttribute(property.slice(1)) : el[property];
+    }
+}
+
+const snapshot = {};
+for (const [key, xpath] of queries) {
+    const result = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const items = [];
+    for (let i = 0; i < result.snapshotLength; i++) {
+        const el = result.snapshotItem(i);
+        const item = {};
+        for (const property of properties) item[property] = read(el, property);
+        items.push(item);
+    }
+    snapshot[key] = items;
+}
+return snapshot;
+"""
+
+CHECK_CONDITION_SCRIPT = DOM_HELPERS_SCRIPT + """
+return checkCondition(arguments[0], arguments[1]);
+"""
+
+# Resolves as soon as the condition holds: re-checked on every DOM mutation, plus a slow timer
+# for visibility changes that are not mutations (CSS transitions, layout).
+WAIT_FOR_CONDITION_SCRIPT = DOM_HELPERS_SCRIPT + """
+const xpath = arguments[0], condition = arguments[1], timeoutMs = arguments[2];
+const done = arguments[arguments.length - 1];
+const start = performance.now();
+let finished = false, observer = null, timer = null, interval = null;
+
+function finish(ok, element) {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearTimeout(timer);
+    clearInterval(interval);
+    done({ok: ok, element: element, elapsed: (performance.now() - start) / 1000});
+}
+
+function evaluate() {
+    const result = checkCondition(xpath, condition);
+    if (result.ok) finish(true, result.element);
+}
+
+evaluate();
+if (!finished) {
+    observer = new MutationObserver(evaluate);
+    observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+    interval = setInterval(evaluate, 50);
+    timer = setTimeout(() => finish(false, null), timeoutMs);
+}
+"""
+
+# Sets the value of an input through the native setter (so frameworks tracking the property notice)
+# and fires the events a user edit would; returns the value the browser kept (range inputs snap to step).
+SET_INPUT_VALUE_SCRIPT = """
+const [xpath, value] = arguments;
+const element = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+if (!element) return null;
+const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(element), "value").set;
+setter.call(element, String(value));
+element.dispatchEvent(new Event("input", {bubbles: true}));
+element.dispatchEvent(new Event("change", {bubbles: true}));
+return element.value;
+"""
+
+# Runs the HTML5 drag-and-drop event sequence a user drag fires, sharing one DataTransfer between
+# the events. drop only fires when the target accepted the drag by cancelling dragover, as in a browser.
+DRAG_AND_DROP_SCRIPT = """
+const [sourceXpath, targetXpath, offsetX, offsetY] = arguments;
+const find = xpath => document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+const source = find(sourceXpath);
+const target = find(targetXpath);
+if (!source || !target) return {ok: false, reason: "element not found"};
+if (typeof DataTransfer !== "function") return {ok: false, reason: "DataTransfer not constructible"};
+
+const centre = (element, dx, dy) => {
+    const rect = element.getBoundingClientRect();
+    return {clientX: rect.left + rect.width / 2 + dx, clientY: rect.top + rect.height / 2 + dy};
+};
+const from = centre(source, 0, 0);
+const to = centre(target, offsetX, offsetY);
+const dataTransfer = new DataTransfer();
+const fire = (element, type, point, init) => element.dispatchEvent(new (init.drag ? DragEvent : MouseEvent)(type, Object.assign(
+    {bubbles: true, cancelable: true, composed: true, view: window, button: 0}, point, init.drag ? {dataTransfer} : {}
+)));
+
+fire(source, "mousedown", from, {});
+if (!fire(source, "dragstart", from, {drag: true})) {
+    fire(source, "mouseup", from, {});
+    return {ok: true, dropped: false, reason: "dragstart cancelled"};
+}
+fire(source, "drag", from, {drag: true});
+fire(target, "dragenter", to, {drag: true});
+const accepted = !fire(target, "dragover", to, {drag: true});
+if (accepted) {
+    fire(target, "drop", to, {drag: true});
+} else {
+    fire(target, "dragleave", to, {drag: true});
+}
+fire(source, "dragend", to, {drag: true});
+fire(target, "mouseup", to, {});
+return {ok: true, dropped: accepted};
+"""
+
+# Keeps what the page puts in the DataTransfer of a real (CDP driven) dragstart, so it can be
+# handed back with the drop; listens on window in the bubble phase, after the page's own handlers.
+CAPTURE_DRAG_DATA_SCRIPT = """
+window.__dragData = null;
+window.addEventListener("dragstart", event => {
+    window.__dragData = Array.from(event.dataTransfer.types, type => ({mimeType: type, data: event.dataTransfer.getData(type)}));
+}, {once: true});
+"""
+
+
+def _page_scoped(method):
+    """
+    Run a page object method in a CommandRecorder page scope, so the commands it sends (including
+    those of the WebElements it uses) are attributed to its page object.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        recorder = getattr(getattr(self, "driver", None), "command_recorder", None)
+        if recorder is None:
+            return method(self, *args, **kwargs)
+        with recorder.page_scope(type(self).__name__):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _scope_public_methods(cls):
+    for name, member in list(vars(cls).items()):
+        if inspect.isfunction(member) and not name.startswith("_"):
+            setattr(cls, name, _page_scoped(member))
+
 
 class BasePage:
     """
@@ -17,6 +216,16 @@ class BasePage:
     using XPath as the sole locator strategy.
     """
 
+    # Root of the site under test; conftest points it at --base_url or the local stand-in site.
+    base_url = "https://the-internet.herokuapp.com/"
+
+    # Selenium's default asynchronous script timeout (seconds).
+    SCRIPT_TIMEOUT = 30
+
+    # How long presence/visibility checks wait before concluding an element is absent (seconds);
+    # conftest sets it from --absence_timeout.
+    absence_timeout = 0
+
     def __init__(self, driver: WebDriver, timeout: int = 10):
         """
         Initialize the BasePage.
@@ -27,6 +236,13 @@ class BasePage:
         self.driver = driver
         self.timeout = timeout
 
+    def __init_subclass__(cls, **kwargs):
+        """
+        Attribute the commands of every page object's public methods to that page object.
+        """
+        super().__init_subclass__(**kwargs)
+        _scope_public_methods(cls)
+
     def open(self, url: str):
         """
         Navigate to the specified URL.
@@ -35,6 +251,21 @@ class BasePage:
         """
         self.driver.get(url)
 
+    def url_for(self, path: str, username: str = None, password: str = None) -> str:
+        """
+        Build an absolute URL on the site under test.
+
+        :param path: Path relative to the base URL (e.g. '/checkboxes').
+        :param username: Optional user name embedded in the URL for HTTP authentication.
+        :param password: Optional password embedded in the URL for HTTP authentication.
+        :return: The absolute URL.
+        """
+        url = urljoin(self.base_url, path)
+        if username is None:
+            return url
+        parts = urlsplit(url)
+        return urlunsplit((parts.scheme, f"{username}:{password}@{parts.netloc}", parts.path, parts.query, ""))
+
     def get_url(self) -> str:
         """
         Get the current URL of the page.
@@ -49,37 +280,127 @@ class BasePage:
         """
         self.driver.refresh()
 
-    def find_element(self, xpath: str):
+    def find_element(self, xpath: str, timeout: float = None) -> WebElement:
         """
         Find a single element on the page using XPath.
 
+        The element is looked up immediately (the driver runs without an implicit wait); only when
+        it is not there yet does the lookup wait for it to appear, using the explicit wait engine.
+
         :param xpath: The XPath locator.
+        :param timeout: Optional timeout override for the wait (seconds).
         :return: WebElement if found.
+        :raises NoSuchElementException: If the element does not appear within the timeout.
         """
-        return self.driver.find_element(By.XPATH, xpath)
+        try:
+            return self.driver.find_element(By.XPATH, xpath)
+        except NoSuchElementException:
+            pass
+        try:
+            return self.wait_until(xpath, "present", timeout)
+        except TimeoutException:
+            raise NoSuchElementException(f"Element with XPath '{xpath}' not present within the timeout.")
 
-    def find_elements(self, xpath: str):
+    def find_elements(self, xpath: str) -> list[WebElement]:
         """
         Find multiple elements on the page using XPath.
 
         :param xpath: The XPath locator.
-        :return: List of WebElements.
+        :return: List of WebElements (empty if none are present right now).
         """
         return self.driver.find_elements(By.XPATH, xpath)
 
+    def query_elements(self, xpaths, properties=("text",)) -> dict:
+        """
+        Read properties of every element matched by many XPaths in a single round trip.
+
+        Supported properties: 'text', 'visible', 'selected', 'enabled', 'tag', 'value',
+        '@<name>' for an HTML attribute, './<xpath>' for the (whitespace-normalized) string value of
+        an XPath relative to the element, or any other name for the DOM property of that name.
+
+        :param xpaths: List of XPath locators, or dict of name to XPath locator.
+        :param properties: Properties to read for each matched element.
+        :return: Dict keyed by XPath (or name) with a list of {property: value} per matched element.
+        """
+        queries = list(xpaths.items()) if isinstance(xpaths, dict) else [[xpath, xpath] for xpath in xpaths]
+        return self.execute_script(QUERY_ELEMENTS_SCRIPT, queries, list(properties))
+
+    def instrument(self, phase: str, xpath: str = None, retry: int = 0):
+        """
+        Attribute the WebDriver commands sent inside the block to this page object,
+        when the driver is instrumented with a CommandRecorder.
+
+        :param phase: 'wait' or 'action'.
+        :param xpath: The XPath locator the block works on.
+        :param retry: Retry attempt (0 for the first attempt).
+        :return: Context manager.
+        """
+        recorder = getattr(self.driver, "command_recorder", None)
+        if recorder is None:
+            return nullcontext()
+        return recorder.span(type(self).__name__, phase, xpath, retry)
+
+    def wait_until(self, xpath: str, condition: str, timeout: float = None):
+        """
+        Wait until the first element matching an XPath meets a condition.
+
+        The condition is checked in the page by one async script that re-evaluates it on every
+        DOM mutation, so the wait ends as soon as the condition holds. If the script cannot run
+        (e.g. the page navigates away), the condition is polled instead, starting at a few
+        milliseconds and backing off. Time-to-condition is reported to the CommandRecorder.
+
+        :param xpath: The XPath locator.
+        :param condition: 'present', 'visible', 'clickable' or 'invisible'.
+        :param timeout: Optional timeout override (seconds).
+        :return: WebElement for 'present', 'visible' and 'clickable'; None for 'invisible'.
+        :raises TimeoutException: If the condition does not hold within the timeout.
+        """
+        wait_time = timeout if timeout is not None else self.timeout
+        start = time.perf_counter()
+        strategy = "observer"
+        with self.instrument("wait", xpath):
+            try:
+                result = self.execute_async_script(WAIT_FOR_CONDITION_SCRIPT, xpath, condition, int(wait_time * 1000),
+                                                   timeout=wait_time)
+            except (JavascriptException, TimeoutException, StaleElementReferenceException):
+                strategy = "polling"
+                remaining = wait_time - (time.perf_counter() - start)
+                result = self._poll_condition(xpath, condition, max(remaining, 0))
+        elapsed = time.perf_counter() - start
+
+        recorder = getattr(self.driver, "command_recorder", None)
+        if recorder is not None:
+            recorder.record_wait(type(self).__name__, xpath, condition, elapsed, strategy, result["ok"])
+        if not result["ok"]:
+            raise TimeoutException(f"Element with XPath '{xpath}' not {condition} within the timeout.")
+        return result["element"]
+
+    def _poll_condition(self, xpath: str, condition: str, timeout: float) -> dict:
+        deadline = time.perf_counter() + timeout
+        interval = 0.005
+        while True:
+            try:
+                result = self.execute_script(CHECK_CONDITION_SCRIPT, xpath, condition)
+                if result["ok"]:
+                    return result
+            except (JavascriptException, StaleElementReferenceException):
+                pass  # document replaced mid-check; try again on the new one
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return {"ok": False, "element": None}
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, 0.25)
+
     def wait_for_element_to_disappear(self,xpath:str, timeout: int = None ):
         """
         Wait for the loader element to disappear (become invisible or removed from DOM).
         """
-        wait_time = timeout if timeout is not None else self.timeout
         try:
-            WebDriverWait(self.driver, wait_time).until(
-                EC.invisibility_of_element_located((By.XPATH,xpath))
-            )
+            self.wait_until(xpath, "invisible", timeout)
         except TimeoutException:
             raise TimeoutException(f"Element with XPath '{xpath}' did not disappear within the timeout.")
 
-    def wait_for_element_visible(self, xpath: str, timeout: int = None):
+    def wait_for_element_visible(self, xpath: str, timeout: int = None) -> WebElement:
         """
         Wait until the element is visible on the page using XPath.
 
@@ -88,14 +409,11 @@ class BasePage:
         :return: WebElement if visible.
         """
         try:
-            wait_time = timeout if timeout is not None else self.timeout
-            return WebDriverWait(self.driver, wait_time).until(
-                EC.visibility_of_element_located((By.XPATH, xpath))
-            )
+            return self.wait_until(xpath, "visible", timeout)
         except TimeoutException:
             raise TimeoutException(f"Element with XPath '{xpath}' not visible within the timeout.")
 
-    def wait_for_element_clickable(self, xpath: str, timeout: int = None):
+    def wait_for_element_clickable(self, xpath: str, timeout: int = None) -> WebElement:
         """
         Wait until the element is clickable using XPath.
 
@@ -103,24 +421,24 @@ class BasePage:
         :param timeout: Optional timeout override.
         :return: WebElement if clickable.
         """
-        wait_time = timeout if timeout is not None else self.timeout
-        return WebDriverWait(self.driver, wait_time).until(
-            EC.element_to_be_clickable((By.XPATH, xpath))
-        )
+        return self.wait_until(xpath, "clickable", timeout)
 
     def click(self, xpath: str, retries=2):
         """
         Click on an element safely with scroll and optional retries.
+        Waiting (including the pause between retries) is reported separately from the click itself.
         """
         for attempt in range(retries):
             try:
                 element = self.wait_for_element_clickable(xpath)
-                self.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                element.click()
+                with self.instrument("action", xpath, retry=attempt):
+                    self.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+                    element.click()
                 return
             except ElementClickInterceptedException:
                 if attempt < retries - 1:
-                    time.sleep(1)
+                    with self.instrument("wait", xpath, retry=attempt):
+                        time.sleep(1)
                 else:
                     raise
 
@@ -210,6 +528,26 @@ class BasePage:
         """
         return self.driver.execute_script(script, *args)
 
+    def execute_async_script(self, script: str, *args, timeout: float = None):
+        """
+        Execute an asynchronous JavaScript script in the context of the current page.
+        The script signals completion by calling its last argument with the result.
+
+        :param script: The JavaScript code to execute.
+        :param args: Optional arguments to pass to the script.
+        :param timeout: Optional time (seconds) the script may take; the driver's script timeout is
+                        raised for this call only when it is too short, and restored afterwards.
+        :return: The value passed to the completion callback.
+        """
+        if timeout is None or timeout <= self.SCRIPT_TIMEOUT - 1:
+            return self.driver.execute_async_script(script, *args)
+        previous = self.driver.timeouts.script
+        self.driver.set_script_timeout(timeout + 1)
+        try:
+            return self.driver.execute_async_script(script, *args)
+        finally:
+            self.driver.set_script_timeout(previous)
+
     def context_click(self, xpath: str):
         """
         Perform a context click (right-click) on an element using XPath.
@@ -220,18 +558,110 @@ class BasePage:
         actions = ActionChains(self.driver)
         actions.context_click(element).perform()
 
-    def drag_and_drop(self, source_xpath: str, target_xpath: str):
+    def drag_and_drop(self, source_xpath: str, target_xpath: str, engine: str = "auto", offset=(0, 0)) -> bool:
         """
         Perform a drag and drop operation from one element to another using XPath.
 
+        Engines:
+        - 'html5': one script firing the HTML5 event sequence (mousedown, dragstart, drag, dragenter,
+          dragover, drop or dragleave, dragend, mouseup) with a shared DataTransfer.
+        - 'cdp': a trusted drag through Input.dispatchMouseEvent/Input.dispatchDragEvent (Chrome only).
+        - 'actions': ActionChains.drag_and_drop, for mouse-event based widgets (e.g. jQuery UI).
+        - 'auto': 'html5', falling back to 'cdp' on local Chromium and to 'actions' otherwise (e.g. on the grid).
+
         :param source_xpath: The XPath locator of the source element.
         :param target_xpath: The XPath locator of the target element.
+        :param engine: 'auto', 'html5', 'cdp' or 'actions'.
+        :param offset: (x, y) offset in pixels of the drop point from the centre of the target,
+                       e.g. to drop above or below an item of a sortable list.
+        :return: True if the target accepted the drop (always True for 'actions').
+        :raises ValueError: If the engine is unknown.
         """
-        source = self.wait_for_element_visible(source_xpath)
-        target = self.wait_for_element_visible(target_xpath)
+        engines = {"html5": self._drag_and_drop_html5, "cdp": self._drag_and_drop_cdp, "actions": self._drag_and_drop_actions}
+        if engine != "auto" and engine not in engines:
+            raise ValueError(f"Unknown drag and drop engine '{engine}', expected 'auto' or one of {sorted(engines)}")
+
+        self.wait_for_element_visible(source_xpath)
+        self.wait_for_element_visible(target_xpath)
+        if engine != "auto":
+            return engines[engine](source_xpath, target_xpath, offset)
+
+        try:
+            return self._drag_and_drop_html5(source_xpath, target_xpath, offset)
+        except JavascriptException as e:
+            logger.info(f"HTML5 drag and drop unavailable ({e.msg}), falling back")
+        if DevTools.supports_cdp(self.driver):
+            return self._drag_and_drop_cdp(source_xpath, target_xpath, offset)
+        return self._drag_and_drop_actions(source_xpath, target_xpath, offset)
+
+    def _drag_and_drop_html5(self, source_xpath: str, target_xpath: str, offset) -> bool:
+        with self.instrument("action", source_xpath):
+            result = self.execute_script(DRAG_AND_DROP_SCRIPT, source_xpath, target_xpath, *offset)
+        if not result["ok"]:
+            raise JavascriptException(f"HTML5 drag and drop failed: {result['reason']}")
+        return result["dropped"]
+
+    def _drag_and_drop_cdp(self, source_xpath: str, target_xpath: str, offset) -> bool:
+        # The drag is intercepted instead of handed to the OS: the page still sees a trusted
+        # dragstart, and the drop is dispatched with the data its dragstart handler stored.
+        with self.instrument("action", source_xpath):
+            start = self.get_element_centre(source_xpath)
+            end = self.get_element_centre(target_xpath)
+            end = (end[0] + offset[0], end[1] + offset[1])
+            self.execute_script(CAPTURE_DRAG_DATA_SCRIPT)
+            self.driver.execute_cdp_cmd("Input.setInterceptDrags", {"enabled": True})
+            try:
+                mouse = {"button": "left", "clickCount": 1}
+                self.driver.execute_cdp_cmd("Input.dispatchMouseEvent", dict(mouse, type="mousePressed", x=start[0], y=start[1]))
+                self.driver.execute_cdp_cmd("Input.dispatchMouseEvent", dict(mouse, type="mouseMoved", x=end[0], y=end[1]))
+                items = self.execute_script("return window.__dragData;") or []
+                data = {"items": items, "dragOperationsMask": 1 | 2 | 16}  # copy | link | move
+                for drag_type in ("dragEnter", "dragOver", "drop"):
+                    self.driver.execute_cdp_cmd("Input.dispatchDragEvent", {"type": drag_type, "x": end[0], "y": end[1], "data": data})
+                self.driver.execute_cdp_cmd("Input.dispatchMouseEvent", dict(mouse, type="mouseReleased", x=end[0], y=end[1]))
+            finally:
+                self.driver.execute_cdp_cmd("Input.setInterceptDrags", {"enabled": False})
+        return True
+
+    def _drag_and_drop_actions(self, source_xpath: str, target_xpath: str, offset) -> bool:
+        source = self.find_element(source_xpath)
+        target = self.find_element(target_xpath)
         actions = ActionChains(self.driver)
-        actions.drag_and_drop(source, target).perform()
+        if offset == (0, 0):
+            actions.drag_and_drop(source, target).perform()
+        else:
+            actions.click_and_hold(source).move_to_element_with_offset(target, *offset).release().perform()
+        return True
+
+    def get_element_centre(self, xpath: str) -> tuple:
+        """
+        Get the centre of an element in viewport coordinates (CSS pixels), scrolling it into view first.
 
+        :param xpath: The XPath locator of the element.
+        :return: (x, y)
+        """
+        return tuple(self.execute_script("""
+            const element = document.evaluate(arguments[0], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+            element.scrollIntoView({block: "center", inline: "center"});
+            const rect = element.getBoundingClientRect();
+            return [rect.left + rect.width / 2, rect.top + rect.height / 2];
+        """, xpath))
+
+    def set_input_value(self, xpath: str, value) -> str:
+        """
+        Set the value of an input (e.g. a range slider) in one script, firing 'input' and 'change'
+        like a user edit would.
+
+        :param xpath: The XPath locator of the input.
+        :param value: The value to set.
+        :return: The value the input holds afterwards, as a string.
+        :raises NoSuchElementException: If no element matches the XPath.
+        """
+        with self.instrument("action", xpath):
+            result = self.execute_script(SET_INPUT_VALUE_SCRIPT, xpath, value)
+        if result is None:
+            raise NoSuchElementException(f"Element with XPath '{xpath}' not found.")
+        return result
 
     def move_slider(self, slider, offset):
         """
@@ -286,28 +716,40 @@ class BasePage:
         element = self.find_element(xpath)
         return element.is_selected() if element else False
 
-    def is_element_visible(self, xpath: str) -> bool:
+    def is_element_visible(self, xpath: str, absence_timeout: float = None) -> bool:
         """
         Check if an element is visible on the page.
 
+        The check runs immediately; if the element is not visible it is given absence_timeout
+        seconds to become visible before the check answers False.
+
         :param xpath: The XPath locator of the element.
+        :param absence_timeout: Optional override of BasePage.absence_timeout (seconds).
         :return: True if the element is visible, False otherwise.
         """
-        try:
-            element = self.find_element(xpath)
-            return element.is_displayed()
-        except Exception:
-            return False
+        return self._check_condition(xpath, "visible", absence_timeout)
 
-    def is_element_present(self, xpath: str) -> bool:
+    def is_element_present(self, xpath: str, absence_timeout: float = None) -> bool:
         """
         Check if an element is present in the DOM.
 
+        The check runs immediately; if the element is not present it is given absence_timeout
+        seconds to appear before the check answers False.
+
         :param xpath: The XPath locator of the element.
+        :param absence_timeout: Optional override of BasePage.absence_timeout (seconds).
         :return: True if the element is present, False otherwise.
         """
+        return self._check_condition(xpath, "present", absence_timeout)
+
+    def _check_condition(self, xpath: str, condition: str, absence_timeout: float = None) -> bool:
+        wait_time = self.absence_timeout if absence_timeout is None else absence_timeout
         try:
-            self.find_element(xpath)
+            if self.execute_script(CHECK_CONDITION_SCRIPT, xpath, condition)["ok"]:
+                return True
+            if wait_time <= 0:
+                return False
+            self.wait_until(xpath, condition, wait_time)
             return True
         except Exception:
             return False
@@ -315,29 +757,36 @@ class BasePage:
     def is_element_enabled(self, xpath: str) -> bool:
         """
         Check if an element is enabled. Handles both standard HTML elements and custom components like jQuery UI.
+        The checks (form control disabled state, aria-disabled, "ui-state-disabled" class) run in the page
+        in a single round trip.
 
         :param xpath: The XPath locator of the element.
         :return: True if the element is enabled, False otherwise.
         """
         try:
-            element = self.find_element(xpath)
-
-            # Case 1: Standard HTML element
-            if element.tag_name in ["button", "input", "select", "textarea"]:
-                return element.is_enabled()
+            matches = self.query_elements([xpath], ("enabled",))[xpath]
+            return bool(matches) and matches[0]["enabled"]
+        except Exception:
+            return False
 
-            # Case 2: Check aria-disabled
-            aria_disabled = element.get_attribute("aria-disabled")
-            if aria_disabled is not None:
-                return aria_disabled.lower() != "true"
+    def wait_for_download(self, request, filename: str, timeout: float = 30) -> DownloadResult:
+        """
+        Wait until the specified file has finished downloading, and add it to the test's download manifest.
+        Files that were in the download directory before the test started are ignored, so tests sharing
+        a browser (and its download directory) only see their own downloads.
 
-            # Case 3: Check for "ui-state-disabled" class
-            class_attr = element.get_attribute("class") or ""
-            if "ui-state-disabled" in class_attr:
-                return False
+        :param request: Pytest request object (to access download path and manifest)
+        :param filename: Expected file name (e.g., "some-file.txt")
+        :param timeout: Maximum time to wait in seconds.
+        :return: DownloadResult with the path, size and SHA-256 of the file.
+        :raises TimeoutError: If the download does not complete in time.
+        """
+        download_dir = getattr(request.node, "_download_path", None)
+        if not download_dir:
+            raise ValueError("No download directory configured for this test")
+        watcher = DownloadWatcher(download_dir, manifest=getattr(request.node, "_downloads", None),
+                                  existing=getattr(request.node, "_existing_downloads", ()))
+        return watcher.wait_for(filename, timeout=timeout)
 
-            # Fallback: assume enabled
-            return True
 
-        except Exception:
-            return False
+_scope_public_methods(BasePage)
@@ -1,11 +1,26 @@
 import logging
-
-import requests
+import time
+from typing import NamedTuple, Optional
 
 from PageObject.BasePage import BasePage
+from Utilities import HttpClient
 
 logger = logging.getLogger(__name__)
 
+
+class ImageAudit(NamedTuple):
+    """
+    Audit result of one image.
+    """
+    index: int
+    src: str
+    rendered: bool
+    status: Optional[int]
+    method: Optional[str]
+    elapsed: float
+    error: Optional[str]
+
+
 class BrokenImagePage(BasePage):
 
     #XPath locators for elements on the AB Testing page
@@ -36,3 +51,29 @@ class BrokenImagePage(BasePage):
         """
         return self.find_elements(self.image_xpath)
 
+    def audit_images(self, timeout: float = 5, max_workers: int = 16) -> list:
+        """
+        Audit every image on the page: the rendered state of all images is read in one script,
+        and only the images that did not render are checked over HTTP, concurrently.
+
+        :param timeout: Timeout of each HTTP check in seconds.
+        :param max_workers: Maximum concurrent HTTP checks.
+        :return: List of ImageAudit in page order; elapsed is the HTTP check time (0 for rendered images).
+        """
+        start = time.perf_counter()
+        images = self.query_elements([self.image_xpath], ("src", "complete", "naturalWidth", "visible"))[self.image_xpath]
+        rendered = [bool(img["visible"] and img["complete"] and img["naturalWidth"]) for img in images]
+
+        unrendered = [img["src"] for img, ok in zip(images, rendered) if not ok]
+        checks = iter(HttpClient.check_urls(unrendered, timeout=timeout, max_workers=max_workers))
+
+        audits = []
+        for index, (img, ok) in enumerate(zip(images, rendered), start=1):
+            if ok:
+                audits.append(ImageAudit(index, img["src"], True, None, None, 0.0, None))
+            else:
+                check = next(checks)
+                audits.append(ImageAudit(index, img["src"], False, check.status, check.method, check.elapsed, check.error))
+
+        logger.info(f"Audited {len(audits)} images ({len(unrendered)} checked over HTTP) in {time.perf_counter() - start:.3f}s")
+        return audits
@@ -3,6 +3,46 @@ import hashlib
 import base64
 
 
+CANVAS_SHA256_SCRIPT = """
+const done = arguments[arguments.length - 1];
+const canvas = document.querySelector("canvas");
+if (!(window.crypto && crypto.subtle)) { done(null); return; }  // only in secure contexts
+const pixels = canvas.getContext("2d").getImageData(0, 0, canvas.width, canvas.height).data;
+crypto.subtle.digest("SHA-256", pixels).then(
+    digest => done(Array.from(new Uint8Array(digest), b => b.toString(16).padStart(2, "0")).join("")),
+    () => done(null)
+);
+"""
+
+# Difference hash: shrink to 9x8 grey pixels (transparent pixels count as white) and set one bit
+# per pixel that is brighter than its right neighbour.
+CANVAS_DHASH_SCRIPT = """
+const canvas = document.querySelector("canvas");
+const small = document.createElement("canvas");
+small.width = 9;
+small.height = 8;
+const context = small.getContext("2d");
+context.drawImage(canvas, 0, 0, 9, 8);
+const data = context.getImageData(0, 0, 9, 8).data;
+const grey = i => {
+    const alpha = data[i + 3] / 255;
+    return (0.299 * data[i] + 0.587 * data[i + 1] + 0.114 * data[i + 2]) * alpha + 255 * (1 - alpha);
+};
+let hash = "";
+for (let y = 0; y < 8; y++) {
+    for (let x = 0; x < 8; x += 4) {
+        let nibble = 0;
+        for (let bit = 0; bit < 4; bit++) {
+            const i = (y * 9 + x + bit) * 4;
+            nibble = (nibble << 1) | (grey(i) > grey(i + 4) ? 1 : 0);
+        }
+        hash += nibble.toString(16);
+    }
+}
+return hash;
+"""
+
+
 class ChallengingDomPage(BasePage):
     """
     Page Object for the Challenging DOM page.
@@ -41,14 +81,42 @@ class ChallengingDomPage(BasePage):
         """
         self.click(self.button3)
 
-    def get_canvas_image(self):
+    def get_canvas_image(self, mode: str = "sha256"):
+        """
+        Get a fingerprint of the canvas. Useful for verifying if the canvas content has changed.
+
+        Modes:
+        'sha256' - SHA-256 of the raw pixel buffer, computed in the page with crypto.subtle so only
+                   the digest crosses the wire (falls back to 'png' outside secure contexts).
+        'dhash'  - 64-bit perceptual difference hash for cheap similarity checks (see hamming_distance).
+        'png'    - SHA-256 of the PNG export, transferred as base64.
+
+        :param mode: 'sha256', 'dhash' or 'png'.
+        :return: Hex digest of the canvas.
+        :raises ValueError: If the mode is unknown.
         """
-        Retrieves the canvas image as a base64-encoded PNG from the web page using JavaScript,
-        decodes it, and returns its SHA-256 hash. Useful for verifying if the canvas content has changed.
-        :return: SHA-256 hash of the canvas image.
+        if mode == "sha256":
+            digest = self.execute_async_script(CANVAS_SHA256_SCRIPT)
+            if digest:
+                return digest
+            mode = "png"
+        if mode == "dhash":
+            return self.execute_script(CANVAS_DHASH_SCRIPT)
+        if mode == "png":
+            get_canvas_base64 = """const canvas = document.querySelector("canvas");
+            return canvas.toDataURL("image/png").split(",")[1];  // base64 string
+            """
+            img_b64 = self.execute_script(get_canvas_base64)
+            return hashlib.sha256(base64.b64decode(img_b64)).hexdigest()
+        raise ValueError(f"Invalid canvas hash mode: '{mode}'")
+
+    @staticmethod
+    def hamming_distance(hash1: str, hash2: str) -> int:
         """
-        get_canvas_base64 = """const canvas = document.querySelector("canvas");
-        return canvas.toDataURL("image/png").split(",")[1];  // base64 string
+        Count the differing bits of two perceptual hashes (0 = same picture, up to 64).
+
+        :param hash1: Hex hash from get_canvas_image(mode="dhash").
+        :param hash2: Hex hash from get_canvas_image(mode="dhash").
+        :return: Number of differing bits.
         """
-        img_b64 = self.execute_script(get_canvas_base64)
-        return hashlib.sha256(base64.b64decode(img_b64)).hexdigest()
+        return bin(int(hash1, 16) ^ int(hash2, 16)).count("1")
@@ -27,6 +27,14 @@ class CheckboxesPage(BasePage):
         element = self.wait_for_element_visible(xpath)
         return element.is_selected()
 
+    def get_checkbox_states(self) -> list:
+        """
+        Get the state of every checkbox on the page in a single round trip.
+        :return: List of booleans in page order, True for selected checkboxes.
+        """
+        snapshot = self.query_elements([self.checkboxes_xpath], ("selected",))
+        return [checkbox["selected"] for checkbox in snapshot[self.checkboxes_xpath]]
+
     def toggle_checkbox(self, index: int):
         """
         Toggle the state of a checkbox by its index.
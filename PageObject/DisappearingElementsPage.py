@@ -19,7 +19,7 @@ class DisappearingElementsPage(BasePage):
 
     def elements_text(self):
         """
-        Get the text of all disappearing elements on the page.
+        Get the text of all disappearing elements on the page in a single round trip.
         :return: List of texts of the elements.
         """
-        return [element.text for element in self.find_elements(self.elements)]
+        return [element["text"] for element in self.query_elements([self.elements])[self.elements]]
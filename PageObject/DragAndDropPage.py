@@ -20,11 +20,14 @@ class DragAndDropPage(BasePage):
         """
         return self.get_text(self.heading)
 
-    def drag_and_drop_box(self):
+    def drag_and_drop_box(self, engine: str = "auto") -> bool:
         """
         Perform drag and drop operation from source box to target box.
+
+        :param engine: Drag and drop engine, see BasePage.drag_and_drop.
+        :return: True if the target box accepted the drop.
         """
-        self.drag_and_drop(self.source_box, self.target_box)
+        return self.drag_and_drop(self.source_box, self.target_box, engine=engine)
 
     def get_box_text(self):
         """
@@ -1,9 +1,5 @@
-import hashlib
-
-import requests
-from selenium.webdriver.common.by import By
-
 from PageObject.BasePage import BasePage
+from Utilities import HttpClient
 
 
 class DynamicContentPage(BasePage):
@@ -14,6 +10,9 @@ class DynamicContentPage(BasePage):
     #XPaths for elements on the Dynamic Content page
     heading = "//h3"
     content_row= "//div[@class='example']//div[@id='content']//div[@class='row']"
+    # Read relative to each content row
+    row_image = ".//img/@src"
+    row_text = "./div[contains(concat(' ', @class, ' '), ' large-10 ')]"
 
     def __init__(self, driver):
         super().__init__(driver)
@@ -29,29 +28,20 @@ class DynamicContentPage(BasePage):
     def get_dynamic_content(self):
         """
         Get the dynamic content displayed on the page.
+        The image and text of every row are read together in one script, so they stay paired even
+        when a row lacks one of them; then the images are hashed concurrently (and revalidated
+        rather than downloaded again when already cached).
         :return: The text of the dynamic content.
         """
-        content = {}
-
-        rows = self.find_elements(self.content_row)  # e.g., content_row = (By.CLASS_NAME, "row")
+        rows = self.query_elements([self.content_row], (self.row_image, self.row_text))[self.content_row]
+        img_urls = [self.url_for(row[self.row_image]) if row[self.row_image] else None for row in rows]
+        img_hashes = HttpClient.content_hashes.get_many([url for url in img_urls if url])
 
-        for index, row in enumerate(rows):
-            # Get the image src and calculate hash
-            img_element = row.find_element(By.TAG_NAME, "img")
-            img_url = img_element.get_attribute("src")
-
-            # Download the image content and hash it
-            img_response = requests.get(img_url)
-            img_hash = hashlib.md5(img_response.content).hexdigest()
-
-            # Get the text content from the row (usually inside a div with class "large-10 columns")
-            text_element = row.find_element(By.CLASS_NAME, "large-10")
-            text = text_element.text.strip()
-
-            # Store in dict
+        content = {}
+        for index, (img_url, row) in enumerate(zip(img_urls, rows)):
             content[f"row_{index + 1}"] = {
-                "image": img_hash,
-                "text": text
+                "image": img_hashes.get(img_url),
+                "text": row[self.row_text]
             }
 
-        return content
\ No newline at end of file
+        return content
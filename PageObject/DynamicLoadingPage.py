@@ -63,10 +63,11 @@ class DynamicLoadingExample1Page(BasePage):
 
     def click_start_button(self):
         """
-        Click the start button to initiate loading.
+        Click the start button to initiate loading, and wait until the loaded message shows.
         """
         self.click(self.start_button)
         self.wait_for_element_to_disappear(self.loading_message)
+        self.wait_for_element_visible(self.message)
 
 class DynamicLoadingExample2Page(BasePage):
     """
@@ -92,7 +93,8 @@ class DynamicLoadingExample2Page(BasePage):
 
     def click_start_button(self):
         """
-        Click the start button to initiate loading.
+        Click the start button to initiate loading, and wait until the loaded message shows.
         """
         self.click(self.start_button)
-        self.wait_for_element_to_disappear(self.loading_message)
\ No newline at end of file
+        self.wait_for_element_to_disappear(self.loading_message)
+        self.wait_for_element_visible(self.message)
\ No newline at end of file
@@ -1,6 +1,29 @@
-import pyautogui
 from PageObject.BasePage import BasePage
 
+
+# The popup (ouibounce) opens on a mouseleave of <html> near the top edge, and ignores it during
+# the first second after load. The mouse leaving the top of the viewport is dispatched in the page
+# every 100 ms until the popup shows, so no real cursor is needed (works headless and in parallel).
+EXIT_INTENT_SCRIPT = """
+const [popupXpath, timeoutMs, done] = arguments;
+const start = performance.now();
+const root = document.documentElement;
+const popupVisible = () => {
+    const popup = document.evaluate(popupXpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    return !!popup && popup.getClientRects().length > 0;
+};
+const leave = () => {
+    const x = Math.floor(window.innerWidth / 2);
+    root.dispatchEvent(new MouseEvent("mousemove", {bubbles: true, clientX: x, clientY: Math.floor(window.innerHeight / 2)}));
+    root.dispatchEvent(new MouseEvent("mouseout", {bubbles: true, clientX: x, clientY: 0, relatedTarget: null}));
+    root.dispatchEvent(new MouseEvent("mouseleave", {bubbles: false, clientX: x, clientY: 0, relatedTarget: null}));
+    if (popupVisible()) { done(true); return; }
+    if (performance.now() - start > timeoutMs) { done(false); return; }
+    setTimeout(leave, 100);
+};
+leave();
+"""
+
 class ExitIntentPage(BasePage):
     """
     ExitIntentPage encapsulates operations for the Exit Intent page.
@@ -24,22 +47,28 @@ class ExitIntentPage(BasePage):
         """
         return self.get_text(self.heading)
 
-    def move_mouse_to_exit_intent(self):
+    def move_mouse_to_exit_intent(self, method: str = "event", timeout: float = None) -> bool:
         """
-        Move the mouse to the exit intent area to trigger the popup.
+        Move the mouse out of the top of the page to trigger the exit intent popup.
 
-        This method simulates moving the mouse to the top of the page,
-        which is typically where exit intent popups are triggered.
+        :param method: 'event' dispatches the mouse events in the page (headless and parallel safe);
+                       'os' moves the real cursor with pyautogui (needs a headed browser and a display).
+        :param timeout: Optional timeout override (seconds) for the popup to show ('event' only).
+        :return: True if the popup showed ('event'), or True once the cursor moved ('os').
         """
-        # Get screen dimensions
-        screen_width, screen_height = pyautogui.size()
-        # Optional: disable failsafe if you're running automated tests only
-        pyautogui.FAILSAFE = False
-        # Step 1: Move to center of screen
-        pyautogui.moveTo(screen_width // 2, screen_height // 2, duration=0.5)
-        self.wait_for_element_visible(self.heading)
-        # Step 2: Move to top of screen to trigger exit intent
-        pyautogui.moveTo(screen_width // 2, 5, duration=0.5)
+        if method == "os":
+            # Imported lazily: pyautogui needs a display and is only used to check real cursor behaviour.
+            import pyautogui
+            screen_width, screen_height = pyautogui.size()
+            pyautogui.FAILSAFE = False
+            pyautogui.moveTo(screen_width // 2, screen_height // 2, duration=0.5)
+            self.wait_for_element_visible(self.heading)
+            pyautogui.moveTo(screen_width // 2, 5, duration=0.5)
+            return True
+
+        wait_time = timeout if timeout is not None else self.timeout
+        return self.execute_async_script(EXIT_INTENT_SCRIPT, self.exit_intent_popup, int(wait_time * 1000),
+                                         timeout=wait_time)
 
     def is_exit_intent_popup_visible(self):
         """
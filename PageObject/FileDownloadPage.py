@@ -1,5 +1,4 @@
 from PageObject.BasePage import BasePage
-import os
 
 class FileDownloadPage(BasePage):
 
@@ -27,18 +26,3 @@ class FileDownloadPage(BasePage):
         """
         file_xpath = self.file_link_template.format(filename=filename)
         self.click(file_xpath)
-
-    def get_download_path(self, request, filename: str):
-        """
-        Get the full path of the specified downloaded file.
-
-        :param request: Pytest request object (to access download path)
-        :param filename: Expected file name (e.g., "some-file.txt")
-        :return: Full path to the file if found, else None
-        """
-        download_dir = getattr(request.node, "_download_path", None)
-        if not download_dir:
-            return None
-
-        full_path = os.path.join(download_dir, filename)
-        return full_path if os.path.exists(full_path) else None
@@ -19,18 +19,29 @@ class FloatingMenuPage(BasePage):
 
     def is_menu_visible(self) -> bool:
         """
-        Check if the floating menu is currently visible.
+        Check if the floating menu is currently visible, giving it time to float back into view after scrolling.
         :return: True if the menu is visible, False otherwise.
         """
-        return self.is_element_visible(self.menu_xpath)
+        return self.is_element_visible(self.menu_xpath, absence_timeout=self.timeout)
 
     def get_menu_items(self):
         """
-        Get the list of menu items in the floating menu.
+        Get the list of menu items in the floating menu in a single round trip.
         :return: List of menu item texts.
         """
-        menu_items = self.find_elements(f"{self.menu_xpath}//a")
-        return [item.text.strip() for item in menu_items if item.text.strip()]
+        items_xpath = f"{self.menu_xpath}//a"
+        menu_items = self.query_elements([items_xpath])[items_xpath]
+        return [item["text"] for item in menu_items if item["text"]]
+
+    def get_menu_state(self):
+        """
+        Get the menu visibility and its item texts together in a single round trip.
+        :return: Tuple of (menu visible, list of menu item texts).
+        """
+        items_xpath = f"{self.menu_xpath}//a"
+        snapshot = self.query_elements({"menu": self.menu_xpath, "items": items_xpath}, ("visible", "text"))
+        menu_visible = bool(snapshot["menu"]) and snapshot["menu"][0]["visible"]
+        return menu_visible, [item["text"] for item in snapshot["items"] if item["text"]]
 
     def scroll_to_middle_of_page(self):
         """
@@ -1,4 +1,5 @@
 from PageObject.BasePage import BasePage
+from Utilities import SessionCache
 
 
 class FormAuthenticationPage(BasePage):
@@ -11,9 +12,13 @@ class FormAuthenticationPage(BasePage):
     heading = "//h2"
     logout_button = "//a[@href='/logout']"
 
+    login_path = "/login"
+    secure_path = "/secure"
+
     def __init__(self, driver):
         super().__init__(driver)
         self.driver = driver
+        self._logged_in_users = set()
 
     def get_page_heading(self) -> str:
         """
@@ -51,6 +56,49 @@ class FormAuthenticationPage(BasePage):
 
     def click_logout(self):
         """
-        Click the logout button to log out of the application.
+        Click the logout button to log out of the application. Cached sessions of the user are
+        dropped, since logging out ends the session on the server.
+        """
+        self.click(self.logout_button)
+        for key in self._logged_in_users:
+            SessionCache.sessions.invalidate(self.url_for(self.secure_path), key)
+        self._logged_in_users.clear()
+
+    def login(self, username: str, password: str):
+        """
+        Log in through the login form.
+        :param username: Username to enter.
+        :param password: Password to enter.
+        """
+        self.open(self.url_for(self.login_path))
+        self.enter_username(username)
+        self.enter_password(password)
+        self.click_login()
+
+    def is_logged_in(self) -> bool:
+        """
+        Check if the browser is on the secure area, logged in. The logout button is given time to
+        appear first, as the secure area may still be loading after submitting the login form.
+        :return: True if the secure area is open.
+        """
+        return (self.is_element_present(self.logout_button, absence_timeout=self.timeout)
+                and self.get_url().split("?")[0].endswith(self.secure_path))
+
+    def open_secure_area(self, username: str, password: str) -> bool:
+        """
+        Open the secure area logged in as a user. The first call of a worker logs in through the form;
+        later calls restore the cached session cookies and open the secure area in one navigation.
+        :param username: Username to log in with.
+        :param password: Password to log in with.
+        :return: True if the secure area is open.
         """
-        self.click(self.logout_button)
\ No newline at end of file
+        logged_in = SessionCache.sessions.open(
+            self.driver,
+            self.url_for(self.secure_path),
+            key=username,
+            login=lambda: self.login(username, password),
+            is_logged_in=self.is_logged_in,
+        )
+        if logged_in:
+            self._logged_in_users.add(username)
+        return logged_in
\ No newline at end of file
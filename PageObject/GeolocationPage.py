@@ -1,7 +1,26 @@
-import time
-
 from PageObject.BasePage import BasePage
-import requests
+from Utilities import DevTools
+
+
+# Resolves the browser's position in a single round trip: the callback gets the coordinates, or
+# null when the position is denied or unavailable within the timeout.
+GET_POSITION_SCRIPT = """
+const [timeoutMs, done] = arguments;
+navigator.geolocation.getCurrentPosition(
+    pos => done({latitude: pos.coords.latitude, longitude: pos.coords.longitude, accuracy: pos.coords.accuracy}),
+    () => done(null),
+    {timeout: timeoutMs, maximumAge: 0}
+);
+"""
+
+# Stand-in for browsers without CDP (e.g. some grid nodes); only lasts until the next navigation.
+FAKE_POSITION_SCRIPT = """
+const [latitude, longitude, accuracy] = arguments;
+const position = {coords: {latitude: latitude, longitude: longitude, accuracy: accuracy}, timestamp: Date.now()};
+navigator.geolocation.getCurrentPosition = success => success(position);
+navigator.geolocation.watchPosition = success => { success(position); return 0; };
+"""
+
 
 class GeolocationPage(BasePage):
     """
@@ -32,33 +51,17 @@ class GeolocationPage(BasePage):
 
     def get_browser_based_location(self, timeout: int = 10):
         """
-        Use browser's navigator.geolocation to get current location.
+        Use browser's navigator.geolocation to get current location, in a single async script.
         Requires user to allow location access or a mocked location to be set.
 
         :param timeout: Time in seconds to wait for geolocation result.
-        :return: Dict with latitude and longitude.
-        """
-
-        # JS to asynchronously get geolocation and store it in window._geo
-        js_script = """
-        window._geo = null;
-        navigator.geolocation.getCurrentPosition(function(pos) {
-            window._geo = {
-                latitude: pos.coords.latitude,
-                longitude: pos.coords.longitude
-            };
-        });
+        :return: Dict with latitude, longitude and accuracy.
+        :raises TimeoutError: If the browser does not resolve a position within the timeout.
         """
-        self.driver.execute_script(js_script)
-
-        # Wait and retrieve the result
-        for _ in range(timeout * 5):  # check every 0.1 sec
-            geo = self.driver.execute_script("return window._geo;")
-            if geo:
-                return geo
-            time.sleep(0.1)
-
-        raise TimeoutError("Failed to retrieve browser geolocation within timeout.")
+        geo = self.execute_async_script(GET_POSITION_SCRIPT, int(timeout * 1000), timeout=timeout)
+        if not geo:
+            raise TimeoutError("Failed to retrieve browser geolocation within timeout.")
+        return geo
 
     def fetch_location_from_website(self):
         """
@@ -72,12 +75,30 @@ class GeolocationPage(BasePage):
             'longitude': float(longitude)
         }
 
+    def set_geolocation(self, latitude: float, longitude: float, accuracy: float = 100):
+        """
+        Emulate the position of the browser with Emulation.setGeolocationOverride. The override
+        survives navigations and is cleared when the browser goes back to the pool.
+        Browsers without CDP get navigator.geolocation replaced on the current page instead.
+
+        :param latitude: Latitude to set.
+        :param longitude: Longitude to set.
+        :param accuracy: Accuracy in meters.
+        """
+        if DevTools.supports_cdp(self.driver):
+            self.driver.execute_cdp_cmd("Emulation.setGeolocationOverride", {
+                "latitude": latitude,
+                "longitude": longitude,
+                "accuracy": accuracy,
+            })
+            self.driver.geolocation_override = (latitude, longitude, accuracy)
+        else:
+            self.execute_script(FAKE_POSITION_SCRIPT, latitude, longitude, accuracy)
+
     def send_fake_geolocation(self, latitude, longitude):
         """
         Send fake geolocation data to the browser.
         :param latitude: Latitude to set.
         :param longitude: Longitude to set.
         """
-        self.driver.execute_script(f"window.navigator.geolocation.getCurrentPosition = function(success) {{"
-                                   f"success({{ coords: {{ latitude: {latitude}, longitude: {longitude} }} }});"
-                                   f"}}")
+        self.set_geolocation(latitude, longitude)
@@ -3,7 +3,7 @@ from PageObject.BasePage import BasePage
 
 class HorizontalSliderPage(BasePage):
     """
-    Page Object for the Geolocation page.
+    Page Object for the Horizontal Slider page.
     """
     page_heading = "//h3"
     slider = "//input[@type='range']"
@@ -28,10 +28,20 @@ class HorizontalSliderPage(BasePage):
         slider_value = self.get_text(self.slider_value)
         return float(slider_value)
 
-    def set_slider_value(self, target_value):
+    def set_slider_value(self, target_value, realistic: bool = False):
         """
-        Set the horizontal slider to a specific value using pixel offset.
+        Set the horizontal slider to a specific value.
+
+        By default the value is set on the range input directly, with the 'input' and 'change'
+        events a user edit fires, in one round trip. realistic=True drags the thumb with the mouse instead.
+
+        :param target_value: Value to set (0.0 to 5.0, by 0.5).
+        :param realistic: Drag the slider with ActionChains.
+        :return: The slider value afterwards (fast path), or None (realistic mode).
         """
+        if not realistic:
+            return float(self.set_input_value(self.slider, target_value))
+
         min_value = 0.0
         max_value = 5.0
         step = 0.5
@@ -44,11 +54,9 @@ class HorizontalSliderPage(BasePage):
         # Pixel per step
         pixels_per_step = int(slider_width / total_steps)  # e.g. 129/10 = 12.9px
 
-        # Slider starts at 2.5 by default (center), so calculate steps from there
+        # The drag starts at the centre of the slider, i.e. at 2.5, so calculate steps from there
         current_value = 2.5
         steps_to_move = int((target_value - current_value) / step)
         pixel_offset = int(steps_to_move * pixels_per_step)
 
         self.move_slider(slider, pixel_offset)
-
-
@@ -1,5 +1,3 @@
-import os
-
 from PageObject.BasePage import BasePage
 
 
@@ -61,19 +59,4 @@ class JqueryUIMenuPage(BasePage):
             raise ValueError(f"Invalid menu option name: '{option_name}'")
 
         xpath = self.menu_locators[key]
-        self.click(xpath)
-
-    def get_download_path(self, request, filename: str):
-        """
-        Get the full path of the specified downloaded file.
-
-        :param request: Pytest request object (to access download path)
-        :param filename: Expected file name (e.g., "some-file.txt")
-        :return: Full path to the file if found, else None
-        """
-        download_dir = getattr(request.node, "_download_path", None)
-        if not download_dir:
-            return None
-
-        full_path = os.path.join(download_dir, filename)
-        return full_path if os.path.exists(full_path) else None
\ No newline at end of file
+        self.click(xpath)
\ No newline at end of file
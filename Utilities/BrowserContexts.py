@@ -0,0 +1,315 @@
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from selenium import webdriver
+from selenium.common import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from Utilities import HttpAuth
+from Utilities.BrowserProfile import BrowserProfile
+from Utilities.LocalSite import LocalSite
+
+logger = logging.getLogger(__name__)
+
+# Driver attributes describing per-tab state (set by BrowserProfile, GeolocationPage, HttpAuth);
+# that state goes away with the context's tab, so the attributes are cleared with it.
+TAB_STATE_ATTRIBUTES = ("blocked_resources", "geolocation_override", "http_auth")
+
+
+class ContextHost:
+    """
+    ContextHost is the one Chrome whose browser contexts are shared by every worker. Workers
+    attach their own WebDriver session to it through its DevTools address (see attach()).
+    """
+
+    def __init__(self, driver: WebDriver):
+        """
+        Initialize the ContextHost.
+
+        :param driver: WebDriver session that launched the host Chrome.
+        """
+        self.driver = driver
+        self.debugger_address = driver.capabilities["goog:chromeOptions"]["debuggerAddress"]
+        self.home_handle = driver.current_window_handle
+
+    def describe(self) -> dict:
+        """
+        What a worker needs to attach to the host.
+
+        :return: Dict with the DevTools address and the handle of the host's own tab.
+        """
+        return {"debugger_address": self.debugger_address, "home_handle": self.home_handle}
+
+    def quit(self):
+        """
+        Close the host Chrome.
+        """
+        try:
+            self.driver.quit()
+        except WebDriverException:
+            pass
+
+
+def attach(debugger_address: str) -> WebDriver:
+    """
+    Start a WebDriver session on an already running Chrome. Quitting the session leaves Chrome running.
+
+    :param debugger_address: host:port of the Chrome DevTools endpoint.
+    :return: WebDriver
+    """
+    options = webdriver.ChromeOptions()
+    options.debugger_address = debugger_address
+    return webdriver.Chrome(options=options)
+
+
+class ContextPool:
+    """
+    ContextPool hands out an isolated browser context per test instead of a browser: the worker's
+    WebDriver session is switched to a new tab in a fresh context (own cookies, storage, cache
+    and downloads directory), and the context is disposed after the test. It has the interface
+    of BrowserPool, so fixtures and page objects do not change.
+    """
+
+    def __init__(self, factory: Callable[[], WebDriver], home_handle: str):
+        """
+        Initialize the ContextPool.
+
+        :param factory: Callable that returns a WebDriver session attached to the context host.
+        :param home_handle: Window handle of the host's own tab, current while no context is.
+        """
+        self.factory = factory
+        self.home_handle = home_handle
+        self.driver = None
+        self._contexts = {}
+        self._lock = threading.Lock()
+        self.stats = {
+            "contexts": 0,
+            "create_seconds": 0.0,
+            "disposed": 0,
+            "dispose_seconds": 0.0,
+            "failed_disposals": 0,
+        }
+
+    def warm_up(self):
+        """
+        Attach the worker's WebDriver session to the host.
+        """
+        if self.driver is None:
+            self.driver = self.factory()
+
+    def acquire(self, download_dir: Optional[str] = None) -> WebDriver:
+        """
+        Create a fresh browser context and switch the session to its tab.
+
+        :param download_dir: Optional directory the context should save downloads into.
+        :return: WebDriver ready for a test.
+        """
+        self.warm_up()
+        driver = self.driver
+        start = time.perf_counter()
+        context_id = driver.execute_cdp_cmd("Target.createBrowserContext", {})["browserContextId"]
+        target_id = driver.execute_cdp_cmd("Target.createTarget", {
+            "url": "about:blank",
+            "browserContextId": context_id,
+        })["targetId"]
+        driver.switch_to.window(target_id)
+        if download_dir:
+            driver.execute_cdp_cmd("Browser.setDownloadBehavior", {
+                "behavior": "allow",
+                "downloadPath": download_dir,
+                "browserContextId": context_id,
+            })
+        with self._lock:
+            self._contexts[target_id] = context_id
+            self.stats["contexts"] += 1
+            self.stats["create_seconds"] += time.perf_counter() - start
+        return driver
+
+    def release(self, driver: WebDriver):
+        """
+        Dispose the context of the current test, with every tab, cookie and storage it holds.
+
+        :param driver: WebDriver previously returned by acquire().
+        """
+        with self._lock:
+            contexts, self._contexts = self._contexts, {}
+        start = time.perf_counter()
+        HttpAuth.clear(driver)
+        try:
+            driver.switch_to.window(self.home_handle)
+            for context_id in contexts.values():
+                driver.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": context_id})
+        except WebDriverException as e:
+            logger.warning(f"Could not dispose browser context: {e.msg}")
+            self.stats["failed_disposals"] += 1
+        for attribute in TAB_STATE_ATTRIBUTES:
+            if getattr(driver, attribute, None):
+                setattr(driver, attribute, None)
+        self.stats["disposed"] += len(contexts)
+        self.stats["dispose_seconds"] += time.perf_counter() - start
+
+    def shutdown(self):
+        """
+        Dispose every remaining context and detach the session; the host keeps running.
+        """
+        if self.driver is None:
+            return
+        self.release(self.driver)
+        try:
+            self.driver.quit()
+        except WebDriverException:
+            pass
+        self.driver = None
+        logger.info(f"Context pool stats: {self.summary()}")
+
+    def summary(self) -> dict:
+        """
+        Derived pool metrics: average context create/dispose latency.
+
+        :return: Dict of pool statistics.
+        """
+        stats = dict(self.stats)
+        stats["avg_create_ms"] = round(1000 * stats["create_seconds"] / stats["contexts"], 1) if stats["contexts"] else 0.0
+        stats["avg_dispose_ms"] = round(1000 * stats["dispose_seconds"] / stats["disposed"], 1) if stats["disposed"] else 0.0
+        return stats
+
+
+def process_tree_rss(pid: int) -> Optional[int]:
+    """
+    Resident memory of a process and all its descendants, in bytes (psutil, or /proc on Linux).
+
+    :param pid: Root process id (e.g. the chromedriver of a session).
+    :return: Bytes, or None if it cannot be measured on this platform.
+    """
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+    if psutil is not None:
+        root = psutil.Process(pid)
+        processes = [root] + root.children(recursive=True)
+        return sum(p.memory_info().rss for p in processes if p.is_running())
+    if not sys.platform.startswith("linux"):
+        return None
+
+    children = {}
+    status = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/status") as f:
+                fields = dict(line.split(":", 1) for line in f if ":" in line)
+        except OSError:
+            continue
+        status[int(entry)] = fields
+        children.setdefault(int(fields["PPid"].strip()), []).append(int(entry))
+
+    total, stack = 0, [pid]
+    while stack:
+        current = stack.pop()
+        rss = status.get(current, {}).get("VmRSS")
+        if rss:
+            total += int(rss.split()[0]) * 1024
+        stack.extend(children.get(current, []))
+    return total
+
+
+def benchmark(sessions: int, base_url: str, paths, profile: BrowserProfile, rounds: int = 3) -> dict:
+    """
+    Compare N browsers with N contexts in one browser: every session loads the paths `rounds`
+    times in its own thread, and the resident memory of all Chrome processes is measured at the end.
+
+    :param sessions: Number of concurrent browsers, or contexts.
+    :param base_url: Root URL of the site under test.
+    :param paths: Paths loaded by every session.
+    :param profile: Browser profile of the launched browsers.
+    :param rounds: How many times every session loads the paths.
+    :return: Dict of mode to startup seconds, pages per second and RSS in MB.
+    """
+    download_path = tempfile.mkdtemp(prefix="context-benchmark-")
+    urls = [base_url.rstrip("/") + path for path in paths] * rounds
+
+    def load_all(driver):
+        for url in urls:
+            driver.get(url)
+
+    def launch():
+        return webdriver.Chrome(options=profile.chrome_options(download_path))
+
+    results = {}
+    for mode in ("browsers", "contexts"):
+        start = time.perf_counter()
+        host = None
+        if mode == "browsers":
+            with ThreadPoolExecutor(max_workers=sessions) as executor:
+                drivers = list(executor.map(lambda _: launch(), range(sessions)))
+            pools = []
+        else:
+            host = ContextHost(launch())
+            pools = [ContextPool(lambda: attach(host.debugger_address), host.home_handle) for _ in range(sessions)]
+            with ThreadPoolExecutor(max_workers=sessions) as executor:
+                drivers = list(executor.map(lambda pool: pool.acquire(download_path), pools))
+        startup = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=sessions) as executor:
+            list(executor.map(load_all, drivers))
+        elapsed = time.perf_counter() - start
+
+        roots = [driver.service.process.pid for driver in drivers]
+        if host:
+            roots.append(host.driver.service.process.pid)
+        rss = [process_tree_rss(pid) for pid in set(roots)]
+
+        for pool in pools:
+            pool.shutdown()
+        for driver in drivers if mode == "browsers" else []:
+            driver.quit()
+        if host:
+            host.quit()
+
+        results[mode] = {
+            "sessions": sessions,
+            "startup_seconds": round(startup, 3),
+            "pages_per_second": round(len(urls) * sessions / elapsed, 2),
+            "rss_mb": round(sum(rss) / 2 ** 20, 1) if None not in rss else None,
+        }
+        logger.info(f"{mode}: {results[mode]}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare N browsers with N browser contexts in one browser.")
+    parser.add_argument("--sessions", type=int, default=4, help="Concurrent browsers, or contexts")
+    parser.add_argument("--rounds", type=int, default=3, help="Times every session loads the paths")
+    parser.add_argument("--browser_profile", default="throughput", help="Profile of the launched browsers")
+    parser.add_argument("--base_url", help="Site under test (default: the bundled local site)")
+    parser.add_argument("--paths", nargs="+", default=["/", "/checkboxes", "/dynamic_content", "/hovers", "/tables"],
+                        help="Paths loaded by every session")
+    parser.add_argument("--output", default=os.path.join("reports", "context_benchmark.json"))
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+
+    site = None if args.base_url else LocalSite()
+    base_url = args.base_url or site.start()
+    try:
+        results = benchmark(args.sessions, base_url, args.paths, BrowserProfile(args.browser_profile), rounds=args.rounds)
+    finally:
+        if site:
+            site.stop()
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump({"base_url": base_url, "paths": args.paths, "rounds": args.rounds, "modes": results}, f, indent=2)
+    for mode, numbers in results.items():
+        print(f"{mode:<9} {numbers['sessions']} sessions  startup {numbers['startup_seconds']:>6.3f}s  "
+              f"{numbers['pages_per_second']:>7.2f} pages/s  RSS {numbers['rss_mb']} MB")
@@ -0,0 +1,237 @@
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
+from selenium.common import NoAlertPresentException, WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from Utilities import DevTools, HttpAuth
+from Utilities.BrowserProfile import BrowserProfile
+
+logger = logging.getLogger(__name__)
+
+
+class PooledBrowser:
+    """
+    Bookkeeping for a single browser owned by the BrowserPool.
+    """
+
+    def __init__(self, driver: WebDriver):
+        self.driver = driver
+        self.uses = 0
+
+
+class BrowserPool:
+    """
+    BrowserPool keeps a number of pre-launched WebDriver sessions warm for the current worker,
+    hands one out per test and resets it between tests instead of paying a full browser launch.
+    """
+
+    def __init__(self, factory: Callable[[], WebDriver], size: int = 1, max_uses: int = 25):
+        """
+        Initialize the BrowserPool.
+
+        :param factory: Callable that launches and returns a new WebDriver.
+        :param size: Number of browsers to keep warm.
+        :param max_uses: Recycle a browser after it served this many tests (0 disables recycling).
+        """
+        self.factory = factory
+        self.size = max(1, size)
+        self.max_uses = max_uses
+        self._idle = deque()
+        self._in_use = {}
+        self._pending = deque()
+        self._lock = threading.Lock()
+        self._launcher = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="browser-pool")
+        self.stats = {
+            "hits": 0,
+            "waited": 0,
+            "wait_seconds": 0.0,
+            "misses": 0,
+            "launches": 0,
+            "launch_seconds": 0.0,
+            "resets": 0,
+            "reset_seconds": 0.0,
+            "recycled": 0,
+            "crashed": 0,
+        }
+
+    def warm_up(self):
+        """
+        Launch the configured number of browsers in the background.
+        """
+        for _ in range(self.size - len(self._idle) - len(self._pending)):
+            self._launch_in_background()
+
+    def acquire(self, download_dir: Optional[str] = None) -> WebDriver:
+        """
+        Hand out a warm browser, launching a new one only if the pool is empty. A browser that is
+        still launching in the background is waited for, and counted as 'waited' rather than a hit.
+
+        :param download_dir: Optional directory the browser should save downloads into for this test.
+        :return: WebDriver ready for a test.
+        """
+        with self._lock:
+            pooled = self._idle.popleft() if self._idle else None
+            future = self._pending.popleft() if pooled is None and self._pending else None
+
+        waited = False
+        if pooled is None and future is not None:
+            waited = not future.done()
+            start = time.perf_counter()
+            try:
+                pooled = future.result()
+            except Exception as e:
+                logger.warning(f"Background browser launch failed, launching inline: {e}")
+            if pooled is not None and waited:
+                self.stats["waited"] += 1
+                self.stats["wait_seconds"] += time.perf_counter() - start
+
+        if pooled is None:
+            self.stats["misses"] += 1
+            pooled = self._launch()
+        elif not waited:
+            self.stats["hits"] += 1
+
+        pooled.uses += 1
+        with self._lock:
+            self._in_use[id(pooled.driver)] = pooled
+        if download_dir:
+            self.set_download_dir(pooled.driver, download_dir)
+        return pooled.driver
+
+    def release(self, driver: WebDriver):
+        """
+        Return a browser to the pool. It is reset for the next test, or recycled if it
+        crashed or served the maximum number of tests.
+
+        :param driver: WebDriver previously returned by acquire().
+        """
+        with self._lock:
+            pooled = self._in_use.pop(id(driver), None)
+        if pooled is None:
+            return
+
+        if self.max_uses and pooled.uses >= self.max_uses:
+            logger.info(f"Recycling browser after {pooled.uses} uses")
+            self.stats["recycled"] += 1
+            self._discard(pooled)
+            return
+
+        try:
+            self.reset(driver)
+        except WebDriverException as e:
+            logger.warning(f"Browser did not survive reset, recycling it: {e.msg}")
+            self.stats["crashed"] += 1
+            self._discard(pooled)
+            return
+
+        with self._lock:
+            self._idle.append(pooled)
+
+    def reset(self, driver: WebDriver):
+        """
+        Bring a browser back to a clean state: no alerts, a single tab, no cookies or web storage,
+        no blocked resources, emulated position or HTTP authentication handler and a blank page.
+
+        :param driver: WebDriver to reset.
+        """
+        start = time.perf_counter()
+
+        try:
+            driver.switch_to.alert.dismiss()
+        except NoAlertPresentException:
+            pass
+
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        driver.execute_script("try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}")
+        if DevTools.supports_cdp(driver):
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        else:
+            driver.delete_all_cookies()
+        BrowserProfile.unblock_resources(driver)
+        HttpAuth.clear(driver)
+        if getattr(driver, "geolocation_override", None):
+            driver.execute_cdp_cmd("Emulation.clearGeolocationOverride", {})
+            driver.geolocation_override = None
+        driver.get("about:blank")
+
+        self.stats["resets"] += 1
+        self.stats["reset_seconds"] += time.perf_counter() - start
+
+    @staticmethod
+    def set_download_dir(driver: WebDriver, download_dir: str):
+        """
+        Point the browser's downloads at a directory, so every test gets its own.
+        Only possible through CDP; remote grid sessions keep the launch-time preference, as the
+        directory is on this machine and not on the grid node.
+
+        :param driver: WebDriver to configure.
+        :param download_dir: Absolute path of the downloads directory.
+        """
+        if DevTools.supports_cdp(driver):
+            driver.execute_cdp_cmd("Browser.setDownloadBehavior", {
+                "behavior": "allow",
+                "downloadPath": download_dir,
+            })
+
+    def shutdown(self):
+        """
+        Quit every browser owned by the pool.
+        """
+        self._launcher.shutdown(wait=True)
+        with self._lock:
+            pooled_browsers = list(self._idle) + list(self._in_use.values())
+            pooled_browsers += [f.result() for f in self._pending if f.exception() is None]
+            self._idle.clear()
+            self._in_use.clear()
+            self._pending.clear()
+        for pooled in pooled_browsers:
+            self._quit(pooled.driver)
+        logger.info(f"Browser pool stats: {self.summary()}")
+
+    def summary(self) -> dict:
+        """
+        Derived pool metrics: hit rate and average launch/wait/reset latency.
+
+        :return: Dict of pool statistics.
+        """
+        stats = dict(self.stats)
+        handed_out = stats["hits"] + stats["waited"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / handed_out, 3) if handed_out else 0.0
+        stats["avg_launch_ms"] = round(1000 * stats["launch_seconds"] / stats["launches"], 1) if stats["launches"] else 0.0
+        stats["avg_wait_ms"] = round(1000 * stats["wait_seconds"] / stats["waited"], 1) if stats["waited"] else 0.0
+        stats["avg_reset_ms"] = round(1000 * stats["reset_seconds"] / stats["resets"], 1) if stats["resets"] else 0.0
+        return stats
+
+    def _launch(self) -> PooledBrowser:
+        start = time.perf_counter()
+        driver = self.factory()
+        with self._lock:
+            self.stats["launches"] += 1
+            self.stats["launch_seconds"] += time.perf_counter() - start
+        return PooledBrowser(driver)
+
+    def _launch_in_background(self):
+        future: Future = self._launcher.submit(self._launch)
+        with self._lock:
+            self._pending.append(future)
+
+    def _discard(self, pooled: PooledBrowser):
+        self._quit(pooled.driver)
+        self._launch_in_background()
+
+    @staticmethod
+    def _quit(driver: WebDriver):
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
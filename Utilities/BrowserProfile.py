@@ -0,0 +1,272 @@
+import argparse
+import json
+import logging
+import os
+import statistics
+import tempfile
+import threading
+import time
+from typing import Optional
+
+from selenium import webdriver
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from Utilities import DevTools
+from Utilities.LocalSite import LocalSite
+
+logger = logging.getLogger(__name__)
+
+PROFILES = ("default", "throughput")
+
+# Fixed viewport of headless browsers, so layouts do not depend on the machine running the suite.
+WINDOW_SIZE = "1366,768"
+
+# URL patterns blocked per resource kind by the block_resources marker.
+BLOCKABLE_RESOURCES = {
+    "image": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.bmp"],
+    "font": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+}
+
+CACHE_ROOT = os.path.join(tempfile.gettempdir(), "selenium-browser-cache")
+
+# Chrome switches of the throughput profile that turn off work a test never needs.
+THROUGHPUT_ARGUMENTS = (
+    "--disable-extensions",
+    "--disable-gpu",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--no-first-run",
+    "--mute-audio",
+    f"--window-size={WINDOW_SIZE}",
+)
+
+
+class BrowserProfile:
+    """
+    BrowserProfile builds the Chrome options of a browser launch.
+
+    'default' is a headed, maximized browser that loads every page completely. 'throughput' is
+    tuned for CI: headless with a fixed window size, the 'eager' page load strategy, no extensions,
+    GPU or background networking, and a disk cache shared by the browsers that run one after the
+    other on the same worker. Its headed variant keeps every other setting, for the tests that
+    need a real display.
+    """
+
+    _cache_slots_lock = threading.Lock()
+    _cache_slots_in_use = set()
+
+    def __init__(self, name: str = "default", headed: Optional[bool] = None, cache_root: str = CACHE_ROOT,
+                 cache_name: str = "local"):
+        """
+        Initialize the BrowserProfile.
+
+        :param name: 'default' or 'throughput'.
+        :param headed: Force a headed (True) or headless (False) browser; None uses the profile's own mode.
+        :param cache_root: Root directory of the shared disk caches (throughput profile).
+        :param cache_name: Prefix of this profile's cache directories (e.g. the xdist worker id).
+        :raises ValueError: If the profile name is unknown.
+        """
+        if name not in PROFILES:
+            raise ValueError(f"Unknown browser profile '{name}', expected one of {PROFILES}")
+        self.name = name
+        self.headed = (name == "default") if headed is None else headed
+        self.cache_root = cache_root
+        self.cache_name = cache_name
+
+    @property
+    def headless(self) -> bool:
+        return not self.headed
+
+    def headed_variant(self) -> "BrowserProfile":
+        """
+        Get the same profile running headed, for the tests that need a display.
+
+        :return: BrowserProfile
+        """
+        return BrowserProfile(self.name, headed=True, cache_root=self.cache_root, cache_name=f"{self.cache_name}-headed")
+
+    def chrome_options(self, download_path: str, cache_dir: Optional[str] = None) -> webdriver.ChromeOptions:
+        """
+        Build the Chrome options of a launch.
+
+        :param download_path: Default download directory.
+        :param cache_dir: Disk cache directory (throughput profile), from acquire_cache_dir().
+        :return: ChromeOptions
+        """
+        options = webdriver.ChromeOptions()
+        options.add_argument("--log-level=3")
+        options.add_argument("--disable-infobars")
+
+        if self.name == "throughput":
+            options.page_load_strategy = "eager"
+            for argument in THROUGHPUT_ARGUMENTS:
+                options.add_argument(argument)
+            if cache_dir:
+                options.add_argument(f"--disk-cache-dir={cache_dir}")
+        else:
+            options.add_argument("--start-maximized")
+        if self.headless:
+            options.add_argument("--headless=new")
+
+        options.add_experimental_option("prefs", {
+            "credentials_enable_service": False,
+            "profile.password_manager_enabled": False,
+            "profile.password_manager_leak_detection": False,
+            "download.default_directory": download_path,
+            "download.prompt_for_download": False,
+            "directory_upgrade": True,
+            "safebrowsing.enabled": True,
+            "profile.default_content_setting_values.geolocation": 1
+        })
+        return options
+
+    def acquire_cache_dir(self) -> Optional[str]:
+        """
+        Reserve a disk cache directory for a new browser. Chrome locks its cache, so two running
+        browsers never get the same directory; a browser launched after another one quit reuses its cache.
+
+        :return: Directory path, or None for profiles without a shared cache.
+        """
+        if self.name != "throughput":
+            return None
+        with self._cache_slots_lock:
+            slot = 0
+            while os.path.join(self.cache_root, f"{self.cache_name}-{slot}") in self._cache_slots_in_use:
+                slot += 1
+            cache_dir = os.path.join(self.cache_root, f"{self.cache_name}-{slot}")
+            self._cache_slots_in_use.add(cache_dir)
+        os.makedirs(cache_dir, exist_ok=True)
+        return cache_dir
+
+    def attach(self, driver: WebDriver, cache_dir: Optional[str]) -> WebDriver:
+        """
+        Release the browser's cache directory when it quits.
+
+        :param driver: WebDriver launched with the cache directory.
+        :param cache_dir: Directory returned by acquire_cache_dir().
+        :return: The same WebDriver.
+        """
+        if cache_dir is None:
+            return driver
+        original_quit = driver.quit
+
+        def quit():
+            try:
+                original_quit()
+            finally:
+                self.release_cache_dir(cache_dir)
+
+        driver.quit = quit
+        return driver
+
+    def release_cache_dir(self, cache_dir: Optional[str]):
+        """
+        Give a cache directory back, e.g. when the browser it was reserved for failed to launch.
+
+        :param cache_dir: Directory returned by acquire_cache_dir().
+        """
+        with self._cache_slots_lock:
+            self._cache_slots_in_use.discard(cache_dir)
+
+    @staticmethod
+    def block_resources(driver: WebDriver, kinds) -> list:
+        """
+        Stop the browser from downloading some kinds of resources (e.g. images, fonts) until
+        unblock_resources() is called. Only possible through CDP (see DevTools.supports_cdp); other
+        drivers, such as grid sessions, are left untouched.
+
+        :param driver: WebDriver to configure.
+        :param kinds: Resource kinds, keys of BLOCKABLE_RESOURCES.
+        :return: The blocked URL patterns.
+        :raises ValueError: If a kind is unknown.
+        """
+        unknown = set(kinds) - set(BLOCKABLE_RESOURCES)
+        if unknown:
+            raise ValueError(f"Cannot block {sorted(unknown)}, expected any of {sorted(BLOCKABLE_RESOURCES)}")
+        patterns = [pattern for kind in kinds for pattern in BLOCKABLE_RESOURCES[kind]]
+        if patterns and DevTools.supports_cdp(driver):
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+            driver.blocked_resources = patterns
+        return patterns
+
+    @staticmethod
+    def unblock_resources(driver: WebDriver):
+        """
+        Undo block_resources().
+
+        :param driver: WebDriver to configure.
+        """
+        if getattr(driver, "blocked_resources", None):
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+            driver.blocked_resources = []
+
+
+def benchmark(profiles, base_url: str, paths, launches: int = 3, download_path: str = None) -> dict:
+    """
+    Compare profiles: launch each one several times and time the launch, the page loads and the quit.
+
+    :param profiles: BrowserProfile instances to compare.
+    :param base_url: Root URL of the site under test.
+    :param paths: Paths opened by every browser.
+    :param launches: Browsers launched per profile.
+    :param download_path: Download directory of the browsers.
+    :return: Dict of profile label to median launch, page load and total seconds.
+    """
+    download_path = download_path or tempfile.mkdtemp(prefix="profile-benchmark-")
+    results = {}
+    for profile in profiles:
+        label = f"{profile.name}{'' if profile.headless else ' (headed)'}"
+        runs = {"launch": [], "pages": [], "quit": []}
+        for _ in range(launches):
+            cache_dir = profile.acquire_cache_dir()
+            start = time.perf_counter()
+            driver = profile.attach(webdriver.Chrome(options=profile.chrome_options(download_path, cache_dir)), cache_dir)
+            runs["launch"].append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            for path in paths:
+                driver.get(base_url.rstrip("/") + path)
+            runs["pages"].append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            driver.quit()
+            runs["quit"].append(time.perf_counter() - start)
+
+        medians = {key: round(statistics.median(values), 3) for key, values in runs.items()}
+        medians["total"] = round(sum(medians.values()), 3)
+        results[label] = medians
+        logger.info(f"{label}: {medians}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the launch and page load time of the browser profiles.")
+    parser.add_argument("--base_url", help="Site under test (default: the bundled local site)")
+    parser.add_argument("--launches", type=int, default=3, help="Browsers launched per profile")
+    parser.add_argument("--paths", nargs="+", default=["/", "/broken_images", "/dynamic_content", "/challenging_dom",
+                                                      "/hovers", "/checkboxes", "/floating_menu", "/jqueryui/menu"],
+                        help="Paths opened by every browser")
+    parser.add_argument("--output", default=os.path.join("reports", "profile_benchmark.json"))
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+
+    site = None if args.base_url else LocalSite()
+    base_url = args.base_url or site.start()
+    try:
+        profiles = [BrowserProfile("default"), BrowserProfile("default", headed=False),
+                    BrowserProfile("throughput"), BrowserProfile("throughput").headed_variant()]
+        results = benchmark(profiles, base_url, args.paths, launches=args.launches)
+    finally:
+        if site:
+            site.stop()
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump({"base_url": base_url, "paths": args.paths, "launches": args.launches, "profiles": results}, f, indent=2)
+    for label, medians in results.items():
+        print(f"{label:<22} launch {medians['launch']:>6.3f}s  pages {medians['pages']:>6.3f}s  "
+              f"quit {medians['quit']:>6.3f}s  total {medians['total']:>6.3f}s")
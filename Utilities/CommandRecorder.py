@@ -0,0 +1,257 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+logger = logging.getLogger(__name__)
+
+
+class CommandRecorder:
+    """
+    CommandRecorder records every WebDriver command sent by the drivers it is attached to,
+    together with the page object, XPath, phase ('wait' or 'action') and retry attempt that
+    issued it, and aggregates them per test and per page object.
+
+    Commands sent inside a wait span count as wait time (together with any polling sleeps in
+    that span); every other command counts as action time. Commands sent outside a span go to
+    the page object whose method sent them (see page_scope), tracked per thread.
+
+    Element lookups that block for STALL_SECONDS or longer are reported as implicit-wait stalls:
+    with an implicit wait set, every lookup of a missing element blocks for the full wait.
+    """
+
+    # Element lookup commands, and how long one may take before it counts as a stall (seconds).
+    FIND_COMMANDS = ("findElement", "findElements", "findChildElement", "findChildElements")
+    STALL_SECONDS = 1.0
+
+    def __init__(self):
+        self.tests = {}
+        self._local = threading.local()
+        self._current_test = None
+        self._records = []
+        self._spans = []
+        self._waits = []
+
+    def attach(self, driver: WebDriver) -> WebDriver:
+        """
+        Wrap driver.execute so that every command (including WebElement commands) is timed.
+
+        :param driver: WebDriver to instrument.
+        :return: The same WebDriver.
+        """
+        if getattr(driver, "command_recorder", None) is self:
+            return driver
+
+        original_execute = driver.execute
+
+        def execute(driver_command, params=None):
+            start = time.perf_counter()
+            error = None
+            try:
+                return original_execute(driver_command, params)
+            except Exception as e:
+                error = type(e).__name__
+                raise
+            finally:
+                self._record(driver_command, params, time.perf_counter() - start, error)
+
+        driver.execute = execute
+        driver.command_recorder = self
+        return driver
+
+    def start_test(self, nodeid: str):
+        """
+        Start collecting commands for a test.
+
+        :param nodeid: Pytest nodeid of the test.
+        """
+        self._current_test = nodeid
+        self._records = []
+        self._spans = []
+        self._waits = []
+
+    def finish_test(self) -> Optional[dict]:
+        """
+        Stop collecting commands for the current test and store its summary.
+
+        :return: Summary of the test, or None if no test was active.
+        """
+        if self._current_test is None:
+            return None
+        summary = self.summary()
+        self.tests[self._current_test] = summary
+        self._current_test = None
+        return summary
+
+    @contextmanager
+    def span(self, page: str, phase: str, xpath: Optional[str] = None, retry: int = 0):
+        """
+        Attribute the commands sent inside the block to a page object, phase and XPath.
+        Wait spans are also timed as a whole, so polling sleeps count as wait time.
+
+        :param page: Page object class name.
+        :param phase: 'wait' or 'action'.
+        :param xpath: XPath locator the block works on.
+        :param retry: Retry attempt (0 for the first attempt).
+        """
+        stack = self._stack()
+        stack.append({"page": page, "phase": phase, "xpath": xpath, "retry": retry})
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            stack.pop()
+            # Nested spans (e.g. the wait inside click) are already covered by the outer span.
+            if self._current_test is not None and not stack:
+                self._spans.append({
+                    "page": page,
+                    "phase": phase,
+                    "xpath": xpath,
+                    "retry": retry,
+                    "duration": time.perf_counter() - start,
+                })
+
+    @contextmanager
+    def page_scope(self, page: str):
+        """
+        Attribute the commands sent inside the block to a page object, without timing it as a span.
+        Page objects run every method in one, so the innermost page object method wins.
+
+        :param page: Page object class name.
+        """
+        pages = self._pages()
+        pages.append(page)
+        try:
+            yield
+        finally:
+            pages.pop()
+
+    def record_wait(self, page: str, xpath: str, condition: str, seconds: float, strategy: str, ok: bool):
+        """
+        Record how long a wait took until its condition held (or timed out).
+
+        :param page: Page object class name.
+        :param xpath: XPath locator waited on.
+        :param condition: Condition waited for (e.g. 'visible').
+        :param seconds: Time to condition.
+        :param strategy: 'observer' (in-page MutationObserver) or 'polling' (fallback).
+        :param ok: False if the wait timed out.
+        """
+        if self._current_test is None:
+            return
+        self._waits.append({
+            "page": page,
+            "xpath": xpath,
+            "condition": condition,
+            "seconds": round(seconds, 4),
+            "strategy": strategy,
+            "ok": ok,
+        })
+
+    def summary(self) -> dict:
+        """
+        Aggregate the commands recorded for the current test.
+
+        :return: Dict with totals, wait/action split, retries, per-page and per-command aggregates
+                 implicit-wait stalls and time-to-condition of the waits.
+        """
+        per_page = {}
+        per_command = {}
+        for record in self._records:
+            page = per_page.setdefault(record["page"] or "-", {"commands": 0, "seconds": 0.0})
+            page["commands"] += 1
+            page["seconds"] += record["duration"]
+            command = per_command.setdefault(record["command"], {"count": 0, "seconds": 0.0})
+            command["count"] += 1
+            command["seconds"] += record["duration"]
+
+        wait_seconds = sum(span["duration"] for span in self._spans if span["phase"] == "wait")
+        action_seconds = sum(r["duration"] for r in self._records if r["phase"] == "action")
+
+        return {
+            "commands": len(self._records),
+            "command_seconds": round(sum(r["duration"] for r in self._records), 4),
+            "wait_seconds": round(wait_seconds, 4),
+            "action_seconds": round(action_seconds, 4),
+            "retries": sum(1 for span in self._spans if span["retry"] and span["phase"] == "action"),
+            "errors": sum(1 for r in self._records if r["error"]),
+            "pages": {name: {"commands": v["commands"], "seconds": round(v["seconds"], 4)} for name, v in per_page.items()},
+            "by_command": {name: {"count": v["count"], "seconds": round(v["seconds"], 4)} for name, v in per_command.items()},
+            "slowest": sorted(self._records, key=lambda r: r["duration"], reverse=True)[:5],
+            "implicit_wait_stalls": self._stalls(),
+            "waits": {
+                "count": len(self._waits),
+                "seconds": round(sum(w["seconds"] for w in self._waits), 4),
+                "max_seconds": max((w["seconds"] for w in self._waits), default=0.0),
+                "fallbacks": sum(1 for w in self._waits if w["strategy"] == "polling"),
+                "timeouts": sum(1 for w in self._waits if not w["ok"]),
+                "slowest": sorted(self._waits, key=lambda w: w["seconds"], reverse=True)[:5],
+            },
+        }
+
+    def _stalls(self) -> dict:
+        stalls = [
+            {"page": r["page"], "xpath": r["xpath"], "command": r["command"], "duration": r["duration"], "error": r["error"]}
+            for r in self._records
+            if r["command"] in self.FIND_COMMANDS and r["duration"] >= self.STALL_SECONDS
+        ]
+        return {"count": len(stalls), "seconds": round(sum(s["duration"] for s in stalls), 4), "finds": stalls}
+
+    @staticmethod
+    def stall_report(tests: dict) -> dict:
+        """
+        List the tests hit by implicit-wait stalls, slowest first.
+
+        :param tests: Dict of nodeid to test summary.
+        :return: Dict of nodeid to the stalls of that test.
+        """
+        stalled = [(nodeid, s["implicit_wait_stalls"]) for nodeid, s in tests.items() if s["implicit_wait_stalls"]["count"]]
+        return dict(sorted(stalled, key=lambda item: item[1]["seconds"], reverse=True))
+
+    @staticmethod
+    def page_summary(tests: dict) -> dict:
+        """
+        Aggregate per-page-object totals over many test summaries.
+
+        :param tests: Dict of nodeid to test summary.
+        :return: Dict of page object name to command count and seconds.
+        """
+        pages = {}
+        for summary in tests.values():
+            for name, values in summary["pages"].items():
+                page = pages.setdefault(name, {"commands": 0, "seconds": 0.0})
+                page["commands"] += values["commands"]
+                page["seconds"] = round(page["seconds"] + values["seconds"], 4)
+        return pages
+
+    def _stack(self) -> list:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def _pages(self) -> list:
+        if not hasattr(self._local, "pages"):
+            self._local.pages = []
+        return self._local.pages
+
+    def _record(self, command: str, params: Optional[dict], duration: float, error: Optional[str]):
+        if self._current_test is None:
+            return
+        stack = self._stack()
+        pages = self._pages()
+        context = stack[-1] if stack else {}
+        xpath = context.get("xpath")
+        if params and params.get("using") == "xpath":
+            xpath = params.get("value")
+        self._records.append({
+            "command": command,
+            "xpath": xpath,
+            "page": context.get("page") or (pages[-1] if pages else None),
+            "phase": context.get("phase", "action"),
+            "retry": context.get("retry", 0),
+            "duration": round(duration, 4),
+            "error": error,
+        })
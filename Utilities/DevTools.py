@@ -0,0 +1,14 @@
+from selenium.webdriver.chromium.webdriver import ChromiumDriver
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+def supports_cdp(driver: WebDriver) -> bool:
+    """
+    Check if CDP commands can be sent to the browser: only local Chrome/Edge sessions qualify.
+    Every WebDriver has execute_cdp_cmd, but a remote (grid) session may run any browser, on
+    another machine, so it keeps the WebDriver-only code paths.
+
+    :param driver: WebDriver to check.
+    :return: True if the driver is a local Chromium driver.
+    """
+    return isinstance(driver, ChromiumDriver)
@@ -0,0 +1,193 @@
+import ctypes
+import ctypes.util
+import hashlib
+import logging
+import os
+import re
+import select
+import sys
+import time
+from typing import Iterable, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+# inotify event masks (see <sys/inotify.h>)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+
+class DownloadResult(NamedTuple):
+    """
+    A finished download.
+    """
+    path: str
+    size: int
+    sha256: str
+    elapsed: float
+
+
+class DownloadWatcher:
+    """
+    DownloadWatcher waits for a browser download to be finalized in a directory.
+    Chrome writes into '<name>.crdownload' and renames it when done, so a download counts as
+    complete once the final file exists and no partial file is left. Uses inotify on Linux and
+    falls back to polling elsewhere.
+
+    Files that were in the directory before the test (e.g. downloads of earlier tests sharing
+    the directory) are never reported. When the expected name is taken, Chrome saves the new
+    download as '<stem> (1)<ext>', which is accepted instead.
+    """
+
+    PARTIAL_SUFFIXES = (".crdownload", ".tmp", ".part")
+
+    def __init__(self, directory: str, poll_interval: float = 0.05, manifest: Optional[list] = None,
+                 existing: Iterable[str] = ()):
+        """
+        Initialize the DownloadWatcher.
+
+        :param directory: Directory the browser downloads into.
+        :param poll_interval: Seconds between directory scans when inotify is unavailable.
+        :param manifest: Optional list every completed download is appended to, e.g. the test's
+            download manifest that the report attaches.
+        :param existing: Names of the files in the directory before the download started.
+        """
+        self.directory = directory
+        self.poll_interval = poll_interval
+        self.manifest = manifest
+        self.existing = set(existing)
+        self.use_inotify = sys.platform.startswith("linux") and _libc() is not None
+
+    def wait_for(self, filename: Optional[str] = None, timeout: float = 30.0) -> DownloadResult:
+        """
+        Wait until a download is complete.
+
+        :param filename: Expected file name; None accepts the first file that completes.
+        :param timeout: Maximum time to wait in seconds.
+        :return: DownloadResult with path, size, streaming SHA-256 and time waited.
+        :raises TimeoutError: If no download completes within the timeout.
+        """
+        start = time.monotonic()
+        deadline = start + timeout
+        os.makedirs(self.directory, exist_ok=True)
+
+        if self.use_inotify:
+            path = self._wait_inotify(filename, deadline)
+        else:
+            path = self._wait_polling(filename, deadline)
+
+        if path is None:
+            raise TimeoutError(
+                f"Download of '{filename or 'any file'}' did not complete in '{self.directory}' within {timeout}s."
+            )
+
+        elapsed = time.monotonic() - start
+        result = DownloadResult(path, os.path.getsize(path), self.sha256(path), elapsed)
+        logger.info(f"Download complete: {os.path.basename(path)} ({result.size} bytes) in {elapsed:.2f}s")
+        if self.manifest is not None:
+            self.manifest.append(result)
+        return result
+
+    def find_complete(self, filename: Optional[str] = None) -> Optional[str]:
+        """
+        Check the directory once for a finished download.
+
+        :param filename: Expected file name; None accepts any finished file.
+        :return: Full path of the finished file, or None.
+        """
+        entries = [e for e in os.listdir(self.directory) if e not in self.existing]
+        partials = [e for e in entries if e.endswith(self.PARTIAL_SUFFIXES)]
+
+        if filename is not None:
+            stem, ext = os.path.splitext(filename)
+            still_writing = any(p.startswith(stem) or p.startswith("Unconfirmed") for p in partials)
+            renamed = re.compile(re.escape(stem) + r" \(\d+\)" + re.escape(ext))
+            matches = [e for e in entries if e == filename or renamed.fullmatch(e)]
+            if matches and not still_writing:
+                return os.path.join(self.directory, min(matches, key=len))
+            return None
+
+        if partials:
+            return None
+        files = [e for e in entries if os.path.isfile(os.path.join(self.directory, e))]
+        return os.path.join(self.directory, files[0]) if files else None
+
+    @staticmethod
+    def sha256(path: str, chunk_size: int = 1024 * 1024) -> str:
+        """
+        Compute the SHA-256 of a file without loading it into memory at once.
+
+        :param path: File to hash.
+        :param chunk_size: Bytes read per chunk.
+        :return: Hex digest.
+        """
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _wait_polling(self, filename: Optional[str], deadline: float) -> Optional[str]:
+        while True:
+            path = self.find_complete(filename)
+            if path:
+                return path
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            time.sleep(min(self.poll_interval, remaining))
+
+    def _wait_inotify(self, filename: Optional[str], deadline: float) -> Optional[str]:
+        libc = _libc()
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            return self._wait_polling(filename, deadline)
+        try:
+            watch = libc.inotify_add_watch(fd, os.fsencode(self.directory), IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE)
+            if watch < 0:
+                return self._wait_polling(filename, deadline)
+
+            # The watch is in place, so anything finished from now on produces an event;
+            # check once for downloads that completed before the watch existed.
+            path = self.find_complete(filename)
+            while path is None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                readable, _, _ = select.select([fd], [], [], remaining)
+                if readable:
+                    self._drain(fd)
+                    path = self.find_complete(filename)
+            return path
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _drain(fd: int):
+        # Event contents are not needed: any change triggers a re-check of the directory.
+        try:
+            while os.read(fd, 64 * 1024):
+                pass
+        except BlockingIOError:
+            pass
+
+
+_LIBC = None
+
+
+def _libc():
+    """
+    Load libc lazily and only if it exposes the inotify API.
+    """
+    global _LIBC
+    if _LIBC is None:
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            libc.inotify_init1.argtypes = [ctypes.c_int]
+            libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+            _LIBC = libc
+        except (OSError, AttributeError):
+            _LIBC = False
+    return _LIBC or None
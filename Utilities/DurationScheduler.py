@@ -0,0 +1,224 @@
+import heapq
+import json
+import logging
+import os
+import statistics
+
+from xdist.scheduler import LoadScopeScheduling
+
+from Utilities.WorkerArtifacts import PROJECT_ROOT
+
+logger = logging.getLogger(__name__)
+
+HISTORY_PATH = os.path.join(PROJECT_ROOT, ".test_durations.json")
+
+# Expected duration of a test when the history knows no test at all.
+DEFAULT_SECONDS = 5.0
+
+# Weight of the latest run in a test's recorded duration; older runs fade out.
+SMOOTHING = 0.5
+
+
+def page_object_of(nodeid: str) -> str:
+    """
+    Name of the page object a test exercises, from its module (test/test_CheckboxesPage.py -> CheckboxesPage).
+
+    :param nodeid: Pytest nodeid.
+    :return: Page object name, the scheduling unit of the test.
+    """
+    module = nodeid.split("::", 1)[0].replace("\\", "/").rsplit("/", 1)[-1]
+    name = module[:-3] if module.endswith(".py") else module
+    return name[5:] if name.startswith("test_") else name
+
+
+def plan(unit_seconds: dict, workers: int) -> dict:
+    """
+    Predict the schedule of the longest-first strategy: every unit, longest first, goes to the
+    worker with the least expected time.
+
+    :param unit_seconds: Dict of scheduling unit to expected seconds.
+    :param workers: Number of workers.
+    :return: Dict with the predicted makespan and the expected seconds of every worker.
+    """
+    loads = [(0.0, worker) for worker in range(max(workers, 1))]
+    for unit, seconds in sorted(unit_seconds.items(), key=lambda item: -item[1]):
+        load, worker = heapq.heappop(loads)
+        heapq.heappush(loads, (load + seconds, worker))
+    worker_seconds = [round(load, 3) for load, _ in sorted(loads, key=lambda item: item[1])]
+    return {"makespan": max(worker_seconds), "workers": worker_seconds}
+
+
+class DurationHistory:
+    """
+    DurationHistory keeps the duration of every test (setup, call and teardown) over previous runs,
+    as a smoothed average in a small JSON file: {nodeid: [seconds, runs]}.
+    """
+
+    def __init__(self, path: str = HISTORY_PATH):
+        """
+        Initialize the DurationHistory.
+
+        :param path: JSON file of the history; missing or unreadable files start an empty history.
+        """
+        self.path = path
+        self.tests = {}
+        self._run = {}
+        try:
+            with open(path) as f:
+                self.tests = json.load(f)
+        except (OSError, ValueError):
+            pass
+        known = [seconds for seconds, _ in self.tests.values()]
+        self.unknown_seconds = statistics.median(known) if known else DEFAULT_SECONDS
+
+    def estimate(self, nodeid: str) -> float:
+        """
+        Expected duration of a test; tests without history are expected to take the median duration.
+
+        :param nodeid: Pytest nodeid.
+        :return: Seconds.
+        """
+        entry = self.tests.get(nodeid)
+        return entry[0] if entry else self.unknown_seconds
+
+    def add(self, nodeid: str, seconds: float):
+        """
+        Add the duration of one phase of a test of the current run.
+
+        :param nodeid: Pytest nodeid.
+        :param seconds: Duration of the phase.
+        """
+        self._run[nodeid] = self._run.get(nodeid, 0.0) + seconds
+
+    def save(self):
+        """
+        Merge the current run into the history and write it.
+        """
+        if not self._run:
+            return
+        for nodeid, seconds in self._run.items():
+            previous, runs = self.tests.get(nodeid, (seconds, 0))
+            self.tests[nodeid] = [round(SMOOTHING * seconds + (1 - SMOOTHING) * previous, 3), runs + 1]
+        with open(self.path, "w") as f:
+            json.dump(self.tests, f, separators=(",", ":"), sort_keys=True)
+
+
+class DurationScheduling(LoadScopeScheduling):
+    """
+    xdist scheduler that hands out the tests of one page object as a unit, so they run one after
+    the other on the same worker and its warm browser, and hands out the units with the longest
+    expected duration (from the DurationHistory) first. Idle workers pull the next unit, so the
+    expected time ends up balanced across the workers.
+    """
+
+    def __init__(self, config, log, history: DurationHistory):
+        """
+        Initialize the DurationScheduling.
+
+        :param config: Pytest config object.
+        :param log: xdist log producer.
+        :param history: Durations of previous runs.
+        """
+        super().__init__(config, log)
+        self.history = history
+        self.unit_seconds = {}
+        self.prediction = None
+        self.worker_units = {}
+
+    def _split_scope(self, nodeid: str) -> str:
+        return page_object_of(nodeid)
+
+    def _assign_work_unit(self, node):
+        unit = next(iter(self.workqueue))
+        self.worker_units.setdefault(node.gateway.id, []).append(unit)
+        super()._assign_work_unit(node)
+
+    def schedule(self):
+        # Mirrors LoadScopeScheduling.schedule(), with the queue ordered by expected duration.
+        if self.collection is not None or not self._check_nodes_have_same_collection():
+            super().schedule()
+            return
+        self.collection = list(next(iter(self.registered_collections.values())))
+        if not self.collection:
+            return
+
+        units = {}
+        for nodeid in self.collection:
+            units.setdefault(self._split_scope(nodeid), {})[nodeid] = False
+        self.unit_seconds = {
+            unit: round(sum(self.history.estimate(nodeid) for nodeid in nodeids), 3)
+            for unit, nodeids in units.items()
+        }
+        for unit in sorted(units, key=lambda unit: -self.unit_seconds[unit]):
+            self.workqueue[unit] = units[unit]
+
+        extra_nodes = len(self.nodes) - len(self.workqueue)
+        for _ in range(max(extra_nodes, 0)):
+            unused_node, _ = self.assigned_work.popitem()
+            unused_node.shutdown()
+
+        self.prediction = plan(self.unit_seconds, len(self.nodes))
+        logger.info(f"Duration scheduler: {len(units)} page object units on {len(self.nodes)} workers, "
+                    f"predicted makespan {self.prediction['makespan']:.1f}s")
+
+        for node in self.nodes:
+            self._assign_work_unit(node)
+        for node in self.nodes:
+            self._reschedule(node)
+        if not self.workqueue:
+            for node in self.nodes:
+                node.shutdown()
+
+
+class ScheduleTracker:
+    """
+    ScheduleTracker is a plugin of the controller that measures the actual schedule of a run from
+    the test reports it receives from the workers: the makespan (first test start to last test end)
+    and the busy time of every worker. It also adds every test's duration to the DurationHistory.
+    """
+
+    def __init__(self, history: DurationHistory):
+        """
+        Initialize the ScheduleTracker.
+
+        :param history: History the durations of this run are added to.
+        """
+        self.history = history
+        self.first_start = None
+        self.last_stop = None
+        self.worker_seconds = {}
+
+    def pytest_runtest_logreport(self, report):
+        """
+        Account one test phase report.
+
+        :param report: Pytest TestReport (under xdist, with the node it ran on).
+        """
+        self.history.add(report.nodeid, report.duration)
+        node = getattr(report, "node", None)
+        worker = node.gateway.id if node is not None else "master"
+        self.worker_seconds[worker] = self.worker_seconds.get(worker, 0.0) + report.duration
+        self.first_start = report.start if self.first_start is None else min(self.first_start, report.start)
+        self.last_stop = report.stop if self.last_stop is None else max(self.last_stop, report.stop)
+
+    def report(self, scheduler: DurationScheduling = None) -> dict:
+        """
+        Compare the actual schedule with the scheduler's prediction.
+
+        :param scheduler: The run's DurationScheduling, None when another scheduler ran.
+        :return: Dict of predicted and actual makespan and per-worker seconds.
+        """
+        actual = round(self.last_stop - self.first_start, 3) if self.first_start is not None else 0.0
+        result = {
+            "actual_makespan": actual,
+            "workers": {worker: {"actual_seconds": round(seconds, 3)}
+                        for worker, seconds in sorted(self.worker_seconds.items())},
+        }
+        if scheduler is not None and scheduler.prediction:
+            result["predicted_makespan"] = scheduler.prediction["makespan"]
+            result["predicted_worker_seconds"] = scheduler.prediction["workers"]
+            for worker, units in scheduler.worker_units.items():
+                entry = result["workers"].setdefault(worker, {"actual_seconds": 0.0})
+                entry["units"] = units
+                entry["expected_seconds"] = round(sum(scheduler.unit_seconds[unit] for unit in units), 3)
+        return result
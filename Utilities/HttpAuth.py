@@ -0,0 +1,134 @@
+import logging
+from urllib.parse import urlsplit
+
+from selenium.common import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from Utilities import DevTools
+
+logger = logging.getLogger(__name__)
+
+
+def supports(driver: WebDriver) -> bool:
+    """
+    Check if the browser can answer authentication challenges for authorize() (local Chromium).
+
+    :param driver: WebDriver to check.
+    :return: True if authorize() can be used.
+    """
+    return DevTools.supports_cdp(driver)
+
+
+class OriginAuth:
+    """
+    OriginAuth answers the HTTP authentication challenges of one origin in the driver's current
+    tab. Requests to the origin are intercepted through the CDP Fetch domain on the driver's
+    DevTools connection; every 401 challenge is answered with the credentials, so Chrome computes
+    the Basic or Digest response for each challenge itself (fresh nonce count and cnonce).
+    Requests to other origins are not intercepted and never see the credentials.
+    """
+
+    def __init__(self, driver: WebDriver, origin: str, username: str, password: str):
+        """
+        Initialize the OriginAuth.
+
+        :param driver: Local Chromium WebDriver (see supports()).
+        :param origin: Origin to answer challenges for, e.g. 'https://the-internet.herokuapp.com'.
+        :param username: User name.
+        :param password: Password.
+        """
+        self.driver = driver
+        self.origin = origin
+        self.username = username
+        self.password = password
+        self._devtools = None
+        self._connection = None
+        self._callbacks = []
+
+    def start(self):
+        """
+        Start intercepting the origin's requests in the current tab.
+        """
+        devtools, connection = self.driver.start_devtools()
+        # The connection is attached to the first target; window handles are target ids, so
+        # attach it (from the browser session) to the tab the test runs in.
+        connection.session_id = None
+        connection.session_id = connection.execute(
+            devtools.target.attach_to_target(devtools.target.TargetID(self.driver.current_window_handle), flatten=True)
+        )
+        self._devtools, self._connection = devtools, connection
+        self._callbacks = [
+            (devtools.fetch.RequestPaused, connection.add_callback(devtools.fetch.RequestPaused, self._continue)),
+            (devtools.fetch.AuthRequired, connection.add_callback(devtools.fetch.AuthRequired, self._authenticate)),
+        ]
+        connection.execute(devtools.fetch.enable(
+            patterns=[devtools.fetch.RequestPattern(url_pattern=f"{self.origin}/*")],
+            handle_auth_requests=True,
+        ))
+
+    def stop(self):
+        """
+        Stop intercepting; challenges of the origin reach the page again.
+        """
+        if self._connection is None:
+            return
+        for event, callback_id in self._callbacks:
+            self._connection.remove_callback(event, callback_id)
+        self._callbacks = []
+        try:
+            self._connection.execute(self._devtools.fetch.disable())
+        except WebDriverException as e:
+            # The tab may already be gone (closed by the pool reset or its context disposed).
+            logger.debug(f"Could not disable request interception for {self.origin}: {e.msg}")
+        self._connection = None
+
+    def _continue(self, event):
+        self._send(self._devtools.fetch.continue_request(request_id=event.request_id))
+
+    def _authenticate(self, event):
+        response = self._devtools.fetch.AuthChallengeResponse(
+            response="ProvideCredentials", username=self.username, password=self.password
+        )
+        self._send(self._devtools.fetch.continue_with_auth(request_id=event.request_id, auth_challenge_response=response))
+        logger.info(f"Answered {event.auth_challenge.scheme} challenge of {event.auth_challenge.origin}")
+
+    def _send(self, command):
+        try:
+            self._connection.execute(command)
+        except (WebDriverException, AttributeError) as e:
+            # Events can still arrive while stop() runs; the request is gone with the tab by then.
+            logger.debug(f"Could not answer intercepted request of {self.origin}: {e}")
+
+
+def authorize(driver: WebDriver, url: str, username: str, password: str) -> str:
+    """
+    Make the browser log in to a protected URL without credentials in the URL, so the page loads in
+    one navigation. The credentials answer the Basic or Digest challenges of the URL's origin only,
+    in the current tab, until clear() or the browser pool reset.
+
+    :param driver: WebDriver to configure (see supports()).
+    :param url: Protected URL.
+    :param username: User name.
+    :param password: Password.
+    :return: The origin the credentials are used for.
+    """
+    clear(driver)
+    parts = urlsplit(url)
+    origin = f"{parts.scheme}://{parts.netloc}"
+    auth = OriginAuth(driver, origin, username, password)
+    auth.start()
+    driver.http_auth = auth
+    logger.info(f"Answering authentication challenges of {origin}")
+    return origin
+
+
+def clear(driver: WebDriver):
+    """
+    Stop answering the challenges set up by authorize().
+
+    :param driver: WebDriver to configure.
+    """
+    auth = getattr(driver, "http_auth", None)
+    if auth:
+        auth.stop()
+        driver.http_auth = None
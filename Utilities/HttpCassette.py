@@ -0,0 +1,228 @@
+import glob
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+from typing import NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+CASSETTES_DIR = os.path.join(PROJECT_ROOT, "Data", "cassettes")
+
+# Request headers that change the response and so are part of the key.
+VARY_HEADERS = ("Accept", "Range")
+# Hop-by-hop headers are not replayed; Content-Length is recomputed for the stored body.
+SKIPPED_HEADERS = ("connection", "keep-alive", "transfer-encoding", "content-length")
+
+
+class CassetteEntry(NamedTuple):
+    """
+    Location and metadata of one recorded response.
+    """
+    pack: str
+    offset: int
+    length: int
+    url: str
+    status: int
+    headers: list
+    recorded_at: float
+
+
+def request_key(method: str, url: str, headers, body: bytes = b"") -> str:
+    """
+    Build the cassette key of a request.
+
+    Only cookie names (not values) and the Authorization scheme are part of the key, because
+    session tokens and digest nonces change on every run while 'logged in or not' does not.
+
+    :param method: HTTP method.
+    :param url: Full URL including the query string.
+    :param headers: Request headers (anything with .get()).
+    :param body: Request body.
+    :return: Hex digest identifying the request.
+    """
+    parts = [method.upper(), url]
+    parts += [f"{name}:{headers.get(name) or ''}" for name in VARY_HEADERS]
+    parts.append("auth:" + (headers.get("Authorization") or "").split(" ")[0])
+    cookies = headers.get("Cookie") or ""
+    parts.append("cookies:" + ",".join(sorted(c.split("=")[0].strip() for c in cookies.split(";") if "=" in c)))
+    if body:
+        parts.append(hashlib.sha1(body).hexdigest())
+    return hashlib.sha1("\n".join(parts).encode()).hexdigest()
+
+
+class HttpCassette:
+    """
+    HttpCassette records the browser's HTTP traffic (through selenium-wire interceptors) into an
+    on-disk cassette and replays it later without touching the network.
+
+    Each writer (xdist worker) appends zlib-compressed bodies to its own '<name>.pack' file and
+    keeps a '<name>.idx.json' index of key to (offset, length, status, headers), so a replayed
+    response costs one dict lookup and one seek. Requests recorded several times (randomised pages)
+    keep every variant, and replay cycles through them.
+    """
+
+    MODES = ("off", "record", "replay")
+
+    def __init__(self, directory: str = CASSETTES_DIR, mode: str = "replay", name: str = "master",
+                 max_age_days: float = 30):
+        """
+        Initialize the HttpCassette.
+
+        :param directory: Directory holding the pack and index files.
+        :param mode: 'record' or 'replay'.
+        :param name: Name of this writer's pack and index files (the xdist worker id).
+        :param max_age_days: Entries older than this are reported as stale.
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Invalid cassette mode '{mode}', expected one of {self.MODES}")
+        self.directory = directory
+        self.mode = mode
+        self.name = name
+        self.max_age_days = max_age_days
+        self.index = {}
+        self.stats = {"recorded": 0, "hits": 0, "misses": 0}
+        self.missed_urls = []
+        self._replayed = {}
+        self._lock = threading.Lock()
+        self._pack = None
+
+    @property
+    def pack_path(self) -> str:
+        return os.path.join(self.directory, f"{self.name}.pack")
+
+    @property
+    def index_path(self) -> str:
+        return os.path.join(self.directory, f"{self.name}.idx.json")
+
+    def open(self) -> "HttpCassette":
+        """
+        Start a fresh pack file when recording, or load every index in the directory when replaying.
+
+        :return: The cassette itself.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        if self.mode == "record":
+            self._pack = open(self.pack_path, "wb")
+        elif self.mode == "replay":
+            for path in glob.glob(os.path.join(self.directory, "*.idx.json")):
+                with open(path) as f:
+                    for key, entries in json.load(f).items():
+                        self.index.setdefault(key, []).extend(CassetteEntry(*entry) for entry in entries)
+            logger.info(f"Loaded {len(self.index)} cassette keys from {self.directory}")
+        return self
+
+    def close(self):
+        """
+        Flush the pack file and write the index of a recording cassette.
+        """
+        if self._pack:
+            self._pack.close()
+            self._pack = None
+            with open(self.index_path, "w") as f:
+                json.dump({key: [list(entry) for entry in entries] for key, entries in self.index.items()}, f)
+            logger.info(f"Recorded {self.stats['recorded']} responses into {self.pack_path}")
+
+    @staticmethod
+    def clear(directory: str = CASSETTES_DIR):
+        """
+        Delete every pack and index file, before a new recording.
+
+        :param directory: Cassette directory.
+        """
+        for path in glob.glob(os.path.join(directory, "*.pack")) + glob.glob(os.path.join(directory, "*.idx.json")):
+            os.remove(path)
+
+    def record(self, key: str, url: str, status: int, headers: list, body: bytes):
+        """
+        Append a response to the pack file.
+
+        :param key: Request key (see request_key()).
+        :param url: Request URL, kept for the staleness report.
+        :param status: Response status code.
+        :param headers: Response headers as (name, value) pairs.
+        :param body: Decoded response body.
+        """
+        data = zlib.compress(body or b"")
+        headers = [[k, v] for k, v in headers if k.lower() not in SKIPPED_HEADERS]
+        with self._lock:
+            offset = self._pack.tell()
+            self._pack.write(data)
+            entry = CassetteEntry(os.path.basename(self.pack_path), offset, len(data), url, status, headers, time.time())
+            self.index.setdefault(key, []).append(entry)
+            self.stats["recorded"] += 1
+
+    def lookup(self, key: str, url: str = "") -> Optional[tuple]:
+        """
+        Find the recorded response of a request; repeated requests cycle through recorded variants.
+
+        :param key: Request key (see request_key()).
+        :param url: Request URL, reported when the request was never recorded.
+        :return: (status, headers, body), or None when the request was never recorded.
+        """
+        entries = self.index.get(key)
+        with self._lock:
+            if not entries:
+                self.stats["misses"] += 1
+                self.missed_urls.append(url)
+                return None
+            count = self._replayed.get(key, 0)
+            self._replayed[key] = count + 1
+            self.stats["hits"] += 1
+        entry = entries[count % len(entries)]
+        with open(os.path.join(self.directory, entry.pack), "rb") as f:
+            f.seek(entry.offset)
+            body = zlib.decompress(f.read(entry.length))
+        return entry.status, entry.headers, body
+
+    def attach(self, driver):
+        """
+        Install selenium-wire interceptors that record or replay the driver's traffic.
+
+        :param driver: selenium-wire WebDriver.
+        :return: The same WebDriver.
+        """
+        if self.mode == "record":
+            def response_interceptor(request, response):
+                key = request_key(request.method, request.url, request.headers, request.body)
+                self.record(key, request.url, response.status_code, list(response.headers.items()), response.body)
+
+            driver.response_interceptor = response_interceptor
+        elif self.mode == "replay":
+            def request_interceptor(request):
+                key = request_key(request.method, request.url, request.headers, request.body)
+                recorded = self.lookup(key, request.url)
+                if recorded is None:
+                    # Zero network in replay: unknown requests fail instead of reaching the site.
+                    request.abort(error_code=504)
+                    return
+                status, headers, body = recorded
+                request.create_response(status_code=status, headers=headers, body=body)
+
+            driver.request_interceptor = request_interceptor
+        return driver
+
+    def report(self) -> dict:
+        """
+        Summarise the cassette: traffic stats, recorded age and stale or unused entries.
+
+        :return: Dict suitable for JSON.
+        """
+        entries = [entry for variants in self.index.values() for entry in variants]
+        now = time.time()
+        stale_before = now - self.max_age_days * 86400
+        stale = sorted({entry.url for entry in entries if entry.recorded_at < stale_before})
+        oldest = min((entry.recorded_at for entry in entries), default=None)
+        report = dict(self.stats, mode=self.mode, keys=len(self.index), entries=len(entries))
+        report["oldest_age_days"] = round((now - oldest) / 86400, 1) if oldest else None
+        report["stale_urls"] = stale
+        report["missed_urls"] = sorted(set(self.missed_urls))
+        if self.mode == "replay":
+            report["unused_urls"] = sorted({
+                variants[0].url for key, variants in self.index.items() if key not in self._replayed
+            })
+        return report
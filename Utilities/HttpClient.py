@@ -0,0 +1,167 @@
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+POOL_SIZE = 32
+
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+class UrlCheck(NamedTuple):
+    """
+    Result of checking a URL.
+    """
+    url: str
+    status: Optional[int]
+    method: str
+    elapsed: float
+    error: Optional[str]
+
+
+def get_session() -> requests.Session:
+    """
+    Get the process-wide keep-alive HTTP session, whose connection pool is shared by all callers.
+
+    :return: requests.Session
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _SESSION = session
+    return _SESSION
+
+
+def check_url(url: str, timeout: float = 5) -> UrlCheck:
+    """
+    Check a URL with a HEAD request, falling back to a GET (body not downloaded) when the
+    server does not support HEAD.
+
+    :param url: URL to check.
+    :param timeout: Timeout of each request in seconds.
+    :return: UrlCheck with status code, method used and time taken.
+    """
+    session = get_session()
+    start = time.perf_counter()
+    method = "HEAD"
+    try:
+        response = session.head(url, timeout=timeout, allow_redirects=True)
+        if response.status_code in (405, 501):
+            method = "GET"
+            with session.get(url, timeout=timeout, stream=True) as response:
+                pass
+        return UrlCheck(url, response.status_code, method, time.perf_counter() - start, None)
+    except requests.RequestException as e:
+        return UrlCheck(url, None, method, time.perf_counter() - start, str(e))
+
+
+def check_urls(urls: list, timeout: float = 5, max_workers: int = 16) -> list:
+    """
+    Check many URLs concurrently over the shared session.
+
+    :param urls: URLs to check.
+    :param timeout: Timeout of each request in seconds.
+    :param max_workers: Maximum concurrent requests.
+    :return: List of UrlCheck, in the order of urls.
+    """
+    if not urls:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls), POOL_SIZE)) as executor:
+        return list(executor.map(lambda url: check_url(url, timeout), urls))
+
+
+class ContentHashCache:
+    """
+    ContentHashCache hashes the content behind URLs, computing the digest while the body streams
+    in. Digests are kept in an LRU cache keyed by URL together with the ETag/Last-Modified
+    validators of the response, and revalidated with a conditional request: a 304 answer reuses
+    the cached digest without downloading the body again.
+    """
+
+    def __init__(self, max_entries: int = 256, algorithm: str = "md5", chunk_size: int = 64 * 1024):
+        """
+        Initialize the ContentHashCache.
+
+        :param max_entries: Maximum number of URLs kept.
+        :param algorithm: hashlib algorithm name.
+        :param chunk_size: Bytes hashed per chunk while streaming.
+        """
+        self.max_entries = max_entries
+        self.algorithm = algorithm
+        self.chunk_size = chunk_size
+        self.stats = {"hits": 0, "misses": 0}
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, url: str, timeout: float = 5) -> str:
+        """
+        Get the digest of the content at a URL.
+
+        :param url: URL to hash.
+        :param timeout: Request timeout in seconds.
+        :return: Hex digest of the body.
+        :raises requests.RequestException: If the request fails.
+        """
+        with self._lock:
+            cached = self._entries.get(url)
+
+        headers = {}
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        with get_session().get(url, headers=headers, timeout=timeout, stream=True) as response:
+            if cached and headers and response.status_code == 304:
+                with self._lock:
+                    self._entries.move_to_end(url)
+                    self.stats["hits"] += 1
+                return cached[2]
+
+            response.raise_for_status()
+            digest = hashlib.new(self.algorithm)
+            for chunk in response.iter_content(self.chunk_size):
+                digest.update(chunk)
+            entry = (response.headers.get("ETag"), response.headers.get("Last-Modified"), digest.hexdigest())
+
+        with self._lock:
+            self.stats["misses"] += 1
+            self._entries[url] = entry
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry[2]
+
+    def get_many(self, urls: list, timeout: float = 5, max_workers: int = 16) -> dict:
+        """
+        Hash many URLs concurrently over the shared session; duplicate URLs are fetched once.
+
+        :param urls: URLs to hash.
+        :param timeout: Request timeout in seconds.
+        :param max_workers: Maximum concurrent requests.
+        :return: Dict of URL to hex digest.
+        """
+        unique = list(dict.fromkeys(urls))
+        if not unique:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique), POOL_SIZE)) as executor:
+            return dict(zip(unique, executor.map(lambda url: self.get(url, timeout), unique)))
+
+
+# Shared by all page objects of the process.
+content_hashes = ContentHashCache()
@@ -0,0 +1,491 @@
+import base64
+import hashlib
+import html
+import logging
+import os
+import random
+import re
+import secrets
+import struct
+import threading
+import zlib
+from email import policy
+from email.parser import BytesParser
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+PAGES_DIR = os.path.join(PROJECT_ROOT, "LocalSite", "pages")
+DOWNLOADS_DIR = os.path.join(PROJECT_ROOT, "Data", "downloads")
+
+BASIC_AUTH = ("admin", "admin")
+DIGEST_REALM = "Protected Area"
+FORM_AUTH = ("tomsmith", "SuperSecretPassword!")
+
+WORDS = (
+    "accusamus aut autem consequatur debitis delectus dolor dolorem dolores eius error est et eum "
+    "expedita facilis fuga harum id ipsa laboriosam laudantium magnam maxime minus molestiae nam "
+    "necessitatibus nemo nihil nostrum odio officia omnis optio perferendis placeat possimus quia "
+    "quibusdam quis quo ratione recusandae rerum saepe sapiente sed similique sint soluta sunt "
+    "tempora tenetur ullam ut vel velit veniam voluptas voluptatem voluptates"
+).split()
+
+
+def _png(width: int, height: int, rgb: tuple) -> bytes:
+    """
+    Encode a solid colour PNG (used for the avatar and placeholder images).
+    """
+    def chunk(tag, data):
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+    row = b"\x00" + bytes(rgb) * width
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(row * height))
+        + chunk(b"IEND", b"")
+    )
+
+
+def _lorem(words: int) -> str:
+    return " ".join(random.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+class LocalSite:
+    """
+    LocalSite serves a local stand-in for the-internet.herokuapp.com pages covered by the page
+    objects, with the same DOM and behaviours (auth challenges, login session, uploads, downloads,
+    randomised content), so the suite can run offline and at high parallelism.
+
+    Pages are rendered from the templates in LocalSite/pages, which are read once at start-up.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, loading_ms: int = 500):
+        """
+        Initialize the LocalSite.
+
+        :param host: Interface to listen on.
+        :param port: Port to listen on (0 picks a free port).
+        :param loading_ms: Duration of the 'loading' phase on the dynamic loading/controls pages.
+        """
+        self.host = host
+        self.port = port
+        self.loading_ms = loading_ms
+        self.sessions = set()
+        self.nonces = set()
+        self.lock = threading.Lock()
+        self.templates = {}
+        self.images = {}
+        self.files = {}
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        """
+        Base URL of the running site, with a trailing slash.
+        """
+        return f"http://{self.host}:{self.port}/"
+
+    def start(self) -> str:
+        """
+        Load the templates and serve the site on a background thread.
+
+        :return: The base URL of the site.
+        """
+        self._load_assets()
+        self._server = _Server((self.host, self.port), _Handler)
+        self._server.site = self
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="local-site", daemon=True)
+        self._thread.start()
+        logger.info(f"Local site serving on {self.base_url}")
+        return self.base_url
+
+    def stop(self):
+        """
+        Stop serving and close the listening socket.
+        """
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def render(self, name: str, **values) -> bytes:
+        """
+        Render a page template inside the shared layout.
+
+        :param name: Template name without extension.
+        :param values: Values substituted for '{{key}}' placeholders.
+        :return: The UTF-8 encoded page.
+        """
+        body = self.templates[name]
+        for key, value in values.items():
+            body = body.replace("{{" + key + "}}", str(value))
+        return self.templates["layout"].replace("{{body}}", body).encode("utf-8")
+
+    def download_names(self) -> list:
+        """
+        Names of the files listed on the download page.
+        """
+        return sorted(name for name in self.files if "/" not in name)
+
+    def _load_assets(self):
+        for entry in os.listdir(PAGES_DIR):
+            if entry.endswith(".html"):
+                with open(os.path.join(PAGES_DIR, entry), encoding="utf-8") as f:
+                    self.templates[entry[:-5]] = f.read()
+
+        self.images["img/avatar-blank.jpg"] = _png(160, 160, (200, 200, 200))
+        for n in range(1, 8):
+            self.images[f"img/avatars/Original-Facebook-Geek-Profile-Avatar-{n}.jpg"] = _png(
+                120, 120, (40 * n % 256, 255 - 30 * n, 90 + 20 * n))
+
+        for entry in os.listdir(DOWNLOADS_DIR):
+            with open(os.path.join(DOWNLOADS_DIR, entry), "rb") as f:
+                self.files[entry] = f.read()
+        self.files.setdefault("cat.jpg", _png(320, 240, (180, 120, 60)))
+        self.files["jqueryui/menu/menu.pdf"] = b"%PDF-1.4\n% the-internet menu\n%%EOF\n"
+        self.files["jqueryui/menu/menu.csv"] = b"menu,item\njqueryui,pdf\njqueryui,csv\njqueryui,xls\n"
+        self.files["jqueryui/menu/menu.xls"] = b"menu\titem\njqueryui\txls\n"
+
+
+class _Server(ThreadingHTTPServer):
+    # Many browsers hit the same worker's site at once under xdist.
+    request_queue_size = 128
+    site: LocalSite
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _Server
+
+    ROUTES = {
+        "/": "index",
+        "/abtest": "abtest",
+        "/add_remove_elements/": "add_remove_elements",
+        "/basic_auth": "basic_auth",
+        "/broken_images": "broken_images",
+        "/challenging_dom": "challenging_dom",
+        "/checkboxes": "checkboxes",
+        "/context_menu": "context_menu",
+        "/digest_auth": "digest_auth",
+        "/disappearing_elements": "disappearing_elements",
+        "/drag_and_drop": "drag_and_drop",
+        "/dropdown": "dropdown",
+        "/dynamic_content": "dynamic_content",
+        "/dynamic_controls": "dynamic_controls",
+        "/dynamic_loading": "dynamic_loading",
+        "/dynamic_loading/1": "dynamic_loading_1",
+        "/dynamic_loading/2": "dynamic_loading_2",
+        "/entry_ad": "entry_ad",
+        "/exit_intent": "exit_intent",
+        "/download": "download",
+        "/upload": "upload",
+        "/floating_menu": "floating_menu",
+        "/login": "login",
+        "/secure": "secure",
+        "/logout": "logout",
+        "/geolocation": "geolocation",
+        "/horizontal_slider": "horizontal_slider",
+        "/hovers": "hovers",
+        "/jqueryui": "jqueryui",
+        "/jqueryui/menu": "jqueryui_menu",
+    }
+
+    @property
+    def site(self) -> LocalSite:
+        return self.server.site
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    # ---------------------------
+    # Dispatch
+    # ---------------------------
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_HEAD(self):
+        self._dispatch("HEAD")
+
+    def do_POST(self):
+        self._head_only = False
+        path = urlsplit(self.path).path
+        if path == "/authenticate":
+            self._authenticate()
+        elif path == "/upload":
+            self._upload()
+        else:
+            self._send(404, b"Not Found", "text/plain")
+
+    def _dispatch(self, method: str):
+        self._head_only = method == "HEAD"
+        path = unquote(urlsplit(self.path).path)
+        name = self.ROUTES.get(path)
+        if name:
+            getattr(self, f"_page_{name}", lambda: self._send(200, self.site.render(name)))()
+        elif path.lstrip("/") in self.site.images:
+            self._send_image(path.lstrip("/"))
+        elif path.startswith("/download/") and path[len("/download/"):] in self.site.files:
+            self._send_file(path[len("/download/"):])
+        else:
+            self._send(404, b"Not Found", "text/plain")
+
+    # ---------------------------
+    # Responses
+    # ---------------------------
+    def _send(self, status: int, body: bytes, content_type: str = "text/html; charset=utf-8",
+              headers: Optional[dict] = None, cache: bool = False):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "max-age=3600" if cache else "no-store")
+        for key, value in (headers or {}).items():
+            for item in value if isinstance(value, list) else [value]:
+                self.send_header(key, item)
+        self.end_headers()
+        if not getattr(self, "_head_only", False):
+            self.wfile.write(body)
+
+    def _send_image(self, name: str):
+        body = self.site.images[name]
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        if self.headers.get("If-None-Match") == etag:
+            self._send(304, b"", "image/png", {"ETag": etag}, cache=True)
+        else:
+            self._send(200, body, "image/png", {"ETag": etag}, cache=True)
+
+    def _send_file(self, name: str):
+        filename = quote(os.path.basename(name))
+        self._send(200, self.site.files[name], "application/octet-stream",
+                   {"Content-Disposition": f"attachment; filename*=UTF-8''{filename}"})
+
+    def _redirect(self, location: str, cookies: Optional[list] = None):
+        self._send(303, b"", "text/plain", {"Location": location, "Set-Cookie": cookies or []})
+
+    def _cookies(self) -> SimpleCookie:
+        return SimpleCookie(self.headers.get("Cookie", ""))
+
+    def _body(self) -> bytes:
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    # ---------------------------
+    # Randomised pages
+    # ---------------------------
+    def _page_abtest(self):
+        heading = random.choice(["A/B Test Control", "A/B Test Variation 1"])
+        self._send(200, self.site.render("abtest", heading=heading))
+
+    def _page_challenging_dom(self):
+        labels = random.sample(["foo", "bar", "baz", "qux"], 3)
+        ids = [secrets.token_hex(8) for _ in range(3)]
+        self._send(200, self.site.render(
+            "challenging_dom",
+            id1=ids[0], id2=ids[1], id3=ids[2],
+            label1=labels[0], label2=labels[1], label3=labels[2],
+            answer=random.randint(10000, 99999),
+        ))
+
+    def _page_disappearing_elements(self):
+        links = [("Home", "/"), ("About", "/about/"), ("Contact Us", "/contact-us/"), ("Portfolio", "/portfolio/")]
+        if random.random() < 0.5:
+            links.append(("Gallery", "/gallery/"))
+        items = "\n".join(f'    <li><a href="{href}">{text}</a></li>' for text, href in links)
+        self._send(200, self.site.render("disappearing_elements", items=items))
+
+    def _page_dynamic_content(self):
+        rows = "\n".join(
+            '    <div class="row">\n'
+            '      <div class="large-2 columns">'
+            f'<img src="/img/avatars/Original-Facebook-Geek-Profile-Avatar-{random.randint(1, 7)}.jpg"></div>\n'
+            f'      <div class="large-10 columns">{_lorem(random.randint(20, 40))}</div>\n'
+            '    </div>'
+            for _ in range(3)
+        )
+        self._send(200, self.site.render("dynamic_content", rows=rows))
+
+    # ---------------------------
+    # Static pages with generated content
+    # ---------------------------
+    def _page_dynamic_controls(self):
+        self._send(200, self.site.render("dynamic_controls", loading_ms=self.site.loading_ms))
+
+    def _page_dynamic_loading_1(self):
+        self._send(200, self.site.render("dynamic_loading_1", loading_ms=self.site.loading_ms))
+
+    def _page_dynamic_loading_2(self):
+        self._send(200, self.site.render("dynamic_loading_2", loading_ms=self.site.loading_ms))
+
+    def _page_download(self):
+        links = "\n".join(
+            f'  <a href="download/{html.escape(name)}">{html.escape(name)}</a><br>' for name in self.site.download_names()
+        )
+        self._send(200, self.site.render("download", links=links))
+
+    def _page_floating_menu(self):
+        paragraphs = "\n".join(f"    <p>{_lorem(80)}</p>" for _ in range(20))
+        self._send(200, self.site.render("floating_menu", paragraphs=paragraphs))
+
+    def _page_hovers(self):
+        figures = "\n".join(
+            '  <div class="figure">\n'
+            '    <img src="/img/avatar-blank.jpg" alt="User Avatar">\n'
+            f'    <div class="figcaption"><h5>name: user{n}</h5><a href="/users/{n}">View profile</a></div>\n'
+            '  </div>'
+            for n in range(1, 4)
+        )
+        self._send(200, self.site.render("hovers", figures=figures))
+
+    # ---------------------------
+    # HTTP authentication
+    # ---------------------------
+    def _page_basic_auth(self):
+        header = self.headers.get("Authorization", "")
+        if header.startswith("Basic "):
+            try:
+                username, _, password = base64.b64decode(header[6:]).decode().partition(":")
+            except ValueError:
+                username = password = None
+            if (username, password) == BASIC_AUTH:
+                self._send(200, self.site.render("auth_success", heading="Basic Auth"))
+                return
+        self._send(401, b"Not authorized", "text/plain",
+                   {"WWW-Authenticate": 'Basic realm="Restricted Area"'})
+
+    def _page_digest_auth(self):
+        header = self.headers.get("Authorization", "")
+        if header.startswith("Digest ") and self._digest_valid(header[7:]):
+            self._send(200, self.site.render("auth_success", heading="Digest Auth"))
+            return
+        nonce = secrets.token_hex(16)
+        with self.site.lock:
+            self.site.nonces.add(nonce)
+        challenge = f'Digest realm="{DIGEST_REALM}", qop="auth", algorithm=MD5, nonce="{nonce}", opaque="{secrets.token_hex(8)}"'
+        self._send(401, b"Not authorized", "text/plain", {"WWW-Authenticate": challenge})
+
+    def _digest_valid(self, header: str) -> bool:
+        fields = {key: quoted or bare for key, quoted, bare in re.findall(r'(\w+)=(?:"([^"]*)"|([^,\s]*))', header)}
+        if fields.get("username") != BASIC_AUTH[0] or fields.get("nonce") not in self.site.nonces:
+            return False
+
+        def md5(text):
+            return hashlib.md5(text.encode()).hexdigest()
+
+        ha1 = md5(f"{BASIC_AUTH[0]}:{DIGEST_REALM}:{BASIC_AUTH[1]}")
+        ha2 = md5(f"{self.command}:{fields.get('uri', '')}")
+        if fields.get("qop"):
+            expected = md5(f"{ha1}:{fields['nonce']}:{fields.get('nc')}:{fields.get('cnonce')}:{fields['qop']}:{ha2}")
+        else:
+            expected = md5(f"{ha1}:{fields['nonce']}:{ha2}")
+        return secrets.compare_digest(expected, fields.get("response", ""))
+
+    # ---------------------------
+    # Form authentication
+    # ---------------------------
+    def _flash(self) -> tuple:
+        morsel = self._cookies().get("flash")
+        kind, _, message = unquote(morsel.value if morsel else "").partition(":")
+        if not message:
+            return "", []
+        markup = (
+            f'<div id="flash" class="flash {kind}">\n'
+            f'  {html.escape(message)}\n'
+            '  <a href="#" class="close">×</a>\n'
+            '</div>'
+        )
+        return markup, ["flash=; Path=/; Max-Age=0"]
+
+    @staticmethod
+    def _flash_cookie(kind: str, message: str) -> str:
+        return f"flash={quote(f'{kind}:{message}')}; Path=/"
+
+    def _session(self) -> Optional[str]:
+        morsel = self._cookies().get("session")
+        return morsel.value if morsel and morsel.value in self.site.sessions else None
+
+    def _page_login(self):
+        flash, cookies = self._flash()
+        self._send(200, self.site.render("login", flash=flash), headers={"Set-Cookie": cookies})
+
+    def _page_secure(self):
+        if not self._session():
+            self._redirect("/login", [self._flash_cookie("error", "You must login to view the secure area!")])
+            return
+        flash, cookies = self._flash()
+        self._send(200, self.site.render("secure", flash=flash), headers={"Set-Cookie": cookies})
+
+    def _page_logout(self):
+        session = self._session()
+        if session:
+            with self.site.lock:
+                self.site.sessions.discard(session)
+        self._redirect("/login", [
+            "session=; Path=/; Max-Age=0",
+            self._flash_cookie("success", "You logged out of the secure area!"),
+        ])
+
+    def _authenticate(self):
+        form = parse_qs(self._body().decode())
+        username = form.get("username", [""])[0]
+        password = form.get("password", [""])[0]
+        if username != FORM_AUTH[0]:
+            self._redirect("/login", [self._flash_cookie("error", "Your username is invalid!")])
+        elif password != FORM_AUTH[1]:
+            self._redirect("/login", [self._flash_cookie("error", "Your password is invalid!")])
+        else:
+            session = secrets.token_hex(16)
+            with self.site.lock:
+                self.site.sessions.add(session)
+            self._redirect("/secure", [
+                f"session={session}; Path=/; HttpOnly",
+                self._flash_cookie("success", "You logged into a secure area!"),
+            ])
+
+    # ---------------------------
+    # Upload
+    # ---------------------------
+    def _upload(self):
+        content_type = self.headers.get("Content-Type", "")
+        body = self._body()
+        message = BytesParser(policy=policy.HTTP).parsebytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode() + body
+        )
+        filename = None
+        if message.is_multipart():
+            for part in message.iter_parts():
+                if part.get_param("name", header="content-disposition") == "file" and part.get_filename():
+                    filename = part.get_filename()
+        if not filename:
+            self._send(500, b"Internal Server Error", "text/plain")
+            return
+        self._send(200, self.site.render("uploaded", filename=html.escape(filename)))
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve the local stand-in for the-internet pages.")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--loading_ms", type=int, default=500)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    site = LocalSite(port=args.port, loading_ms=args.loading_ms)
+    site.start()
+    try:
+        site._thread.join()
+    except KeyboardInterrupt:
+        site.stop()
@@ -0,0 +1,145 @@
+import logging
+from typing import Callable, Optional
+
+from selenium.common import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+logger = logging.getLogger(__name__)
+
+RESTORES = ("snapshot", "reload")
+
+# Hash of the page's markup: changes when elements, attributes or classes change, but not when
+# form controls are edited (their values live in properties).
+MARKUP_HASH = """
+const markupHash = () => {
+    const html = document.documentElement.outerHTML;
+    let hash = 0;
+    for (let i = 0; i < html.length; i++) {
+        hash = (hash * 31 + html.charCodeAt(i)) | 0;
+    }
+    return hash;
+};
+"""
+
+# State of the page a test can change without replacing the document: form controls and scroll
+# position, plus the markup hash to detect any other change.
+CAPTURE_STATE_SCRIPT = MARKUP_HASH + """
+const controls = Array.from(document.querySelectorAll('input, select, textarea'));
+return {
+    url: location.href,
+    markup: markupHash(),
+    scroll: [window.scrollX, window.scrollY],
+    controls: controls.map(c => ({
+        value: c.value,
+        checked: c.checked,
+        selectedIndex: c.tagName === 'SELECT' ? c.selectedIndex : null
+    }))
+};
+"""
+
+# Put the captured state back; false when the document has changed beyond what it can restore.
+RESTORE_STATE_SCRIPT = MARKUP_HASH + """
+const state = arguments[0];
+const controls = Array.from(document.querySelectorAll('input, select, textarea'));
+if (location.href !== state.url
+        || markupHash() !== state.markup
+        || controls.length !== state.controls.length) {
+    return false;
+}
+controls.forEach((c, i) => {
+    const saved = state.controls[i];
+    if (c.type !== 'file') {
+        c.value = saved.value;
+    }
+    c.checked = saved.checked;
+    if (saved.selectedIndex !== null) {
+        c.selectedIndex = saved.selectedIndex;
+    }
+});
+window.scrollTo(state.scroll[0], state.scroll[1]);
+return true;
+"""
+
+
+class PageSession:
+    """
+    PageSession opens a page once for every test of a class. Tests marked 'readonly' use the page
+    as they find it; after a test marked 'mutating' (or unmarked) the page is restored before the
+    next test uses it: from a snapshot of its form controls and scroll position taken when it was
+    opened, or by loading its URL again when the snapshot cannot undo the change (navigation,
+    changed markup) or restore='reload'.
+
+    The session only lives in the worker that runs the class (see the page_session fixture), so
+    under xdist every worker opens its own page and no state crosses processes.
+    """
+
+    def __init__(self, driver: WebDriver, restore: str = "snapshot"):
+        """
+        Initialize the PageSession.
+
+        :param driver: WebDriver shared by the tests of the class.
+        :param restore: 'snapshot' or 'reload'.
+        :raises ValueError: If the restore strategy is unknown.
+        """
+        if restore not in RESTORES:
+            raise ValueError(f"Unknown page restore '{restore}', expected one of {RESTORES}")
+        self.driver = driver
+        self.restore = restore
+        self.url = None
+        self._page = None
+        self._snapshot = None
+        self._mutating = True
+        self.dirty = False
+        self.stats = {"opens": 0, "reuses": 0, "snapshot_restores": 0, "reloads": 0}
+
+    def begin(self, mutating: bool):
+        """
+        Start a test on the session.
+
+        :param mutating: False for tests marked 'readonly'.
+        """
+        self._mutating = mutating
+
+    def end(self):
+        """
+        Finish the current test; the page needs restoring if the test could have changed it.
+        """
+        if self._mutating:
+            self.dirty = True
+
+    def page(self, open_page: Callable[[], object]):
+        """
+        Get the page object of the session, in the state it was opened in.
+
+        :param open_page: Opens the page and returns its page object; only called for the first test.
+        :return: The page object.
+        """
+        if self._page is None:
+            self._page = open_page()
+            self.url = self.driver.current_url
+            self._snapshot = self._capture() if self.restore == "snapshot" else None
+            self.stats["opens"] += 1
+        elif self.dirty or self.driver.current_url != self.url:
+            self._restore()
+        else:
+            self.stats["reuses"] += 1
+        self.dirty = False
+        return self._page
+
+    def _capture(self) -> Optional[dict]:
+        try:
+            return self.driver.execute_script(CAPTURE_STATE_SCRIPT)
+        except WebDriverException as e:
+            logger.warning(f"Could not snapshot {self.url}, restoring by reload: {e.msg}")
+            return None
+
+    def _restore(self):
+        if self._snapshot is not None:
+            try:
+                if self.driver.execute_script(RESTORE_STATE_SCRIPT, self._snapshot):
+                    self.stats["snapshot_restores"] += 1
+                    return
+            except WebDriverException:
+                pass
+        self.driver.get(self.url)
+        self.stats["reloads"] += 1
@@ -0,0 +1,133 @@
+import hashlib
+import io
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from Utilities.WorkerArtifacts import REPORTS_DIR
+
+logger = logging.getLogger(__name__)
+
+# Content-addressed store shared by all workers: one file per distinct screenshot.
+SCREENSHOTS_DIR = os.path.join(REPORTS_DIR, "screenshots")
+
+# Size the report shows screenshots at.
+THUMBNAIL_SIZE = (304, 228)
+
+
+class Screenshot(NamedTuple):
+    """
+    Files of a captured screenshot; they exist once the writer has flushed.
+    """
+    sha256: str
+    full_path: str
+    thumbnail_path: str
+
+
+class ScreenshotWriter:
+    """
+    ScreenshotWriter takes screenshots without writing them on the test's thread: the PNG is
+    grabbed from the browser, and hashing, thumbnail encoding and writing run in a thread pool.
+    Screenshots are stored by content hash, so identical screenshots (e.g. the same error page
+    failing many tests) are written once. The thumbnail is a small WebP made with Pillow; without
+    Pillow the report shows the full PNG instead.
+    """
+
+    def __init__(self, directory: str = SCREENSHOTS_DIR, max_workers: int = 2, thumbnail_size=THUMBNAIL_SIZE):
+        """
+        Initialize the ScreenshotWriter.
+
+        :param directory: Store directory of the screenshots.
+        :param max_workers: Threads encoding and writing screenshots.
+        :param thumbnail_size: Bounding box of the thumbnails in pixels.
+        """
+        self.directory = directory
+        self.thumbnail_size = thumbnail_size
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="screenshot")
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._written = set()
+        self.index = {}
+        self.stats = {"captured": 0, "written": 0, "deduplicated": 0, "bytes": 0, "failed": 0}
+        try:
+            # Imported lazily: Pillow is only needed for thumbnails.
+            from PIL import Image
+            self._image = Image
+        except ImportError:
+            logger.info("Pillow is not installed, screenshots are shown without thumbnails")
+            self._image = None
+
+    def capture(self, driver: WebDriver, key: str) -> Screenshot:
+        """
+        Grab a screenshot and queue it for writing.
+
+        :param driver: WebDriver to take the screenshot from.
+        :param key: Name the screenshot is indexed under, e.g. '<nodeid>::call'.
+        :return: Screenshot with the paths the files are written to.
+        """
+        png = driver.get_screenshot_as_png()
+        sha256 = hashlib.sha256(png).hexdigest()
+        full_path = os.path.join(self.directory, f"{sha256}.png")
+        thumbnail_path = os.path.join(self.directory, f"{sha256}.thumb.webp") if self._image else full_path
+        screenshot = Screenshot(sha256, full_path, thumbnail_path)
+
+        with self._lock:
+            self.stats["captured"] += 1
+            self.index[key] = sha256
+            if sha256 in self._written or sha256 in self._pending:
+                self.stats["deduplicated"] += 1
+                return screenshot
+            self._pending[sha256] = self._executor.submit(self._write, screenshot, png)
+        return screenshot
+
+    def _write(self, screenshot: Screenshot, png: bytes):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            written = 0
+            # Another worker may already have stored the same screenshot.
+            if not os.path.exists(screenshot.full_path):
+                written += self._write_atomic(screenshot.full_path, png)
+            if screenshot.thumbnail_path != screenshot.full_path and not os.path.exists(screenshot.thumbnail_path):
+                with self._image.open(io.BytesIO(png)) as image:
+                    image.thumbnail(self.thumbnail_size)
+                    buffer = io.BytesIO()
+                    image.save(buffer, format="WEBP", quality=60, method=4)
+                written += self._write_atomic(screenshot.thumbnail_path, buffer.getvalue())
+            with self._lock:
+                self.stats["written"] += 1
+                self.stats["bytes"] += written
+        except Exception as e:
+            logger.warning(f"Could not write screenshot {screenshot.sha256}: {e}")
+            with self._lock:
+                self.stats["failed"] += 1
+        finally:
+            with self._lock:
+                self._pending.pop(screenshot.sha256, None)
+                self._written.add(screenshot.sha256)
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes) -> int:
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+        return len(data)
+
+    def flush(self):
+        """
+        Wait until every queued screenshot is written.
+        """
+        with self._lock:
+            pending = list(self._pending.values())
+        for future in pending:
+            future.result()
+
+    def close(self):
+        """
+        Write the remaining screenshots and stop the threads.
+        """
+        self._executor.shutdown(wait=True)
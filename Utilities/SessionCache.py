@@ -0,0 +1,121 @@
+import logging
+import threading
+import time
+from typing import Callable, NamedTuple
+from urllib.parse import urlsplit
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from Utilities import DevTools
+
+logger = logging.getLogger(__name__)
+
+# Cookies that only carry a one-shot message and must not be replayed with a session.
+SKIPPED_COOKIES = ("flash",)
+
+
+class CachedSession(NamedTuple):
+    """
+    Cookie snapshot of a logged-in browser.
+    """
+    origin: str
+    cookies: list
+    created_at: float
+
+
+class SessionCache:
+    """
+    SessionCache logs in once per worker and replays the session cookies into every browser that
+    needs a logged-in page, instead of filling the login form again.
+
+    Cached sessions are validated lazily, when they are used: if the page does not open logged in
+    (e.g. the server expired the session), the entry is dropped and the login runs again. Callers
+    invalidate the entry when they log out.
+    """
+
+    def __init__(self):
+        self._sessions = {}
+        self._lock = threading.Lock()
+        self.stats = {"logins": 0, "restores": 0, "invalidations": 0}
+
+    def open(self, driver: WebDriver, url: str, key: str, login: Callable[[], None],
+             is_logged_in: Callable[[], bool]) -> bool:
+        """
+        Open a page that needs a logged-in session, restoring the cached session when there is one.
+
+        :param driver: WebDriver to open the page in.
+        :param url: URL of the logged-in page.
+        :param key: Cache key, e.g. the user name.
+        :param login: Logs in through the UI and leaves the browser on the logged-in page.
+        :param is_logged_in: Tells whether the browser is on the page, logged in.
+        :return: True if the page is open and logged in.
+        """
+        origin = self._origin(url)
+        with self._lock:
+            session = self._sessions.get((origin, key))
+
+        if session is not None:
+            self._restore(driver, session)
+            driver.get(url)
+            if is_logged_in():
+                with self._lock:
+                    self.stats["restores"] += 1
+                return True
+            logger.info(f"Cached session of '{key}' on {origin} is no longer valid, logging in again")
+            self.invalidate(url, key)
+
+        login()
+        with self._lock:
+            self.stats["logins"] += 1
+        if not is_logged_in():
+            return False
+        cookies = [c for c in driver.get_cookies() if c["name"] not in SKIPPED_COOKIES]
+        with self._lock:
+            self._sessions[(origin, key)] = CachedSession(origin, cookies, time.time())
+        return True
+
+    def invalidate(self, url: str, key: str):
+        """
+        Drop a cached session, e.g. after logging out.
+
+        :param url: Any URL on the site of the session.
+        :param key: Cache key the session was stored under.
+        """
+        with self._lock:
+            if self._sessions.pop((self._origin(url), key), None) is not None:
+                self.stats["invalidations"] += 1
+
+    @staticmethod
+    def _origin(url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.hostname}{f':{parts.port}' if parts.port else ''}"
+
+    @staticmethod
+    def _restore(driver: WebDriver, session: CachedSession):
+        # Network.setCookies works before the first navigation to the site; without CDP the
+        # site's origin has to be loaded before WebDriver accepts its cookies.
+        if DevTools.supports_cdp(driver):
+            cookies = []
+            for cookie in session.cookies:
+                cdp_cookie = {
+                    "name": cookie["name"],
+                    "value": cookie["value"],
+                    "url": session.origin,
+                    "path": cookie.get("path", "/"),
+                    "secure": cookie.get("secure", False),
+                    "httpOnly": cookie.get("httpOnly", False),
+                }
+                if "sameSite" in cookie:
+                    cdp_cookie["sameSite"] = cookie["sameSite"]
+                if "expiry" in cookie:
+                    cdp_cookie["expires"] = cookie["expiry"]
+                cookies.append(cdp_cookie)
+            driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+        else:
+            driver.get(session.origin + "/")
+            for cookie in session.cookies:
+                driver.add_cookie(cookie)
+
+
+# Shared by all page objects of the process (one per xdist worker).
+sessions = SessionCache()
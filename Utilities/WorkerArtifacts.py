@@ -0,0 +1,151 @@
+import json
+import logging
+import os
+import shutil
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPORTS_DIR = os.path.join(PROJECT_ROOT, "reports")
+WORKERS_DIR = os.path.join(REPORTS_DIR, "workers")
+
+
+def worker_id(config) -> str:
+    """
+    Get the pytest-xdist worker id of the current process.
+
+    :param config: Pytest config object.
+    :return: Worker id such as 'gw3', or 'master' when not running under xdist.
+    """
+    return getattr(config, "workerinput", {}).get("workerid", "master")
+
+
+def is_controller(config) -> bool:
+    """
+    Check if the current process is the xdist controller (or a plain, non-distributed run).
+
+    :param config: Pytest config object.
+    :return: True for the controller process, False for xdist workers.
+    """
+    return not hasattr(config, "workerinput")
+
+
+def sanitize_nodeid(nodeid: str) -> str:
+    """
+    Build a file-system safe name from a test nodeid.
+
+    :param nodeid: Pytest nodeid.
+    :return: Sanitized name.
+    """
+    return nodeid.replace("::", "_").replace("/", "_").replace("\\", "_").replace(" ", "_")
+
+
+def worker_dir(config) -> str:
+    """
+    Get the private artifacts directory of the current worker.
+
+    :param config: Pytest config object.
+    :return: Absolute path of reports/workers/<worker_id>.
+    """
+    return os.path.join(WORKERS_DIR, worker_id(config))
+
+
+def artifact_dir_for_test(config, nodeid: str, kind: str) -> str:
+    """
+    Get (and create) the directory holding one kind of artifact for a single test.
+
+    :param config: Pytest config object.
+    :param nodeid: Pytest nodeid of the test.
+    :param kind: Artifact kind, e.g. 'downloads' or 'screenshots'.
+    :return: Absolute path of reports/workers/<worker_id>/<kind>/<test>.
+    """
+    path = os.path.join(worker_dir(config), kind, sanitize_nodeid(nodeid))
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def report_relative_path(path: str) -> str:
+    """
+    Build a link to an artifact that is valid from the HTML report in the reports directory.
+
+    :param path: Absolute path of the artifact.
+    :return: Path relative to the reports directory, with forward slashes.
+    """
+    return os.path.relpath(path, REPORTS_DIR).replace(os.sep, "/")
+
+
+def reset_reports_dir():
+    """
+    Remove the previous run's reports and create a fresh layout. Only the controller may call this.
+    """
+    if os.path.exists(REPORTS_DIR):
+        logger.info(f"Removing existing reports directory: {REPORTS_DIR}")
+        shutil.rmtree(REPORTS_DIR)
+    os.makedirs(WORKERS_DIR, exist_ok=True)
+
+
+def write_worker_json(config, name: str, data: dict):
+    """
+    Persist worker-local data so the controller can merge it at the end of the session.
+
+    :param config: Pytest config object.
+    :param name: File name without extension.
+    :param data: JSON-serializable data.
+    """
+    path = os.path.join(worker_dir(config), f"{name}.json")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+
+def read_worker_json(name: str) -> dict:
+    """
+    Read a JSON file written by every worker with write_worker_json.
+
+    :param name: File name without extension.
+    :return: Dict of worker id to the data that worker wrote.
+    """
+    data = {}
+    if not os.path.isdir(WORKERS_DIR):
+        return data
+    for worker in sorted(os.listdir(WORKERS_DIR)):
+        path = os.path.join(WORKERS_DIR, worker, f"{name}.json")
+        if os.path.isfile(path):
+            with open(path) as f:
+                data[worker] = json.load(f)
+    return data
+
+
+def merge_worker_artifacts() -> dict:
+    """
+    Merge the per-worker artifact trees into a single index at reports/artifacts.json.
+
+    :return: Dict of artifact kind to {test directory: [report-relative file paths]}.
+    """
+    index = {}
+    if not os.path.isdir(WORKERS_DIR):
+        return index
+
+    for worker in sorted(os.listdir(WORKERS_DIR)):
+        base = os.path.join(WORKERS_DIR, worker)
+        for kind in sorted(os.listdir(base)):
+            kind_dir = os.path.join(base, kind)
+            if not os.path.isdir(kind_dir):
+                continue
+            for test_dir in sorted(os.listdir(kind_dir)):
+                test_path = os.path.join(kind_dir, test_dir)
+                # Files next to the per-test directories, e.g. downloads of a browser that kept its
+                # launch-time download directory (grid or non-CDP sessions), belong to no test.
+                if not os.path.isdir(test_path):
+                    continue
+                files = [
+                    report_relative_path(os.path.join(test_path, f))
+                    for f in sorted(os.listdir(test_path))
+                    if os.path.isfile(os.path.join(test_path, f))
+                ]
+                if files:
+                    index.setdefault(kind, {}).setdefault(test_dir, []).extend(files)
+
+    with open(os.path.join(REPORTS_DIR, "artifacts.json"), "w") as f:
+        json.dump(index, f, indent=2)
+    return index
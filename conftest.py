@@ -1,10 +1,25 @@
 import os
+import json
 import logging
 import pytest
 from selenium import webdriver
 from selenium.webdriver.remote.webdriver import WebDriver
 from typing import Generator
 
+from PageObject.BasePage import BasePage
+from PageObject.LandingPage import LandingPage
+from Utilities import WorkerArtifacts
+from Utilities import BrowserContexts
+from Utilities.BrowserContexts import ContextHost, ContextPool
+from Utilities.BrowserPool import BrowserPool
+from Utilities.BrowserProfile import BrowserProfile
+from Utilities.CommandRecorder import CommandRecorder
+from Utilities.DurationScheduler import DurationHistory, DurationScheduling, ScheduleTracker, HISTORY_PATH
+from Utilities.HttpCassette import HttpCassette, CASSETTES_DIR
+from Utilities.LocalSite import LocalSite
+from Utilities.PageSession import PageSession
+from Utilities.ScreenshotWriter import ScreenshotWriter
+
 # Configure logging once at the module level
 logging.basicConfig(
     level=logging.INFO,
@@ -23,127 +38,635 @@ def pytest_addoption(parser):
         default="false",
         help="Use Selenium Grid: true or false"
     )
+    parser.addoption(
+        "--pool_size",
+        action="store",
+        default="1",
+        help="Number of warm browsers kept per worker"
+    )
+    parser.addoption(
+        "--max_browser_uses",
+        action="store",
+        default="25",
+        help="Recycle a pooled browser after this many tests (0 = never)"
+    )
+    parser.addoption(
+        "--command_budget",
+        action="store",
+        default="0",
+        help="Fail tests that send more WebDriver commands than this (0 = no budget)"
+    )
+    parser.addoption(
+        "--time_budget",
+        action="store",
+        default="0",
+        help="Fail tests that spend more seconds in WebDriver commands and waits than this (0 = no budget)"
+    )
+    parser.addoption(
+        "--base_url",
+        action="store",
+        default=BasePage.base_url,
+        help="Root URL of the site under test"
+    )
+    parser.addoption(
+        "--navigation",
+        action="store",
+        default="direct",
+        help="How LandingPage.go_to_* reaches pages: direct (open the URL) or click (load the landing page and click)"
+    )
+    parser.addoption(
+        "--local_site",
+        action="store",
+        default="false",
+        help="Serve the bundled local stand-in site (one per worker) instead of --base_url: true or false"
+    )
+    parser.addoption(
+        "--local_site_loading_ms",
+        action="store",
+        default="500",
+        help="Duration of the loading phase on the local dynamic loading/controls pages"
+    )
+    parser.addoption(
+        "--http_cassette",
+        action="store",
+        default="off",
+        help="Record browser HTTP traffic into the cassette store, or replay it without network: off, record or replay"
+    )
+    parser.addoption(
+        "--cassette_dir",
+        action="store",
+        default=CASSETTES_DIR,
+        help="Directory of the HTTP cassette store"
+    )
+    parser.addoption(
+        "--cassette_max_age_days",
+        action="store",
+        default="30",
+        help="Report recorded responses older than this many days as stale"
+    )
+    parser.addoption(
+        "--browser_profile",
+        action="store",
+        default="default",
+        help="Browser profile: default (headed, maximized) or throughput (headless, eager page loads, trimmed for CI)"
+    )
+    parser.addoption(
+        "--implicit_wait",
+        action="store",
+        default="0",
+        help="Implicit wait of the browsers in seconds (0 = element lookups never block; page objects wait explicitly)"
+    )
+    parser.addoption(
+        "--absence_timeout",
+        action="store",
+        default="0",
+        help="Seconds a presence/visibility check waits for the element before answering False"
+    )
+    parser.addoption(
+        "--browser_mode",
+        action="store",
+        default="browser",
+        help="What a test gets: browser (a pooled browser per worker) or context (an isolated browser context in one Chrome shared by all workers)"
+    )
+    parser.addoption(
+        "--page_restore",
+        action="store",
+        default="snapshot",
+        help="How page_session restores the shared page after a mutating test: snapshot (form state, reload as fallback) or reload"
+    )
+    parser.addoption(
+        "--scheduler",
+        action="store",
+        default="xdist",
+        help="How xdist distributes tests: xdist (its --dist mode) or duration (page object units, longest expected duration first)"
+    )
+    parser.addoption(
+        "--duration_history",
+        action="store",
+        default=HISTORY_PATH,
+        help="File of the test durations of previous runs, used by --scheduler duration"
+    )
 
 # ---------------------------
 # Pre-test Session Setup
 # ---------------------------
+@pytest.hookimpl(tryfirst=True)
 def pytest_sessionstart(session):
     """
-    Called before test session starts — cleans up previous reports.
+    Called before test session starts — the controller cleans up previous reports,
+    every worker creates its own artifacts directory.
     """
-    reports_dir = os.path.join(os.path.dirname(__file__), "reports")
+    config = session.config
+    if WorkerArtifacts.is_controller(config):
+        WorkerArtifacts.reset_reports_dir()
+        logger.info("✅ Fresh reports directory created.")
+        if config.getoption("http_cassette") == "record":
+            HttpCassette.clear(config.getoption("cassette_dir"))
+        config._duration_history = DurationHistory(config.getoption("duration_history"))
+        config._schedule_tracker = ScheduleTracker(config._duration_history)
+        config.pluginmanager.register(config._schedule_tracker, "schedule_tracker")
 
-    if os.path.exists(reports_dir):
-        logger.info(f"Removing existing reports directory: {reports_dir}")
-        import shutil
-        shutil.rmtree(reports_dir)
+    os.makedirs(WorkerArtifacts.worker_dir(config), exist_ok=True)
+    config._screenshot_writer = ScreenshotWriter()
+
+    if WorkerArtifacts.is_controller(config) and config.getoption("browser_mode") == "context":
+        if config.getoption("http_cassette") != "off" or config.getoption("use_grid").strip().lower() == "true":
+            raise pytest.UsageError("--browser_mode context is not supported together with --http_cassette or --use_grid")
+        profile = BrowserProfile(config.getoption("browser_profile"), cache_name="context-host")
+        config._context_host = ContextHost(_create_driver(config, profile))
+        logger.info(f"Browser context host listening on {config._context_host.debugger_address}")
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """
+    xdist hook: with --scheduler duration, distribute the tests with the DurationScheduling.
+    """
+    if config.getoption("scheduler") != "duration":
+        return None
+    config._duration_scheduler = DurationScheduling(config, log, config._duration_history)
+    return config._duration_scheduler
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """
+    xdist hook: tells every worker where the shared browser context host is.
+    """
+    host = getattr(node.config, "_context_host", None)
+    if host:
+        node.workerinput["context_host"] = host.describe()
+
+# ---------------------------
+# Post-test Session Merge
+# ---------------------------
+def pytest_sessionfinish(session):
+    """
+    Workers finish writing their screenshots and persist their browser pool stats and command metrics;
+    the controller merges every worker's artifacts into reports/artifacts.json and the command metrics
+    into reports/command_metrics.json.
+    """
+    config = session.config
+    writer = config._screenshot_writer
+    writer.close()
+    if writer.index:
+        WorkerArtifacts.write_worker_json(config, "screenshots", {"stats": writer.stats, "tests": writer.index})
+    pool = getattr(config, "_browser_pool", None)
+    if pool:
+        WorkerArtifacts.write_worker_json(config, "browser_pool", pool.summary())
+    recorder = getattr(config, "_command_recorder", None)
+    if recorder:
+        WorkerArtifacts.write_worker_json(config, "command_metrics", recorder.tests)
+    cassette = getattr(config, "_http_cassette", None)
+    if cassette:
+        WorkerArtifacts.write_worker_json(config, "http_cassette", cassette.report())
+
+    if WorkerArtifacts.is_controller(config):
+        index = WorkerArtifacts.merge_worker_artifacts()
+        logger.info(f"Merged artifacts: { {kind: len(tests) for kind, tests in index.items()} }")
+        _merge_command_metrics()
+        _merge_cassette_reports()
+        _write_schedule_report(config)
+        host = getattr(config, "_context_host", None)
+        if host:
+            host.quit()
+
+def _merge_command_metrics():
+    """
+    Combine every worker's per-test command metrics into reports/command_metrics.json.
+    """
+    tests = {}
+    for worker, worker_tests in WorkerArtifacts.read_worker_json("command_metrics").items():
+        for nodeid, summary in worker_tests.items():
+            tests[nodeid] = dict(summary, worker=worker)
+    if not tests:
+        return
+    metrics = {
+        "totals": {
+            "tests": len(tests),
+            "commands": sum(t["commands"] for t in tests.values()),
+            "command_seconds": round(sum(t["command_seconds"] for t in tests.values()), 4),
+            "wait_seconds": round(sum(t["wait_seconds"] for t in tests.values()), 4),
+            "stall_seconds": round(sum(t["implicit_wait_stalls"]["seconds"] for t in tests.values()), 4),
+        },
+        "pages": CommandRecorder.page_summary(tests),
+        "implicit_wait_stalls": CommandRecorder.stall_report(tests),
+        "tests": tests,
+    }
+    with open(os.path.join(WorkerArtifacts.REPORTS_DIR, "command_metrics.json"), "w") as f:
+        json.dump(metrics, f, indent=2)
+
+def _merge_cassette_reports():
+    """
+    Combine every worker's HTTP cassette report into reports/cassette_report.json.
+    A recorded URL is unused only if no worker replayed it.
+    """
+    reports = WorkerArtifacts.read_worker_json("http_cassette")
+    if not reports:
+        return
+    merged = {"workers": reports}
+    for key in ("recorded", "hits", "misses"):
+        merged[key] = sum(report[key] for report in reports.values())
+    for key in ("stale_urls", "missed_urls"):
+        merged[key] = sorted(set().union(*(report[key] for report in reports.values())))
+    unused = [set(report["unused_urls"]) for report in reports.values() if "unused_urls" in report]
+    if unused:
+        merged["unused_urls"] = sorted(set.intersection(*unused))
+    with open(os.path.join(WorkerArtifacts.REPORTS_DIR, "cassette_report.json"), "w") as f:
+        json.dump(merged, f, indent=2)
 
-    os.makedirs(os.path.join(reports_dir, "downloads"), exist_ok=True)
-    os.makedirs(os.path.join(reports_dir, "screenshots"), exist_ok=True)
-    logger.info("✅ Fresh reports directory created.")
+def _write_schedule_report(config):
+    """
+    Add the run's test durations to the duration history, and write the predicted versus actual
+    makespan of the run into reports/schedule_report.json.
+    """
+    config._duration_history.save()
+    tracker = config._schedule_tracker
+    if not tracker.worker_seconds:
+        return
+    config._schedule_report = tracker.report(getattr(config, "_duration_scheduler", None))
+    with open(os.path.join(WorkerArtifacts.REPORTS_DIR, "schedule_report.json"), "w") as f:
+        json.dump(config._schedule_report, f, indent=2)
 
 # ---------------------------
 # Utility: Download Directory Path
 # ---------------------------
-def download_dir() -> str:
+def download_dir(config) -> str:
+    """
+    Returns the absolute path to the current worker's default download directory.
+    Tests get their own sub directory through the browser_instance fixture.
+    """
+    path = os.path.join(WorkerArtifacts.worker_dir(config), "downloads")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+# ---------------------------
+# WebDriver Factory
+# ---------------------------
+def _create_driver(config, profile: BrowserProfile, wire: bool = False) -> WebDriver:
+    """
+    Launch a Selenium WebDriver instance configured for local or grid execution, with the
+    Chrome options of the browser profile.
+    With wire=True the browser is a selenium-wire one, whose traffic goes through a local proxy.
+    """
+    use_grid = config.getoption("use_grid").strip().lower() == "true"
+    grid_url = os.getenv("SELENIUM_REMOTE_URL", "http://localhost:4444/wd/hub")
+
+    if wire and use_grid:
+        raise pytest.UsageError("--http_cassette is not supported together with --use_grid")
+
+    # Grid nodes keep their own disk cache.
+    cache_dir = None if use_grid else profile.acquire_cache_dir()
+    options = profile.chrome_options(download_dir(config), cache_dir)
+
+    try:
+        if wire:
+            # Imported lazily: selenium-wire starts a proxy and is only needed for cassettes.
+            from seleniumwire import webdriver as wire_webdriver
+            driver = wire_webdriver.Chrome(options=options, seleniumwire_options={
+                "disable_encoding": True,
+                "request_storage": "memory",
+                "request_storage_max_size": 100,
+            })
+        else:
+            driver = (
+                webdriver.Remote(command_executor=grid_url, options=options)
+                if use_grid else
+                webdriver.Chrome(options=options)
+            )
+    except Exception:
+        profile.release_cache_dir(cache_dir)
+        raise
+
+    implicit_wait = float(config.getoption("implicit_wait"))
+    if implicit_wait:
+        driver.implicitly_wait(implicit_wait)
+    return profile.attach(driver, cache_dir)
+
+# ---------------------------
+# Site Under Test Fixture
+# ---------------------------
+@pytest.fixture(scope="session", autouse=True)
+def site_url(request) -> Generator[str, None, None]:
+    """
+    Points every page object at the site under test: --base_url, or with --local_site true
+    the bundled stand-in site, started once per worker on a free port. Also selects how
+    LandingPage navigates (--navigation) and how long absence checks wait (--absence_timeout).
+    """
+    config = request.config
+    site = None
+    url = config.getoption("base_url")
+    if config.getoption("local_site").strip().lower() == "true":
+        site = LocalSite(loading_ms=int(config.getoption("local_site_loading_ms")))
+        url = site.start()
+    BasePage.base_url = url if url.endswith("/") else url + "/"
+    LandingPage.navigate_directly = config.getoption("navigation").strip().lower() == "direct"
+    BasePage.absence_timeout = float(config.getoption("absence_timeout"))
+
+    yield BasePage.base_url
+    if site:
+        site.stop()
+
+# ---------------------------
+# Browser Pool Fixture
+# ---------------------------
+@pytest.fixture(scope="session")
+def browser_pool(request) -> Generator[BrowserPool, None, None]:
+    """
+    Keeps warm browsers for the whole session (per xdist worker) and quits them at the end.
+    Every browser is instrumented with the worker's CommandRecorder and, with --http_cassette,
+    records into or replays from the worker's HttpCassette.
+    """
+    config = request.config
+    recorder = CommandRecorder()
+    config._command_recorder = recorder
+
+    cassette = None
+    mode = config.getoption("http_cassette")
+    if mode != "off":
+        cassette = HttpCassette(
+            directory=config.getoption("cassette_dir"),
+            mode=mode,
+            name=WorkerArtifacts.worker_id(config),
+            max_age_days=float(config.getoption("cassette_max_age_days")),
+        ).open()
+        config._http_cassette = cassette
+
+    profile = BrowserProfile(config.getoption("browser_profile"), cache_name=WorkerArtifacts.worker_id(config))
+    config._browser_profile = profile
+    if config.getoption("browser_mode") == "context":
+        pool = _start_context_pool(config)
+    else:
+        pool = _start_pool(config, profile, size=int(config.getoption("pool_size")))
+    config._browser_pool = pool
+
+    yield pool
+    pool.shutdown()
+    if cassette:
+        cassette.close()
+
+@pytest.fixture(scope="session")
+def headed_browser_pool(request, browser_pool) -> Generator[BrowserPool, None, None]:
+    """
+    Headed browsers for the tests marked 'headed' when the browser profile runs headless.
+    Only started when such a test runs.
+    """
+    config = request.config
+    pool = _start_pool(config, config._browser_profile.headed_variant(), size=1)
+
+    yield pool
+    pool.shutdown()
+
+def _start_pool(config, profile: BrowserProfile, size: int) -> BrowserPool:
+    """
+    Start a pool of browsers of the given profile, instrumented with the worker's CommandRecorder
+    and HttpCassette.
+    """
+    recorder = config._command_recorder
+    cassette = getattr(config, "_http_cassette", None)
+
+    def factory():
+        driver = _create_driver(config, profile, wire=cassette is not None)
+        if cassette:
+            cassette.attach(driver)
+        return recorder.attach(driver)
+
+    pool = BrowserPool(factory=factory, size=size, max_uses=int(config.getoption("max_browser_uses")))
+    pool.warm_up()
+    return pool
+
+def _start_context_pool(config) -> ContextPool:
     """
-    Returns the absolute path to the download directory inside reports.
-    Assumes it's already created in pytest_sessionstart.
+    Attach the worker to the browser context host started by the controller (--browser_mode context).
+    Every test then runs in a fresh browser context of that one Chrome.
     """
-    project_root = os.path.dirname(os.path.abspath(__file__))
-    return os.path.join(project_root, "reports", "downloads")
+    workerinput = getattr(config, "workerinput", None)
+    host = workerinput["context_host"] if workerinput else config._context_host.describe()
+    recorder = config._command_recorder
+    implicit_wait = float(config.getoption("implicit_wait"))
+
+    def factory():
+        driver = BrowserContexts.attach(host["debugger_address"])
+        if implicit_wait:
+            driver.implicitly_wait(implicit_wait)
+        return recorder.attach(driver)
+
+    pool = ContextPool(factory=factory, home_handle=host["home_handle"])
+    pool.warm_up()
+    return pool
 
 # ---------------------------
 # WebDriver Fixture
 # ---------------------------
 @pytest.fixture(scope="function")
-def browser_instance(request) -> Generator[WebDriver, None, None]:
+def browser_instance(request, browser_pool) -> Generator[WebDriver, None, None]:
     """
-    Provides a Selenium WebDriver instance configured for local or grid execution.
-    Cleans up after test.
+    Provides a pooled Selenium WebDriver instance for a single test, downloading into
+    a directory private to the test. The browser is reset and returned to the pool after the test.
+    Tests marked 'headed' get a headed browser; block_resources("image", "font") stops the
+    browser from downloading those resources during the test.
     """
-    use_grid = request.config.getoption("use_grid").strip().lower() == "true"
-    grid_url = os.getenv("SELENIUM_REMOTE_URL", "http://localhost:4444/wd/hub")
+    pool = browser_pool
+    if request.node.get_closest_marker("headed") and request.config._browser_profile.headless:
+        pool = request.getfixturevalue("headed_browser_pool")
 
-    download_path = download_dir()
-    options = webdriver.ChromeOptions()
-    options.add_argument("--log-level=3")
-    options.add_argument("--disable-infobars")
-    options.add_argument("--start-maximized")
-    #options.add_argument("--headless=new")
-
-    options.add_experimental_option("prefs", {
-        "credentials_enable_service": False,
-        "profile.password_manager_enabled": False,
-        "profile.password_manager_leak_detection": False,
-        "download.default_directory": download_path,
-        "download.prompt_for_download": False,
-        "directory_upgrade": True,
-        "safebrowsing.enabled": True,
-        "profile.default_content_setting_values.geolocation": 1
-    })
-
-    driver = (
-        webdriver.Remote(command_executor=grid_url, options=options)
-        if use_grid else
-        webdriver.Chrome(options=options)
-    )
-
-    driver.implicitly_wait(5)
+    download_path = WorkerArtifacts.artifact_dir_for_test(request.config, request.node.nodeid, "downloads")
+    driver = pool.acquire(download_dir=download_path)
+    block = request.node.get_closest_marker("block_resources")
+    if block:
+        BrowserProfile.block_resources(driver, block.args)
     request.node._driver = driver
     request.node._download_path = download_path
+    request.node._downloads = []
+    request.node._existing_downloads = set(os.listdir(download_path))
+    driver.command_recorder.start_test(request.node.nodeid)
+
+    yield driver
+    driver.command_recorder.finish_test()
+    pool.release(driver)
+
+@pytest.fixture(scope="class")
+def class_browser_instance(request, browser_pool) -> Generator[WebDriver, None, None]:
+    """
+    Provides one pooled Selenium WebDriver instance to every test of a class, e.g. to sweep
+    parametrized values over a page opened once. The browser is not reset between the tests;
+    each test is still recorded and reported on its own (see _class_browser_test).
+    A block_resources marker on the class applies to the whole class.
+    """
+    download_path = WorkerArtifacts.artifact_dir_for_test(request.config, request.node.nodeid, "downloads")
+    driver = browser_pool.acquire(download_dir=download_path)
+    driver._class_download_path = download_path
+    block = request.node.get_closest_marker("block_resources")
+    if block:
+        BrowserProfile.block_resources(driver, block.args)
 
     yield driver
-    driver.quit()
+    browser_pool.release(driver)
+
+@pytest.fixture(scope="class")
+def page_session(request, class_browser_instance) -> Generator[PageSession, None, None]:
+    """
+    One navigated page shared by the tests of a class (see PageSession). Tests marked 'readonly'
+    reuse it as is; after 'mutating' or unmarked tests it is restored per --page_restore.
+    """
+    session = PageSession(class_browser_instance, restore=request.config.getoption("page_restore"))
+
+    yield session
+    logger.info(f"Page session of {request.node.name}: {session.stats}")
+
+@pytest.fixture(autouse=True)
+def _class_browser_test(request) -> Generator[None, None, None]:
+    """
+    Per-test bookkeeping of tests running on class_browser_instance: command metrics, the
+    screenshot/download attachments of the report, and whether the test may change the page
+    shared through page_session.
+    """
+    if "class_browser_instance" not in request.fixturenames:
+        yield
+        return
+    driver = request.getfixturevalue("class_browser_instance")
+    request.node._driver = driver
+    request.node._download_path = driver._class_download_path
+    request.node._downloads = []
+    # The class shares one download directory: earlier tests' files are not this test's downloads.
+    request.node._existing_downloads = set(os.listdir(driver._class_download_path))
+    driver.command_recorder.start_test(request.node.nodeid)
+
+    session = request.getfixturevalue("page_session") if "page_session" in request.fixturenames else None
+    if session:
+        session.begin(mutating=request.node.get_closest_marker("readonly") is None)
+
+    yield
+    if session:
+        session.end()
+    driver.command_recorder.finish_test()
 
 # ---------------------------
-# Hook: Screenshot + Download Attachments
+# Hook: Screenshot + Download + Command Metrics Attachments
 # ---------------------------
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item):
     """
-    Attach screenshots and downloaded files to the HTML report on test failure.
+    Attach screenshots and downloaded files to the HTML report on test failure,
+    plus the WebDriver command metrics of every test. Downloads come from the test's
+    download manifest (filled by DownloadWatcher), not from scanning its download directory.
     """
-    pytest_html = item.config.pluginmanager.getplugin("html")
     outcome = yield
     report = outcome.get_result()
+    if report.when == "teardown" or (report.when == "setup" and report.passed):
+        return
+
+    pytest_html = item.config.pluginmanager.getplugin("html")
     extra = getattr(report, "extra", [])
+    xfail = hasattr(report, "wasxfail")
+    node = item._request.node
+    driver = getattr(node, "_driver", None)
+
+    # Attach screenshot on failure: a thumbnail linking to the full image, written in the background
+    if (report.failed and not xfail) or (report.skipped and xfail):
+        if driver:
+            screenshot = item.config._screenshot_writer.capture(driver, f"{item.nodeid}::{report.when}")
+            html = (
+                f'<div><a href="{WorkerArtifacts.report_relative_path(screenshot.full_path)}" target="_blank">'
+                f'<img src="{WorkerArtifacts.report_relative_path(screenshot.thumbnail_path)}" alt="screenshot" '
+                f'loading="lazy" style="width:304px;height:228px;object-fit:contain;" align="right"/></a></div>'
+            )
+            extra.append(pytest_html.extras.html(html))
 
-    if report.when in ("setup", "call"):
-        xfail = hasattr(report, "wasxfail")
-        driver = getattr(item._request.node, "_driver", None)
-
-        # Attach screenshot on failure
-        if (report.failed and not xfail) or (report.skipped and xfail):
-            if driver:
-                file_name = _screenshot_path(report.nodeid)
-                driver.save_screenshot(file_name)
-                html = (
-                    f'<div><img src="{file_name}" alt="screenshot" '
-                    f'style="width:304px;height:228px;" '
-                    f'onclick="window.open(this.src)" align="right"/></div>'
-                )
-                extra.append(pytest_html.extras.html(html))
-
-        # Attach downloaded files
-        download_path = getattr(item._request.node, "_download_path", None)
-        if download_path and os.path.exists(download_path):
-            for file in os.listdir(download_path):
-                file_path = os.path.join(download_path, file)
-                if os.path.isfile(file_path):
-                    rel_path = os.path.relpath(file_path, os.path.dirname(__file__))
-                    html_link = f'<div><a href="{rel_path}" target="_blank">📥 {file}</a></div>'
-                    extra.append(pytest_html.extras.html(html_link))
+    # Attach the files this test downloaded
+    for download in getattr(node, "_downloads", []):
+        rel_path = WorkerArtifacts.report_relative_path(download.path)
+        html_link = (
+            f'<div><a href="{rel_path}" target="_blank">📥 {os.path.basename(download.path)}</a> '
+            f'({download.size} bytes)</div>'
+        )
+        extra.append(pytest_html.extras.html(html_link))
+
+    # Attach command metrics and enforce the command budget
+    if report.when == "call":
+        _apply_command_budget(item, report, extra, pytest_html)
 
     report.extras = extra
 
+def _command_budget_marker(max_commands=None, max_seconds=None):
+    """
+    Read the arguments of a command_budget marker, given positionally or by keyword;
+    unknown or surplus arguments raise TypeError instead of being ignored.
+    """
+    return max_commands, max_seconds
+
+
+def _apply_command_budget(item, report, extra, pytest_html):
+    """
+    Attach the test's WebDriver command metrics to the report and fail a passing test
+    that exceeded its command or time budget (--command_budget / --time_budget, or the
+    command_budget marker).
+    """
+    driver = getattr(item._request.node, "_driver", None)
+    recorder = getattr(driver, "command_recorder", None)
+    if recorder is None:
+        return
+    metrics = recorder.summary()
+
+    marker = item.get_closest_marker("command_budget")
+    max_commands = int(item.config.getoption("command_budget"))
+    max_seconds = float(item.config.getoption("time_budget"))
+    if marker:
+        marker_commands, marker_seconds = _command_budget_marker(*marker.args, **marker.kwargs)
+        max_commands = max_commands if marker_commands is None else marker_commands
+        max_seconds = max_seconds if marker_seconds is None else marker_seconds
+
+    pages = ", ".join(f"{name}: {v['commands']}" for name, v in metrics["pages"].items())
+    extra.append(pytest_html.extras.html(
+        f'<div>🕒 {metrics["commands"]} WebDriver commands, '
+        f'{metrics["action_seconds"]:.2f}s action, {metrics["wait_seconds"]:.2f}s wait, '
+        f'{metrics["retries"]} retries ({pages}); {metrics["waits"]["count"]} waits, '
+        f'slowest {metrics["waits"]["max_seconds"]:.3f}s to condition; '
+        f'{metrics["implicit_wait_stalls"]["count"]} implicit-wait stalls</div>'
+    ))
+
+    spent = metrics["action_seconds"] + metrics["wait_seconds"]
+    violations = []
+    if max_commands and metrics["commands"] > max_commands:
+        violations.append(f"{metrics['commands']} WebDriver commands exceed the budget of {max_commands}")
+    if max_seconds and spent > max_seconds:
+        violations.append(f"{spent:.2f}s in WebDriver commands and waits exceeds the budget of {max_seconds}s")
+    if violations and report.passed:
+        report.outcome = "failed"
+        report.longrepr = "Command budget exceeded: " + "; ".join(violations)
+
 # ---------------------------
-# Utility: Screenshot Path Builder
+# Hook: Browser Pool Summary
 # ---------------------------
-def _screenshot_path(nodeid: str) -> str:
+def pytest_terminal_summary(terminalreporter, config):
     """
-    Build a sanitized file path for saving screenshots based on the test nodeid.
+    Print browser pool hit/miss and reset latency so launch savings are visible.
+    Under xdist the controller prints the stats written by each worker, and the predicted versus
+    actual makespan of --scheduler duration.
     """
-    sanitized_nodeid = nodeid.replace("::", "_").replace("/", "_").replace("\\", "_").replace(" ", "_")
-    reports_dir = os.path.join(os.path.dirname(__file__), "reports", "screenshots")
-    return os.path.join(reports_dir, f"{sanitized_nodeid}.png")
+    pool = getattr(config, "_browser_pool", None)
+    worker_stats = {"local": pool.summary()} if pool else WorkerArtifacts.read_worker_json("browser_pool")
+    for worker, stats in worker_stats.items():
+        terminalreporter.write_sep("-", f"browser pool ({worker})")
+        for key, value in stats.items():
+            terminalreporter.write_line(f"{key}: {value}")
+
+    cassette = getattr(config, "_http_cassette", None)
+    cassette_reports = {"local": cassette.report()} if cassette else WorkerArtifacts.read_worker_json("http_cassette")
+    for worker, report in cassette_reports.items():
+        terminalreporter.write_sep("-", f"http cassette ({worker})")
+        terminalreporter.write_line(
+            f"mode: {report['mode']}, recorded: {report['recorded']}, hits: {report['hits']}, "
+            f"misses: {report['misses']}, stale: {len(report['stale_urls'])}, "
+            f"oldest: {report['oldest_age_days']} days"
+        )
+
+    schedule = getattr(config, "_schedule_report", None)
+    if schedule and "predicted_makespan" in schedule:
+        terminalreporter.write_sep("-", "duration scheduler")
+        terminalreporter.write_line(
+            f"predicted makespan: {schedule['predicted_makespan']:.1f}s, actual: {schedule['actual_makespan']:.1f}s"
+        )
+        for worker, entry in schedule["workers"].items():
+            terminalreporter.write_line(
+                f"{worker}: expected {entry.get('expected_seconds', 0.0):.1f}s, actual {entry['actual_seconds']:.1f}s "
+                f"({', '.join(entry.get('units', []))})"
+            )
@@ -0,0 +1,125 @@
+from selenium.common import NoAlertPresentException, WebDriverException
+from selenium.webdriver.chromium.webdriver import ChromiumDriver
+from selenium.webdriver.common.timeouts import Timeouts
+
+
+class FakeSwitchTo:
+    """
+    switch_to of the FakeDriver: there is never an alert, and window() selects a tab.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    @property
+    def alert(self):
+        raise NoAlertPresentException()
+
+    def window(self, handle):
+        self.driver.current_window_handle = handle
+
+
+class FakeDriver:
+    """
+    Shared stand-in for a remote WebDriver, so Page Objects and Utilities can be unit tested
+    without a browser. Like the real driver, every helper funnels through execute(), which
+    records the command and asks respond() for its value; tests subclass it and override
+    respond()/respond_cdp() to answer the way their page would. Wrap a fake class in chrome()
+    to get a local Chrome driver.
+    """
+
+    # Read-only properties on the real driver; class attributes here, so the fake can set them
+    # even when chrome() puts the WebDriver classes behind it.
+    current_url = None
+    current_window_handle = None
+    window_handles = None
+    switch_to = None
+    timeouts = None
+    session_id = "fake"
+
+    def __init__(self):
+        self.current_url = "about:blank"
+        self.current_window_handle = "main"
+        self.window_handles = ["main"]
+        self.switch_to = FakeSwitchTo(self)
+        self.timeouts = Timeouts(implicit_wait=0, page_load=300, script=30)
+        self.commands = []
+        self.cdp_commands = []
+        self.opened = []
+        self.screenshot = b""
+        self.crashed = False
+        self.quit_called = False
+
+    def execute(self, driver_command, params=None):
+        self.commands.append(driver_command)
+        if self.crashed:
+            raise WebDriverException("chrome not reachable")
+        return {"value": self.respond(driver_command, params or {})}
+
+    def respond(self, driver_command, params):
+        """
+        Value of a WebDriver command; None unless a subclass answers it.
+        """
+        return None
+
+    def respond_cdp(self, cmd, params):
+        """
+        Value of a CDP command; empty unless a subclass answers it.
+        """
+        return {}
+
+    def get(self, url):
+        self.execute("get", {"url": url})
+        self.opened.append(url)
+        self.current_url = url
+
+    def close(self):
+        self.execute("closeWindow")
+        self.window_handles.remove(self.current_window_handle)
+
+    def quit(self):
+        self.quit_called = True
+
+    def execute_script(self, script, *args):
+        return self.execute("executeScript", {"script": script, "args": list(args)})["value"]
+
+    def execute_async_script(self, script, *args):
+        return self.execute("executeAsyncScript", {"script": script, "args": list(args)})["value"]
+
+    def find_element(self, by, value):
+        return self.execute("findElement", {"using": by, "value": value})["value"]
+
+    def get_cookies(self):
+        return self.execute("getCookies")["value"]
+
+    def add_cookie(self, cookie_dict):
+        self.execute("addCookie", {"cookie": cookie_dict})
+
+    def delete_all_cookies(self):
+        self.execute("deleteAllCookies")
+
+    def set_script_timeout(self, time_to_wait):
+        self.execute("setTimeouts", {"script": time_to_wait})
+        self.timeouts = Timeouts(implicit_wait=self.timeouts.implicit_wait, page_load=self.timeouts.page_load,
+                                 script=time_to_wait)
+
+    def get_screenshot_as_png(self):
+        self.execute("screenshot")
+        return self.screenshot
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp_commands.append((cmd, params))
+        return self.respond_cdp(cmd, params)
+
+
+def chrome(fake_class):
+    """
+    Make a fake driver class pass for a local Chrome driver (see DevTools.supports_cdp).
+
+    :param fake_class: FakeDriver or a subclass of it.
+    :return: Subclass of the fake that is also a ChromiumDriver.
+    """
+    return type(f"Chrome{fake_class.__name__}", (fake_class, ChromiumDriver), {})
+
+
+FakeChromeDriver = chrome(FakeDriver)
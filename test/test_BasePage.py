@@ -0,0 +1,148 @@
+import logging
+import time
+
+import pytest
+from selenium.common import JavascriptException, NoSuchElementException, TimeoutException
+
+from FakeDriver import FakeDriver
+from PageObject.BasePage import BasePage
+from Utilities.CommandRecorder import CommandRecorder
+
+logger = logging.getLogger(__name__)
+
+
+class FakeWaitDriver(FakeDriver):
+    """
+    Fake driver whose in-page observer either settles the condition or cannot run at all.
+    With an implicit wait, element lookups fail after blocking for it.
+    """
+
+    def __init__(self, observer_ok=True, polls_until_ok=0, implicit_wait=None):
+        super().__init__()
+        self.observer_ok = observer_ok
+        self.polls_until_ok = polls_until_ok
+        self.implicit_wait = implicit_wait
+
+    def respond(self, driver_command, params):
+        if driver_command == "executeAsyncScript":
+            if not self.observer_ok:
+                raise JavascriptException("document unloaded")
+            return {"ok": True, "element": "element", "elapsed": 0.01}
+        if driver_command == "executeScript":
+            self.polls_until_ok -= 1
+            return {"ok": self.polls_until_ok < 0, "element": "element"}
+        if driver_command == "findElement" and self.implicit_wait is not None:
+            time.sleep(self.implicit_wait)
+            raise NoSuchElementException(params["value"])
+        return None
+
+
+class TestConditionWaits:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """
+        Run before each test — a fresh recorder for the wait reports.
+        """
+        self.recorder = CommandRecorder()
+        self.recorder.start_test("test::wait")
+
+    def test_observer_wait_is_one_command(self):
+        """
+        Verify a wait is settled by a single async script and its time-to-condition is reported.
+        """
+        driver = self.recorder.attach(FakeWaitDriver())
+        element = BasePage(driver).wait_for_element_visible("//h3", timeout=1)
+        waits = self.recorder.finish_test()["waits"]
+
+        assert element == "element"
+        assert driver.commands == ["executeAsyncScript"], "No polling round trips when the observer runs"
+        assert waits["count"] == 1 and waits["fallbacks"] == 0 and waits["timeouts"] == 0
+        assert waits["slowest"][0]["condition"] == "visible"
+
+    def test_falls_back_to_polling(self):
+        """
+        Verify the condition is polled when the observer script cannot run.
+        """
+        driver = self.recorder.attach(FakeWaitDriver(observer_ok=False, polls_until_ok=2))
+        BasePage(driver).wait_for_element_clickable("//button", timeout=1)
+        waits = self.recorder.finish_test()["waits"]
+
+        logger.info(f"Commands: {driver.commands}")
+        assert driver.commands.count("executeScript") == 3
+        assert waits["fallbacks"] == 1 and waits["slowest"][0]["strategy"] == "polling"
+
+    def test_long_wait_restores_the_script_timeout(self):
+        """
+        Verify a wait longer than the script timeout raises it for that wait only.
+        """
+        driver = self.recorder.attach(FakeWaitDriver())
+        BasePage(driver).wait_for_element_visible("//h3", timeout=60)
+
+        assert driver.commands == ["setTimeouts", "executeAsyncScript", "setTimeouts"]
+        assert driver.timeouts.script == 30, "Expected the previous script timeout back"
+
+    def test_timeout_is_reported(self):
+        """
+        Verify a wait that never settles raises and is counted as a timeout.
+        """
+        driver = self.recorder.attach(FakeWaitDriver(observer_ok=False, polls_until_ok=10 ** 6))
+        with pytest.raises(TimeoutException, match="did not disappear"):
+            BasePage(driver).wait_for_element_to_disappear("//div[@id='loading']", timeout=0.05)
+        assert self.recorder.finish_test()["waits"]["timeouts"] == 1
+
+
+class TestAbsenceChecks:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """
+        Run before each test — a fresh recorder for the stall reports.
+        """
+        self.recorder = CommandRecorder()
+        self.recorder.start_test("test::absence")
+
+    def test_absence_is_answered_immediately(self):
+        """
+        Verify a negative presence check costs one round trip and no wait by default.
+        """
+        driver = self.recorder.attach(FakeWaitDriver(polls_until_ok=10 ** 6))
+        start = time.perf_counter()
+        present = BasePage(driver).is_element_present("//input[@type='checkbox']")
+
+        assert not present
+        assert driver.commands == ["executeScript"]
+        assert time.perf_counter() - start < 0.5
+
+    def test_absence_timeout_per_call(self):
+        """
+        Verify an absence timeout gives the element time to appear before answering.
+        """
+        driver = self.recorder.attach(FakeWaitDriver(polls_until_ok=1))
+        page = BasePage(driver)
+        assert page.is_element_visible("//div[@id='finish']", absence_timeout=2)
+        assert driver.commands == ["executeScript", "executeAsyncScript"]
+
+    def test_missing_element_is_waited_for_explicitly(self):
+        """
+        Verify find_element falls back to the explicit wait engine when the element is not there yet.
+        """
+        driver = self.recorder.attach(FakeWaitDriver(implicit_wait=0.0))
+        element = BasePage(driver).find_element("//div[@id='finish']")
+        summary = self.recorder.finish_test()
+
+        assert element == "element"
+        assert driver.commands == ["findElement", "executeAsyncScript"]
+        assert summary["implicit_wait_stalls"]["count"] == 0
+
+    def test_implicit_wait_stalls_are_reported(self, monkeypatch):
+        """
+        Verify lookups that block on an implicit wait are reported per test.
+        """
+        monkeypatch.setattr(CommandRecorder, "STALL_SECONDS", 0.02)
+        driver = self.recorder.attach(FakeWaitDriver(implicit_wait=0.03))
+        BasePage(driver).find_element("//div[@id='finish']")
+        self.recorder.finish_test()
+
+        report = CommandRecorder.stall_report(self.recorder.tests)
+        logger.info(f"Stall report: {report}")
+        assert list(report) == ["test::absence"]
+        assert report["test::absence"]["finds"][0]["error"] == "NoSuchElementException"
@@ -1,7 +1,6 @@
 import logging
 import pytest
 from PageObject.LandingPage import LandingPage
-import requests
 
 logger = logging.getLogger(__name__)
 
@@ -31,24 +30,18 @@ class TestBrokenImagePage:
         - Collect all failures and report at the end
         """
 
-        images = self.broken_image_page.get_all_images()
         failures = []
-
-        for idx, img in enumerate(images, start=1):
-            src = img.get_attribute("src")
-            rendered = self.broken_image_page.is_image_rendered(img)
-            logger.info(f"rendered : {rendered}")
-            if rendered:
-                logger.info(f"✅ Image {idx} rendered OK. Src: {src}")
+        for audit in self.broken_image_page.audit_images():
+            if audit.rendered:
+                logger.info(f"✅ Image {audit.index} rendered OK. Src: {audit.src}")
                 continue
 
-            logger.warning(f"❌ Image {idx} not rendered. Checking HTTP status for: {src}")
-            try:
-                response = requests.get(src, timeout=5)
-                if response.status_code != 200:
-                    failures.append(f"Image {idx} ({src}) - HTTP {response.status_code}")
-            except requests.RequestException as e:
-                failures.append(f"Image {idx} ({src}) - Request failed: {e}")
+            logger.warning(f"❌ Image {audit.index} not rendered. {audit.method} {audit.src} -> "
+                           f"{audit.status or audit.error} in {audit.elapsed:.3f}s")
+            if audit.error:
+                failures.append(f"Image {audit.index} ({audit.src}) - Request failed: {audit.error}")
+            elif audit.status != 200:
+                failures.append(f"Image {audit.index} ({audit.src}) - HTTP {audit.status}")
 
         if failures:
             pytest.fail("Some images failed:\n" + "\n".join(failures))
@@ -0,0 +1,129 @@
+import logging
+import os
+import pytest
+from selenium.common import WebDriverException
+
+from FakeDriver import FakeChromeDriver
+from Utilities import HttpAuth
+from Utilities.BrowserContexts import ContextPool, process_tree_rss
+
+logger = logging.getLogger(__name__)
+
+
+class FakeContextHostDriver(FakeChromeDriver):
+    """
+    Fake local Chrome driver attached to a context host, answering the Target commands.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.current_window_handle = "home"
+        self.contexts = set()
+        self.created = 0
+        self.fail_disposal = False
+
+    def respond_cdp(self, cmd, params):
+        if cmd == "Target.createBrowserContext":
+            self.created += 1
+            context_id = f"context-{self.created}"
+            self.contexts.add(context_id)
+            return {"browserContextId": context_id}
+        if cmd == "Target.createTarget":
+            return {"targetId": f"tab-of-{params['browserContextId']}"}
+        if cmd == "Target.disposeBrowserContext":
+            if self.fail_disposal:
+                raise WebDriverException("target crashed")
+            self.contexts.remove(params["browserContextId"])
+        return {}
+
+
+class TestContextPool:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """
+        Run before each test — creates a context pool backed by a fake attached driver.
+        """
+        self.attached = []
+
+        def factory():
+            driver = FakeContextHostDriver()
+            self.attached.append(driver)
+            return driver
+
+        self.pool = ContextPool(factory=factory, home_handle="home")
+        yield
+        self.pool.shutdown()
+
+    def test_each_test_gets_a_fresh_context(self):
+        """
+        Verify every acquire creates a new context and switches the one attached session to its tab.
+        """
+        first = self.pool.acquire()
+        first_handle = first.current_window_handle
+        self.pool.release(first)
+        second = self.pool.acquire()
+
+        assert len(self.attached) == 1, "Expected one attached session per worker"
+        assert first is second, "Expected the attached session to be reused"
+        assert first_handle == "tab-of-context-1", f"Unexpected tab {first_handle}"
+        assert second.current_window_handle == "tab-of-context-2", f"Unexpected tab {second.current_window_handle}"
+        assert second.contexts == {"context-2"}, f"Expected only the live context, got {second.contexts}"
+
+    def test_downloads_go_to_the_context_directory(self):
+        """
+        Verify the download directory is set on the test's context only.
+        """
+        driver = self.pool.acquire(download_dir="/tmp/downloads/test")
+        behaviour = [params for cmd, params in driver.cdp_commands if cmd == "Browser.setDownloadBehavior"]
+        assert behaviour == [{
+            "behavior": "allow",
+            "downloadPath": "/tmp/downloads/test",
+            "browserContextId": "context-1",
+        }], f"Unexpected download behaviour {behaviour}"
+
+    def test_release_disposes_context_and_clears_tab_state(self):
+        """
+        Verify release switches back to the host tab, disposes the context and forgets per-tab state.
+        """
+        driver = self.pool.acquire()
+        driver.http_auth = HttpAuth.OriginAuth(driver, "http://localhost", "admin", "admin")
+        driver.blocked_resources = ["*.png"]
+        self.pool.release(driver)
+
+        stats = self.pool.summary()
+        logger.info(f"Context pool stats: {stats}")
+        assert driver.current_window_handle == "home", "Expected the session to be back on the host tab"
+        assert not driver.contexts, f"Expected the context to be disposed, got {driver.contexts}"
+        assert driver.http_auth is None and driver.blocked_resources is None, "Expected per-tab state cleared"
+        assert stats["contexts"] == 1 and stats["disposed"] == 1
+
+    def test_failed_disposal_is_counted(self):
+        """
+        Verify a context that cannot be disposed does not fail the test teardown.
+        """
+        driver = self.pool.acquire()
+        driver.fail_disposal = True
+        self.pool.release(driver)
+        assert self.pool.summary()["failed_disposals"] == 1
+
+    def test_shutdown_detaches_session(self):
+        """
+        Verify shutdown disposes the open context and quits the attached session.
+        """
+        driver = self.pool.acquire()
+        self.pool.shutdown()
+        assert driver.quit_called, "Expected the attached session to quit"
+        assert not driver.contexts, "Expected the open context to be disposed"
+        assert self.pool.driver is None
+
+
+class TestProcessTreeRss:
+    def test_measures_current_process(self):
+        """
+        Verify the resident memory of a process tree can be measured.
+        """
+        rss = process_tree_rss(os.getpid())
+        if rss is None:
+            pytest.skip("Resident memory cannot be measured on this platform")
+        logger.info(f"RSS of the test process tree: {rss / 2 ** 20:.1f} MB")
+        assert rss > 0, "Expected a positive resident memory"
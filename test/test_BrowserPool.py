@@ -0,0 +1,126 @@
+import logging
+import threading
+import pytest
+
+from FakeDriver import FakeChromeDriver, FakeDriver
+from Utilities.BrowserPool import BrowserPool
+
+logger = logging.getLogger(__name__)
+
+
+class TestBrowserPool:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """
+        Run before each test — creates a pool backed by fake drivers.
+        """
+        self.launched = []
+
+        def factory():
+            driver = FakeDriver()
+            self.launched.append(driver)
+            return driver
+
+        self.pool = BrowserPool(factory=factory, size=1, max_uses=3)
+        yield
+        self.pool.shutdown()
+
+    def test_warm_browser_is_reused(self):
+        """
+        Verify a warm browser is handed out repeatedly without relaunching.
+        """
+        self.pool.warm_up()
+        first = self.pool.acquire()
+        self.pool.release(first)
+        second = self.pool.acquire()
+        self.pool.release(second)
+
+        stats = self.pool.summary()
+        logger.info(f"Pool stats: {stats}")
+        assert first is second, "Expected the same warm browser to be reused"
+        assert stats["hits"] + stats["waited"] == 2 and stats["misses"] == 0
+        assert stats["launches"] == 1 and stats["resets"] == 2
+
+    def test_reset_closes_extra_tabs(self):
+        """
+        Verify release() closes every tab except the first one.
+        """
+        driver = self.pool.acquire()
+        driver.window_handles.append("popup")
+
+        self.pool.release(driver)
+
+        assert driver.window_handles == ["main"], "Extra tabs should be closed on reset"
+
+    def test_browser_recycled_after_max_uses(self):
+        """
+        Verify a browser is quit and replaced after serving max_uses tests.
+        """
+        for _ in range(3):
+            driver = self.pool.acquire()
+            self.pool.release(driver)
+
+        replacement = self.pool.acquire()
+        assert self.launched[0].quit_called, "Browser should be quit after max uses"
+        assert replacement is not self.launched[0], "A fresh browser should be handed out"
+        assert self.pool.stats["recycled"] == 1
+        self.pool.release(replacement)
+
+    def test_crashed_browser_is_replaced(self):
+        """
+        Verify a browser that fails its reset is discarded instead of returned to the pool.
+        """
+        driver = self.pool.acquire()
+        driver.crashed = True
+        self.pool.release(driver)
+
+        replacement = self.pool.acquire()
+        assert driver.quit_called and replacement is not driver
+        assert self.pool.stats["crashed"] == 1
+        self.pool.release(replacement)
+
+    def test_waiting_for_a_background_launch_is_not_a_hit(self):
+        """
+        Verify blocking on a browser that is still launching is counted as 'waited', with the time blocked.
+        """
+        launch_started, launch_allowed = threading.Event(), threading.Event()
+
+        def slow_factory():
+            launch_started.set()
+            launch_allowed.wait(timeout=5)
+            return FakeDriver()
+
+        pool = BrowserPool(factory=slow_factory, size=1)
+        pool.warm_up()
+        launch_started.wait(timeout=5)
+        threading.Timer(0.1, launch_allowed.set).start()
+        driver = pool.acquire()
+        pool.release(driver)
+        pool.shutdown()
+
+        stats = pool.summary()
+        logger.info(f"Pool stats: {stats}")
+        assert stats["waited"] == 1 and stats["hits"] == 0 and stats["misses"] == 0
+        assert stats["wait_seconds"] >= 0.05, f"Expected the blocked time to be recorded, got {stats['wait_seconds']}"
+
+    def test_remote_session_is_reset_without_cdp(self):
+        """
+        Verify a grid session gets its cookies cleared through WebDriver and keeps its download preference.
+        """
+        driver = self.pool.acquire(download_dir="/tmp/downloads")
+        self.pool.release(driver)
+
+        assert driver.cdp_commands == [], f"Expected no CDP commands, got {driver.cdp_commands}"
+        assert "deleteAllCookies" in driver.commands, "Expected the cookies to be deleted"
+
+    def test_chrome_session_is_reset_through_cdp(self):
+        """
+        Verify a local Chrome session gets its download directory and cookies handled over CDP.
+        """
+        pool = BrowserPool(factory=FakeChromeDriver, size=1)
+        driver = pool.acquire(download_dir="/tmp/downloads")
+        pool.release(driver)
+        pool.shutdown()
+
+        commands = [cmd for cmd, params in driver.cdp_commands]
+        assert commands == ["Browser.setDownloadBehavior", "Network.clearBrowserCookies"], f"Unexpected {commands}"
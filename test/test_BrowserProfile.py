@@ -0,0 +1,87 @@
+import logging
+import pytest
+
+from FakeDriver import FakeChromeDriver, FakeDriver
+from Utilities.BrowserPool import BrowserPool
+from Utilities.BrowserProfile import BrowserProfile, BLOCKABLE_RESOURCES
+
+logger = logging.getLogger(__name__)
+
+
+class TestBrowserProfile:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """
+        Run before each test — a throughput profile caching into a temporary directory, and a browser pool to reset with.
+        """
+        self.profile = BrowserProfile("throughput", cache_root=str(tmp_path), cache_name="gw0")
+        self.pool = BrowserPool(factory=FakeChromeDriver)
+        yield
+        self.pool.shutdown()
+
+    def test_throughput_options(self):
+        """
+        Verify the throughput profile runs headless, eager and trimmed, with a disk cache.
+        """
+        cache_dir = self.profile.acquire_cache_dir()
+        options = self.profile.chrome_options("/tmp/downloads", cache_dir)
+
+        logger.info(f"Arguments: {options.arguments}")
+        assert options.page_load_strategy == "eager"
+        assert "--headless=new" in options.arguments and "--window-size=1366,768" in options.arguments
+        assert "--disable-extensions" in options.arguments and "--disable-background-networking" in options.arguments
+        assert f"--disk-cache-dir={cache_dir}" in options.arguments
+
+    def test_default_and_headed_variant(self):
+        """
+        Verify the default profile is unchanged and the headed variant only drops headless mode.
+        """
+        default = BrowserProfile().chrome_options("/tmp/downloads")
+        headed = self.profile.headed_variant().chrome_options("/tmp/downloads")
+
+        assert "--start-maximized" in default.arguments and "--headless=new" not in default.arguments
+        assert default.page_load_strategy == "normal"
+        assert "--headless=new" not in headed.arguments and headed.page_load_strategy == "eager"
+
+    def test_cache_dir_is_not_shared_by_running_browsers(self):
+        """
+        Verify running browsers get their own cache, and a later browser reuses a released one.
+        """
+        first, second = self.profile.acquire_cache_dir(), self.profile.acquire_cache_dir()
+        assert first != second
+
+        driver = self.profile.attach(FakeChromeDriver(), first)
+        driver.quit()
+        assert driver.quit_called
+        assert self.profile.acquire_cache_dir() == first
+        assert BrowserProfile().acquire_cache_dir() is None
+
+    def test_blocked_resources_are_cleared_on_pool_reset(self):
+        """
+        Verify a test's resource blocking does not leak into the next test using the browser.
+        """
+        driver = FakeChromeDriver()
+        patterns = BrowserProfile.block_resources(driver, ("image", "font"))
+        self.pool.reset(driver)
+
+        assert patterns == BLOCKABLE_RESOURCES["image"] + BLOCKABLE_RESOURCES["font"]
+        assert ("Network.setBlockedURLs", {"urls": patterns}) in driver.cdp_commands
+        assert driver.cdp_commands[-1] == ("Network.setBlockedURLs", {"urls": []})
+
+    def test_unknown_resource_kind(self):
+        """
+        Verify a typo in the block_resources marker is reported.
+        """
+        with pytest.raises(ValueError):
+            BrowserProfile.block_resources(FakeChromeDriver(), ("images",))
+
+    def test_remote_session_is_left_untouched(self):
+        """
+        Verify a grid session, which has no CDP, loads every resource and is reset without CDP.
+        """
+        driver = FakeDriver()
+        BrowserProfile.block_resources(driver, ("image",))
+        self.pool.reset(driver)
+
+        assert driver.cdp_commands == []
+        assert not getattr(driver, "blocked_resources", None)
@@ -80,3 +80,18 @@ class TestChallengingDomPage:
         logger.info(f"Canvas image hash after clicking Button 3: {img_after_h64}")
         assert img_before_h64 != img_after_h64, "Canvas image hash should change after clicking Button 3"
 
+
+    def test_canvas_hash_modes(self):
+        """
+        Verify the in-page pixel digest and the perceptual hash of an unchanged canvas.
+        """
+        digest = self.challenging_dom.get_canvas_image()
+        logger.info(f"In-page canvas digest: {digest}")
+        assert len(digest) == 64 and digest == self.challenging_dom.get_canvas_image(), \
+            "In-page SHA-256 should be a stable 64 hex char digest"
+
+        dhash = self.challenging_dom.get_canvas_image(mode="dhash")
+        logger.info(f"Canvas perceptual hash: {dhash}")
+        assert len(dhash) == 16, "Perceptual hash should be 64 bits"
+        assert self.challenging_dom.hamming_distance(dhash, self.challenging_dom.get_canvas_image(mode="dhash")) == 0, \
+            "Perceptual hash of an unchanged canvas should not change"
@@ -4,18 +4,18 @@ from PageObject.LandingPage import LandingPage
 
 logger = logging.getLogger(__name__)
 
-@pytest.mark.usefixtures("browser_instance")
+@pytest.mark.block_resources("image", "font")
+@pytest.mark.usefixtures("page_session")
 class TestCheckboxPage:
     @pytest.fixture(autouse=True)
-    def setup(self, request, browser_instance):
+    def setup(self, page_session):
         """
-        Run before each test — creates fresh LandingPage instance.
+        Run before each test — gets the Checkboxes page shared by the class, restored if a previous test changed it.
         """
-        self.driver = browser_instance
-        self.landing_page = LandingPage(self.driver)
-        self.landing_page.navigate_to_landing_page()
-        self.checkboxes_page = self.landing_page.go_to_checkboxes()
+        self.driver = page_session.driver
+        self.checkboxes_page = page_session.page(lambda: LandingPage(self.driver).go_to_checkboxes())
 
+    @pytest.mark.readonly
     def test_checkboxes_page_heading(self):
         """
         Verify the Checkboxes page heading.
@@ -26,14 +26,14 @@ class TestCheckboxPage:
         assert expected_heading.lower() == actual_heading.lower(), \
             f"Expected heading '{expected_heading}', but got '{actual_heading}'"
 
+    @pytest.mark.readonly
     def test_initial_checkbox_states(self):
         """
         Verify the initial checkbox states:
         - Checkbox 1: unchecked
         - Checkbox 2: checked
         """
-        checkbox1_state = self.checkboxes_page.get_checkbox_state(1)
-        checkbox2_state = self.checkboxes_page.get_checkbox_state(2)
+        checkbox1_state, checkbox2_state = self.checkboxes_page.get_checkbox_states()
 
         logger.info(f"Initial state — Checkbox 1: {checkbox1_state}, Checkbox 2: {checkbox2_state}")
         assert checkbox1_state is False, "Checkbox 1 should be initially unchecked"
@@ -57,8 +57,7 @@ class TestCheckboxPage:
             logger.info("Checkbox 2 toggled to unchecked.")
 
         # Final state validation
-        checkbox1_final = self.checkboxes_page.get_checkbox_state(1)
-        checkbox2_final = self.checkboxes_page.get_checkbox_state(2)
+        checkbox1_final, checkbox2_final = self.checkboxes_page.get_checkbox_states()
 
         logger.info(f"Final state — Checkbox 1: {checkbox1_final}, Checkbox 2: {checkbox2_final}")
         assert checkbox1_final is True, "Checkbox 1 should be checked after toggling"
@@ -82,8 +81,7 @@ class TestCheckboxPage:
             logger.info("Checkbox 2 toggled to checked.")
 
         # Final state validation
-        checkbox1_final = self.checkboxes_page.get_checkbox_state(1)
-        checkbox2_final = self.checkboxes_page.get_checkbox_state(2)
+        checkbox1_final, checkbox2_final = self.checkboxes_page.get_checkbox_states()
 
         logger.info(f"Final state — Checkbox 1: {checkbox1_final}, Checkbox 2: {checkbox2_final}")
         assert checkbox1_final is True, "Checkbox 1 should be checked"
@@ -107,8 +105,7 @@ class TestCheckboxPage:
             logger.info("Checkbox 2 toggled to unchecked.")
 
         # Final state validation
-        checkbox1_final = self.checkboxes_page.get_checkbox_state(1)
-        checkbox2_final = self.checkboxes_page.get_checkbox_state(2)
+        checkbox1_final, checkbox2_final = self.checkboxes_page.get_checkbox_states()
 
         logger.info(f"Final state — Checkbox 1: {checkbox1_final}, Checkbox 2: {checkbox2_final}")
         assert checkbox1_final is False, "Checkbox 1 should be unchecked"
@@ -0,0 +1,145 @@
+import logging
+import time
+
+import pytest
+from _pytest.reports import TestReport
+
+import conftest
+from FakeDriver import FakeDriver
+from PageObject.CheckboxesPage import CheckboxesPage
+from PageObject.LandingPage import LandingPage
+from Utilities.CommandRecorder import CommandRecorder
+
+logger = logging.getLogger(__name__)
+
+
+class FakeCheckboxesDriver(FakeDriver):
+    """
+    Fake driver on the checkboxes page: the first checkbox is unchecked, the second checked.
+    """
+
+    def respond(self, driver_command, params):
+        if driver_command == "executeScript":
+            return {CheckboxesPage.checkboxes_xpath: [{"selected": False}, {"selected": True}]}
+        return None
+
+
+class TestCommandRecorder:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """
+        Run before each test — instruments a fake driver with a fresh recorder.
+        """
+        self.recorder = CommandRecorder()
+        self.driver = self.recorder.attach(FakeCheckboxesDriver())
+        self.page = CheckboxesPage(self.driver)
+
+    def test_commands_outside_a_test_are_ignored(self):
+        """
+        Verify nothing is recorded before start_test() (e.g. pool resets).
+        """
+        self.page.get_checkbox_states()
+        assert self.recorder.summary()["commands"] == 0
+
+    def test_commands_are_attributed_to_page_objects(self):
+        """
+        Verify commands are counted per page object and per command name.
+        """
+        self.recorder.start_test("test::a")
+        states = self.page.get_checkbox_states()
+        self.page.find_element("//h3")
+        summary = self.recorder.finish_test()
+
+        logger.info(f"Summary: {summary}")
+        assert states == [False, True]
+        assert summary["commands"] == 2
+        assert summary["pages"]["CheckboxesPage"]["commands"] == 2
+        assert summary["by_command"]["findElement"]["count"] == 1
+        assert self.recorder.tests["test::a"] is summary
+
+    def test_wait_time_is_reported_separately(self):
+        """
+        Verify commands inside wait spans count as wait time, not action time.
+        """
+        self.recorder.start_test("test::b")
+        with self.page.instrument("wait", "//h3"):
+            self.page.find_element("//h3")
+            time.sleep(0.01)
+        with self.page.instrument("action", "//h3", retry=1):
+            self.page.find_element("//h3")
+        summary = self.recorder.finish_test()
+
+        phases = [record["phase"] for record in self.recorder._records]
+        assert phases == ["wait", "action"]
+        assert summary["wait_seconds"] >= 0.01, "Polling sleeps inside a wait span count as wait time"
+        assert summary["retries"] == 1
+
+    def test_commands_go_to_the_innermost_page_object(self):
+        """
+        Verify a page object method calling another page object's method attributes the commands to the callee.
+        """
+        self.recorder.start_test("test::c")
+        LandingPage(self.driver, navigate_directly=True).go_to_checkboxes().get_checkbox_states()
+        summary = self.recorder.finish_test()
+
+        logger.info(f"Pages: {summary['pages']}")
+        assert summary["pages"] == {
+            "LandingPage": {"commands": 1, "seconds": summary["pages"]["LandingPage"]["seconds"]},
+            "CheckboxesPage": {"commands": 1, "seconds": summary["pages"]["CheckboxesPage"]["seconds"]},
+        }
+
+
+class TestCommandBudget:
+    @pytest.fixture(autouse=True)
+    def setup(self, request):
+        """
+        Run before each test — this test's node gets an instrumented fake driver, as browser_instance does.
+        """
+        self.item = request.node
+        self.recorder = CommandRecorder()
+        self.item._driver = self.recorder.attach(FakeCheckboxesDriver())
+        self.recorder.start_test(self.item.nodeid)
+        self.html = request.config.pluginmanager.getplugin("html")
+
+    def run_budget(self):
+        report = TestReport(self.item.nodeid, self.item.location, {}, "passed", None, "call")
+        extra = []
+        conftest._apply_command_budget(self.item, report, extra, self.html)
+        # Detach the fake driver, so the budget is not applied to this test's own report as well.
+        del self.item._driver
+        return report, extra
+
+    @pytest.mark.command_budget(max_commands=2)
+    def test_test_over_budget_fails(self):
+        """
+        Verify a passing test that sent more commands than its budget is reported as failed.
+        """
+        page = CheckboxesPage(self.item._driver)
+        for _ in range(3):
+            page.get_checkbox_states()
+        report, extra = self.run_budget()
+
+        logger.info(f"Report: {report.outcome} {report.longrepr}")
+        assert report.failed, "Expected the test to fail its command budget"
+        assert "3 WebDriver commands exceed the budget of 2" in report.longrepr
+        assert len(extra) == 1, "Expected the command metrics to be attached"
+
+    @pytest.mark.command_budget(max_commands=5)
+    def test_test_within_budget_passes(self):
+        """
+        Verify a test within its budget keeps its outcome.
+        """
+        CheckboxesPage(self.item._driver).get_checkbox_states()
+        report, _ = self.run_budget()
+        assert report.passed, f"Unexpected budget failure: {report.longrepr}"
+
+    @pytest.mark.command_budget(1, 5)
+    def test_positional_budget_is_enforced(self):
+        """
+        Verify the marker's documented positional form command_budget(max_commands, max_seconds) applies.
+        """
+        page = CheckboxesPage(self.item._driver)
+        for _ in range(2):
+            page.get_checkbox_states()
+        report, _ = self.run_budget()
+        assert report.failed and "2 WebDriver commands exceed the budget of 1" in report.longrepr
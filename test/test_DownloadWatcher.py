@@ -0,0 +1,104 @@
+import hashlib
+import logging
+import os
+import threading
+import time
+
+import pytest
+
+from Utilities.DownloadWatcher import DownloadWatcher
+
+logger = logging.getLogger(__name__)
+
+
+def simulate_chrome_download(directory, filename, content, delay=0.2):
+    """
+    Write a file the way Chrome does: into a .crdownload partial, renamed once complete.
+    """
+    time.sleep(delay)
+    partial = os.path.join(directory, f"{filename}.crdownload")
+    with open(partial, "wb") as f:
+        f.write(content[:10])
+        f.flush()
+        time.sleep(delay)
+        f.write(content[10:])
+    os.rename(partial, os.path.join(directory, filename))
+
+
+class TestDownloadWatcher:
+    @pytest.fixture(autouse=True, params=["inotify", "polling"])
+    def setup(self, request, tmp_path):
+        """
+        Run before each test — creates a watcher for each supported strategy.
+        """
+        self.directory = str(tmp_path)
+        self.watcher = DownloadWatcher(self.directory)
+        if request.param == "inotify" and not self.watcher.use_inotify:
+            pytest.skip("inotify is not available on this platform")
+        self.watcher.use_inotify = request.param == "inotify"
+
+    def test_waits_until_partial_is_finalized(self):
+        """
+        Verify the watcher returns only after the .crdownload partial is renamed.
+        """
+        content = os.urandom(4096)
+        writer = threading.Thread(target=simulate_chrome_download, args=(self.directory, "some-file.txt", content))
+        writer.start()
+
+        result = self.watcher.wait_for("some-file.txt", timeout=5)
+        writer.join()
+
+        logger.info(f"Download result: {result}")
+        assert result.path == os.path.join(self.directory, "some-file.txt")
+        assert result.size == len(content)
+        assert result.sha256 == hashlib.sha256(content).hexdigest()
+
+    def test_download_finished_before_waiting(self):
+        """
+        Verify a download that completed before wait_for() is found immediately.
+        """
+        simulate_chrome_download(self.directory, "cat.jpg", b"0123456789abcdef", delay=0)
+
+        result = self.watcher.wait_for("cat.jpg", timeout=1)
+        assert result.elapsed < 0.5, "Already finished downloads should not wait"
+
+    def test_times_out_precisely(self):
+        """
+        Verify the watcher raises TimeoutError close to the requested timeout.
+        """
+        start = time.monotonic()
+        with pytest.raises(TimeoutError):
+            self.watcher.wait_for("missing.txt", timeout=0.3)
+        elapsed = time.monotonic() - start
+        assert 0.3 <= elapsed < 0.6, f"Timeout was not precise: {elapsed:.3f}s"
+
+    def test_completed_download_is_added_to_manifest(self):
+        """
+        Verify only the awaited download lands in the test's manifest, not other files in the directory.
+        """
+        simulate_chrome_download(self.directory, "earlier-test.txt", b"not this test's file", delay=0)
+        simulate_chrome_download(self.directory, "menu.pdf", b"%PDF-1.4 0123456789", delay=0)
+        manifest = []
+        self.watcher.manifest = manifest
+
+        result = self.watcher.wait_for("menu.pdf", timeout=1)
+        assert manifest == [result], f"Expected only the awaited download in the manifest, got {manifest}"
+
+    def test_files_from_before_the_test_are_ignored(self):
+        """
+        Verify a file of the same name left by an earlier test is not reported, and Chrome's renamed copy is.
+        """
+        simulate_chrome_download(self.directory, "menu.pdf", b"earlier test's download", delay=0)
+        self.watcher.existing = set(os.listdir(self.directory))
+
+        with pytest.raises(TimeoutError):
+            self.watcher.wait_for("menu.pdf", timeout=0.2)
+
+        content = os.urandom(1024)
+        writer = threading.Thread(target=simulate_chrome_download, args=(self.directory, "menu (1).pdf", content))
+        writer.start()
+        result = self.watcher.wait_for("menu.pdf", timeout=5)
+        writer.join()
+
+        assert os.path.basename(result.path) == "menu (1).pdf", f"Expected the new download, got {result.path}"
+        assert result.sha256 == hashlib.sha256(content).hexdigest()
@@ -0,0 +1,99 @@
+import logging
+import pytest
+from selenium.common import JavascriptException
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
+
+from FakeDriver import FakeDriver, chrome
+from PageObject.BasePage import DRAG_AND_DROP_SCRIPT
+from PageObject.DragAndDropPage import DragAndDropPage
+
+logger = logging.getLogger(__name__)
+
+
+class FakeDragDriver(FakeDriver):
+    """
+    Fake driver whose waits succeed at once, and whose HTML5 drag script either runs or is unavailable.
+    """
+
+    def __init__(self, html5=True):
+        super().__init__()
+        self.html5 = html5
+        self.steps = []
+
+    def respond(self, driver_command, params):
+        if driver_command == "executeAsyncScript":
+            return {"ok": True, "element": "element", "elapsed": 0.0}
+        if driver_command == "findElement":
+            return WebElement(self, params["value"])
+        if driver_command == Command.W3C_ACTIONS:
+            self.steps.append("actions")
+            return None
+        if driver_command != "executeScript":
+            return None
+        script = params["script"]
+        if script == DRAG_AND_DROP_SCRIPT:
+            self.steps.append("html5")
+            if not self.html5:
+                raise JavascriptException("DataTransfer is not defined")
+            return {"ok": True, "dropped": True}
+        if "__dragData;" in script:
+            return [{"mimeType": "text/html", "data": "<header>A</header>"}]
+        if "getBoundingClientRect" in script:
+            return [10, 20]
+        return None
+
+    def respond_cdp(self, cmd, params):
+        self.steps.append((cmd, params.get("type")))
+        return {}
+
+
+FakeChromeDragDriver = chrome(FakeDragDriver)
+
+
+class TestDragAndDropEngine:
+    def test_html5_drag_is_one_script(self):
+        """
+        Verify the HTML5 engine performs the whole drag in one script.
+        """
+        driver = FakeChromeDragDriver()
+        assert DragAndDropPage(driver).drag_and_drop_box()
+        assert driver.steps == ["html5"]
+
+    def test_falls_back_to_cdp(self):
+        """
+        Verify a trusted CDP drag is used on local Chromium when the HTML5 sequence cannot run,
+        handing the drop the data the page's dragstart stored.
+        """
+        driver = FakeChromeDragDriver(html5=False)
+        assert DragAndDropPage(driver).drag_and_drop_box()
+
+        logger.info(f"Steps: {driver.steps}")
+        assert driver.steps == [
+            "html5",
+            ("Input.setInterceptDrags", None),
+            ("Input.dispatchMouseEvent", "mousePressed"),
+            ("Input.dispatchMouseEvent", "mouseMoved"),
+            ("Input.dispatchDragEvent", "dragEnter"),
+            ("Input.dispatchDragEvent", "dragOver"),
+            ("Input.dispatchDragEvent", "drop"),
+            ("Input.dispatchMouseEvent", "mouseReleased"),
+            ("Input.setInterceptDrags", None),
+        ]
+
+    def test_remote_session_falls_back_to_actions(self):
+        """
+        Verify a grid session, which has no CDP, drags with the W3C actions when the HTML5 sequence cannot run.
+        """
+        driver = FakeDragDriver(html5=False)
+        assert DragAndDropPage(driver).drag_and_drop_box()
+
+        assert driver.steps == ["html5", "actions"]
+        assert driver.cdp_commands == []
+
+    def test_unknown_engine(self):
+        """
+        Verify a typo in the engine name is reported.
+        """
+        with pytest.raises(ValueError):
+            DragAndDropPage(FakeDragDriver()).drag_and_drop_box(engine="mouse")
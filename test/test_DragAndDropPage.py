@@ -1,6 +1,8 @@
 import logging
 import pytest
+
 from PageObject.LandingPage import LandingPage
+from Utilities import DevTools
 
 logger = logging.getLogger(__name__)
 
@@ -25,14 +27,18 @@ class TestDragAndDropPage:
         actual_heading = self.drag_and_drop.get_ab_testing_page_heading()
         assert actual_heading == expected_heading, f"Expected heading '{expected_heading}', but got '{actual_heading}'"
 
-    def test_drag_and_drop_operation(self):
+    @pytest.mark.parametrize("engine", ["auto", "cdp"])
+    def test_drag_and_drop_operation(self, engine):
         """
         Verify the drag and drop operation from source box to target box.
         """
+        if engine == "cdp" and not DevTools.supports_cdp(self.driver):
+            pytest.skip("The CDP engine needs a local Chromium browser")
         initial_box_text = self.drag_and_drop.get_box_text()
         logger.info(f"Initial box text: {initial_box_text}")
-        logger.info("Testing drag and drop operation")
-        self.drag_and_drop.drag_and_drop_box()
+        logger.info(f"Testing drag and drop operation with the {engine} engine")
+        assert self.drag_and_drop.drag_and_drop_box(engine=engine), "Target box should accept the drop"
         actual_box_text = self.drag_and_drop.get_box_text()
         logger.info(f"Box text after drag and drop: {actual_box_text}")
-        assert initial_box_text != actual_box_text, "Box text cshould change after drag and drop operation"
\ No newline at end of file
+        assert initial_box_text != actual_box_text, "Box text cshould change after drag and drop operation"
+
@@ -4,18 +4,18 @@ from PageObject.LandingPage import LandingPage
 
 logger = logging.getLogger(__name__)
 
-@pytest.mark.usefixtures("browser_instance")
+@pytest.mark.block_resources("image", "font")
+@pytest.mark.usefixtures("page_session")
 class TestDropdownPage:
     @pytest.fixture(autouse=True)
-    def setup(self, request, browser_instance):
+    def setup(self, page_session):
         """
-        Run before each test — creates fresh LandingPage instance.
+        Run before each test — gets the Dropdown page shared by the class, restored if a previous test changed it.
         """
-        self.driver = browser_instance
-        self.landing_page = LandingPage(self.driver)
-        self.landing_page.navigate_to_landing_page()
-        self.dropdown_page = self.landing_page.go_to_dropdown()
+        self.driver = page_session.driver
+        self.dropdown_page = page_session.page(lambda: LandingPage(self.driver).go_to_dropdown())
 
+    @pytest.mark.readonly
     def test_dropdown_page_heading(self):
         """
         Verify the Dropdown page heading.
@@ -25,6 +25,7 @@ class TestDropdownPage:
         logger.info(f"Heading found: {actual_heading}")
         assert expected_heading in actual_heading, f"Expected heading to contain '{expected_heading}'"
 
+    @pytest.mark.readonly
     def test_default_dropdown_selection(self):
         default_value = self.dropdown_page.get_selected_option_value()
         assert default_value == "", "Expected default dropdown value to be empty"
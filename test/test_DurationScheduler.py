@@ -0,0 +1,113 @@
+import json
+import logging
+import pytest
+
+from Utilities.DurationScheduler import DurationHistory, DurationScheduling, page_object_of, plan
+
+logger = logging.getLogger(__name__)
+
+NODEIDS = [
+    "test/test_CheckboxesPage.py::TestCheckboxesPage::test_checkbox_1",
+    "test/test_CheckboxesPage.py::TestCheckboxesPage::test_checkbox_2",
+    "test/test_FileDownloadPage.py::TestFileDownloadPage::test_download",
+    "test/test_HoversPage.py::TestHoversPage::test_hover",
+    "test/test_HorizontalSliderPage.py::TestHorizontalSliderSweep::test_value[1.0]",
+    "test/test_HorizontalSliderPage.py::TestHorizontalSliderSweep::test_value[1.5]",
+]
+
+
+class FakeConfig:
+    def __init__(self, workers):
+        self.workers = workers
+
+    def getvalue(self, name):
+        return [f"{self.workers}*popen"] if name == "tx" else None
+
+
+class FakeGateway:
+    def __init__(self, gateway_id):
+        self.id = gateway_id
+
+
+class FakeNode:
+    """
+    Minimal stand-in for an xdist WorkerController that records the tests it is sent.
+    """
+
+    def __init__(self, gateway_id):
+        self.gateway = FakeGateway(gateway_id)
+        self.shutting_down = False
+        self.sent = []
+
+    def send_runtest_some(self, indices):
+        self.sent.extend(indices)
+
+    def shutdown(self):
+        self.shutting_down = True
+
+
+class TestDurationScheduler:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """
+        Run before each test — writes a duration history where the download and slider tests are slow.
+        """
+        self.history_path = tmp_path / "durations.json"
+        self.history_path.write_text(json.dumps({
+            NODEIDS[0]: [1.0, 3],
+            NODEIDS[1]: [1.0, 3],
+            NODEIDS[2]: [20.0, 3],
+            NODEIDS[3]: [2.0, 3],
+            NODEIDS[4]: [6.0, 3],
+        }))
+        self.history = DurationHistory(str(self.history_path))
+
+    def test_page_object_of_test_module(self):
+        """
+        Verify tests are grouped by the page object named by their module.
+        """
+        assert page_object_of(NODEIDS[0]) == "CheckboxesPage"
+        assert page_object_of("test\\test_HoversPage.py::test_hover") == "HoversPage"
+
+    def test_unknown_tests_get_the_median(self):
+        """
+        Verify a test without history is expected to take the median recorded duration.
+        """
+        assert self.history.estimate(NODEIDS[5]) == 2.0, "Expected the median of the recorded durations"
+        assert DurationHistory(str(self.history_path.parent / "missing.json")).estimate(NODEIDS[0]) > 0
+
+    def test_history_is_smoothed_and_saved(self):
+        """
+        Verify a run's phase durations are summed per test and blended into the history.
+        """
+        self.history.add(NODEIDS[2], 9.0)
+        self.history.add(NODEIDS[2], 1.0)
+        self.history.save()
+
+        saved = json.loads(self.history_path.read_text())
+        logger.info(f"Saved history entry: {saved[NODEIDS[2]]}")
+        assert saved[NODEIDS[2]] == [15.0, 4], f"Unexpected history entry {saved[NODEIDS[2]]}"
+
+    def test_plan_balances_longest_first(self):
+        """
+        Verify the predicted schedule puts every unit on the least loaded worker, longest first.
+        """
+        prediction = plan({"a": 20.0, "b": 8.0, "c": 7.0, "d": 5.0}, workers=2)
+        assert prediction == {"makespan": 20.0, "workers": [20.0, 20.0]}, f"Unexpected plan {prediction}"
+
+    def test_units_are_handed_out_longest_first(self):
+        """
+        Verify each worker starts with the longest remaining page object unit and gets all its tests.
+        """
+        scheduler = DurationScheduling(FakeConfig(workers=2), None, self.history)
+        nodes = [FakeNode("gw0"), FakeNode("gw1")]
+        for node in nodes:
+            scheduler.add_node(node)
+            scheduler.add_node_collection(node, NODEIDS)
+        scheduler.schedule()
+
+        logger.info(f"Worker units: {scheduler.worker_units}, prediction: {scheduler.prediction}")
+        assert scheduler.worker_units["gw0"][0] == "FileDownloadPage", "Expected the slowest unit first"
+        assert scheduler.worker_units["gw1"][0] == "HorizontalSliderPage", "Expected the next slowest unit second"
+        assert set(nodes[1].sent[:2]) == {4, 5}, "Expected the slider tests to run on one worker"
+        assert scheduler.prediction["makespan"] == 20.0
@@ -4,6 +4,7 @@ from PageObject.LandingPage import LandingPage
 
 logger = logging.getLogger(__name__)
 
+@pytest.mark.block_resources("image", "font")
 @pytest.mark.usefixtures("browser_instance")
 class TestDynamicControlPage:
     @pytest.fixture(autouse=True)
@@ -4,8 +4,6 @@ from PageObject.LandingPage import LandingPage
 
 logger = logging.getLogger(__name__)
 
-#since following test cant be done in headless mode and requires pyautogui to move mouse, we skip it
-@pytest.mark.run_local
 @pytest.mark.usefixtures("browser_instance")
 class TestExitIntentPage:
     """
@@ -35,7 +33,7 @@ class TestExitIntentPage:
         """
         Verify the exit intent popup is visible when mouse moves to exit area.
         """
-        self.exit_intent_page.move_mouse_to_exit_intent()
+        assert self.exit_intent_page.move_mouse_to_exit_intent(), "Exit intent popup should open when the mouse leaves the page"
         assert self.exit_intent_page.is_exit_intent_popup_visible(), "Exit intent popup should be visible after mouse move"
 
     def test_exit_intent_popup_text(self):
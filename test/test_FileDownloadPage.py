@@ -1,5 +1,4 @@
 import logging
-import time
 
 import pytest
 from PageObject.LandingPage import LandingPage
@@ -38,9 +37,8 @@ class TestFileDownloadPage:
         Verify the file download link is present and clickable.
         """
         self.file_download_page.click_file_link(filename)
-        time.sleep(10) # Wait for the download to complete
-        downloaded_file = self.file_download_page.get_download_path(request,filename)
-        assert downloaded_file is not None and downloaded_file.endswith(filename), \
+        download = self.file_download_page.wait_for_download(request, filename)
+        assert download.path.endswith(filename) and download.size > 0, \
             f"Expected '{filename}' to be downloaded"
 
-        logger.info(f"File downloaded successfully to: {downloaded_file}")
\ No newline at end of file
+        logger.info(f"File downloaded successfully to: {download.path} (sha256: {download.sha256})")
\ No newline at end of file
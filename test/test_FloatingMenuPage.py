@@ -35,16 +35,16 @@ class TestFloatingMenuPage:
         """
         # Check visibility at the top of the page
         self.floating_menu_page.scroll_to_top_of_page()
-        assert self.floating_menu_page.is_menu_visible(), "Floating menu should be visible at the top of the page"
-        assert self.floating_menu_page.get_menu_items() == ["Home", "News","Contact", "About"],\
-                                                            "Menu items should match expected values"
+        menu_visible, menu_items = self.floating_menu_page.get_menu_state()
+        assert menu_visible, "Floating menu should be visible at the top of the page"
+        assert menu_items == ["Home", "News","Contact", "About"], "Menu items should match expected values"
         # Check visibility in the middle of the page
         self.floating_menu_page.scroll_to_middle_of_page()
-        assert self.floating_menu_page.is_menu_visible(), "Floating menu should be visible in the middle of the page"
-        assert self.floating_menu_page.get_menu_items() == ["Home", "News","Contact","About"],\
-                                                            "Menu items should match expected values"
+        menu_visible, menu_items = self.floating_menu_page.get_menu_state()
+        assert menu_visible, "Floating menu should be visible in the middle of the page"
+        assert menu_items == ["Home", "News","Contact","About"], "Menu items should match expected values"
         # Check visibility at the bottom of the page
         self.floating_menu_page.scroll_to_end_of_page()
-        assert self.floating_menu_page.is_menu_visible(), "Floating menu should be visible at the bottom of the page"
-        assert self.floating_menu_page.get_menu_items() == ["Home", "News","Contact","About"],\
-                                                            "Menu items should match expected values"
\ No newline at end of file
+        menu_visible, menu_items = self.floating_menu_page.get_menu_state()
+        assert menu_visible, "Floating menu should be visible at the bottom of the page"
+        assert menu_items == ["Home", "News","Contact","About"], "Menu items should match expected values"
\ No newline at end of file
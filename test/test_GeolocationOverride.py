@@ -0,0 +1,89 @@
+import logging
+import pytest
+
+from FakeDriver import FakeDriver, chrome
+from PageObject.GeolocationPage import FAKE_POSITION_SCRIPT, GeolocationPage
+from Utilities.BrowserPool import BrowserPool
+
+logger = logging.getLogger(__name__)
+
+LATITUDE, LONGITUDE = 52.3676, 4.9041
+
+
+class FakeGeolocationDriver(FakeDriver):
+    """
+    Fake driver whose page reports the emulated position, set either through CDP or by replacing
+    navigator.geolocation with a script.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.position = None
+
+    def respond(self, driver_command, params):
+        if driver_command == "executeScript" and params["script"] == FAKE_POSITION_SCRIPT:
+            latitude, longitude, accuracy = params["args"]
+            self.position = {"latitude": latitude, "longitude": longitude}
+        if driver_command == "executeAsyncScript":
+            return self.position and dict(self.position)
+        return None
+
+    def respond_cdp(self, cmd, params):
+        if cmd == "Emulation.setGeolocationOverride":
+            self.position = {"latitude": params["latitude"], "longitude": params["longitude"]}
+        elif cmd == "Emulation.clearGeolocationOverride":
+            self.position = None
+        return {}
+
+
+FakeChromeGeolocationDriver = chrome(FakeGeolocationDriver)
+
+
+class TestGeolocationOverride:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """
+        Run before each test — a geolocation page on a fake local Chrome driver, and a browser pool to reset it.
+        """
+        self.driver = FakeChromeGeolocationDriver()
+        self.page = GeolocationPage(self.driver)
+        self.pool = BrowserPool(factory=FakeChromeGeolocationDriver)
+        yield
+        self.pool.shutdown()
+
+    def test_position_in_one_round_trip(self):
+        """
+        Verify the emulated position is set with one CDP command and read with one script.
+        """
+        self.page.set_geolocation(LATITUDE, LONGITUDE)
+        location = self.page.get_browser_based_location()
+
+        assert location == {"latitude": LATITUDE, "longitude": LONGITUDE}
+        assert [cmd for cmd, params in self.driver.cdp_commands] == ["Emulation.setGeolocationOverride"]
+        assert self.driver.commands == ["executeAsyncScript"]
+
+    def test_override_is_cleared_on_pool_reset(self):
+        """
+        Verify the next test using the browser does not inherit the position.
+        """
+        self.page.set_geolocation(LATITUDE, LONGITUDE)
+        self.pool.reset(self.driver)
+
+        assert ("Emulation.clearGeolocationOverride", {}) in self.driver.cdp_commands
+        with pytest.raises(TimeoutError):
+            self.page.get_browser_based_location(timeout=1)
+
+    def test_remote_session_replaces_navigator_geolocation(self):
+        """
+        Verify a grid session, which has no CDP, gets the position from a script on the current page.
+        """
+        driver = FakeGeolocationDriver()
+        page = GeolocationPage(driver)
+        page.set_geolocation(LATITUDE, LONGITUDE)
+        location = page.get_browser_based_location()
+
+        logger.info(f"Commands: {driver.commands}")
+        assert location == {"latitude": LATITUDE, "longitude": LONGITUDE}
+        assert driver.cdp_commands == []
+        assert driver.commands == ["executeScript", "executeAsyncScript"]
+        assert not getattr(driver, "geolocation_override", None), "Nothing for the pool reset to clear"
@@ -1,9 +1,13 @@
 import logging
 import pytest
+
 from PageObject.LandingPage import LandingPage
 
 logger = logging.getLogger(__name__)
 
+# Every test runs at the same emulated position, so results do not depend on where the browser runs.
+LATITUDE, LONGITUDE = 52.3676, 4.9041
+
 @pytest.mark.usefixtures("browser_instance")
 class TestGeolocationPage:
     @pytest.fixture(autouse=True)
@@ -15,6 +19,7 @@ class TestGeolocationPage:
         self.landing_page = LandingPage(self.driver)
         self.landing_page.navigate_to_landing_page()
         self.geolocation_page = self.landing_page.go_to_geolocation()
+        self.geolocation_page.set_geolocation(LATITUDE, LONGITUDE)
 
     def test_geolocation_page_heading(self):
         """
@@ -27,10 +32,11 @@ class TestGeolocationPage:
 
     def test_current_location(self):
         """
-        Verify the current location based on IP.
+        Verify the page shows the position the browser reports.
         """
         ip_location = self.geolocation_page.get_browser_based_location()
-        logger.info(f"IP-based location: {ip_location}")
+        logger.info(f"Browser location: {ip_location}")
+        assert (ip_location['latitude'], ip_location['longitude']) == (LATITUDE, LONGITUDE), "Emulated position not applied"
 
         self.geolocation_page.click_where_am_i_button()
         website_location = self.geolocation_page.fetch_location_from_website()
@@ -52,4 +58,5 @@ class TestGeolocationPage:
         logger.info(f"Website location after sending fake geolocation: {website_location}")
 
         assert abs(fake_latitude - website_location['latitude']) < 0.1, "Fake latitude mismatch"
-        assert abs(fake_longitude - website_location['longitude']) < 0.1, "Fake longitude mismatch"
\ No newline at end of file
+        assert abs(fake_longitude - website_location['longitude']) < 0.1, "Fake longitude mismatch"
+
@@ -0,0 +1,33 @@
+from FakeDriver import FakeDriver
+from PageObject.HorizontalSliderPage import HorizontalSliderPage
+
+
+class FakeSliderDriver(FakeDriver):
+    """
+    Fake driver whose range input snaps values to its step, like a browser does.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.scripts = []
+
+    def respond(self, driver_command, params):
+        if driver_command != "executeScript":
+            return None
+        self.scripts.append(tuple(params["args"]))
+        xpath, value = params["args"]
+        return str(min(5.0, max(0.0, round(float(value) * 2) / 2)))
+
+
+class TestHorizontalSliderFastPath:
+    def test_value_is_set_in_one_script(self):
+        """
+        Verify the fast path sets the value in one round trip and reports what the input kept.
+        """
+        driver = FakeSliderDriver()
+        page = HorizontalSliderPage(driver)
+
+        assert page.set_slider_value(3.5) == 3.5
+        assert page.set_slider_value(7) == 5.0, "The browser clamps to the slider maximum"
+        assert driver.scripts == [(HorizontalSliderPage.slider, 3.5), (HorizontalSliderPage.slider, 7)]
+        assert driver.commands == ["executeScript", "executeScript"]
@@ -34,14 +34,41 @@ class TestHorizontalSliderPage:
         assert initial_value == 0.0, "Initial slider value should be 0.0"
 
     @pytest.mark.parametrize("target_value", [i * 0.5 for i in range(11)])
-    def test_set_slider_value(self,target_value):
+    def test_set_slider_value_by_drag(self, target_value):
         """
-        Set the horizontal slider to a specific value and verify it.
+        Drag the horizontal slider with the mouse to a specific value and verify it.
         """
-        self.horizontal_slider_page.set_slider_value(target_value)    # since step=0.5
+        self.horizontal_slider_page.set_slider_value(target_value, realistic=True)
 
         current_value = self.horizontal_slider_page.get_slider_value()
+        logger.info(f"Slider value after dragging: {current_value}")
+
+        assert current_value == target_value, f"Expected slider value to be {target_value}, but got {current_value}"
+
+
+@pytest.mark.usefixtures("class_browser_instance")
+class TestHorizontalSliderSweep:
+    """
+    Sweeps every slider value over one page load in one browser; each value is its own test result.
+    """
+
+    @pytest.fixture(scope="class")
+    def horizontal_slider_page(self, class_browser_instance):
+        """
+        Open the Horizontal Slider page once for the whole sweep.
+        """
+        return LandingPage(class_browser_instance).go_to_horizontal_slider()
+
+    @pytest.mark.parametrize("target_value", [i * 0.5 for i in range(11)])
+    def test_set_slider_value(self, horizontal_slider_page, target_value):
+        """
+        Set the horizontal slider to a specific value and verify it.
+        """
+        set_value = horizontal_slider_page.set_slider_value(target_value)
+
+        current_value = horizontal_slider_page.get_slider_value()
         logger.info(f"Slider value after setting: {current_value}")
 
+        assert set_value == target_value, f"Slider input holds {set_value} instead of {target_value}"
         assert current_value == target_value, f"Expected slider value to be {target_value}, but got {current_value}"
 
@@ -0,0 +1,119 @@
+import logging
+import time
+
+import pytest
+
+from FakeDriver import FakeDriver
+from Utilities.HttpCassette import HttpCassette, request_key
+
+logger = logging.getLogger(__name__)
+
+
+class FakeRequest:
+    """
+    Minimal stand-in for a selenium-wire request.
+    """
+
+    def __init__(self, url, method="GET", headers=None, body=b""):
+        self.url = url
+        self.method = method
+        self.headers = headers or {}
+        self.body = body
+        self.response = None
+        self.aborted = None
+
+    def create_response(self, status_code, headers=(), body=b""):
+        self.response = (status_code, list(headers), body)
+
+    def abort(self, error_code=403):
+        self.aborted = error_code
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers, body):
+        self.status_code = status_code
+        self.headers = headers
+        self.body = body
+
+
+class TestHttpCassette:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """
+        Run before each test — records a small cassette into a temporary directory.
+        """
+        self.directory = str(tmp_path)
+        recorder = HttpCassette(self.directory, mode="record", name="gw0").open()
+        driver = recorder.attach(FakeDriver())
+        for text in (b"first visit", b"second visit"):
+            driver.response_interceptor(
+                FakeRequest("https://example.test/dynamic_content"),
+                FakeResponse(200, {"Content-Type": "text/html", "Transfer-Encoding": "chunked"}, text),
+            )
+        driver.response_interceptor(
+            FakeRequest("https://example.test/download/cat.jpg"),
+            FakeResponse(200, {"Content-Type": "image/jpeg"}, bytes(range(256)) * 64),
+        )
+        recorder.close()
+        self.replay = HttpCassette(self.directory, mode="replay", name="gw1").open()
+
+    def test_replays_recorded_response_without_network(self):
+        """
+        Verify a recorded request is answered from the store, with hop-by-hop headers dropped.
+        """
+        driver = self.replay.attach(FakeDriver())
+        request = FakeRequest("https://example.test/download/cat.jpg")
+        driver.request_interceptor(request)
+
+        status, headers, body = request.response
+        assert status == 200 and body == bytes(range(256)) * 64
+        assert headers == [["Content-Type", "image/jpeg"]]
+
+    def test_variants_are_replayed_in_turn(self):
+        """
+        Verify randomised pages still change between visits on replay.
+        """
+        key = request_key("GET", "https://example.test/dynamic_content", {})
+        bodies = [self.replay.lookup(key)[2] for _ in range(3)]
+        logger.info(f"Replayed bodies: {bodies}")
+        assert bodies == [b"first visit", b"second visit", b"first visit"]
+
+    def test_unrecorded_request_is_aborted(self):
+        """
+        Verify replay never falls through to the network and reports the miss.
+        """
+        driver = self.replay.attach(FakeDriver())
+        request = FakeRequest("https://example.test/not-recorded")
+        driver.request_interceptor(request)
+
+        report = self.replay.report()
+        assert request.aborted == 504 and request.response is None
+        assert report["misses"] == 1 and report["missed_urls"] == ["https://example.test/not-recorded"]
+
+    def test_key_ignores_cookie_values_but_not_names(self):
+        """
+        Verify session tokens do not break replay, while logged-in state still does.
+        """
+        url = "https://example.test/secure"
+        assert request_key("GET", url, {"Cookie": "session=a"}) == request_key("GET", url, {"Cookie": "session=b"})
+        assert request_key("GET", url, {"Cookie": "session=a"}) != request_key("GET", url, {})
+
+    def test_staleness_report(self):
+        """
+        Verify entries older than the maximum age and never replayed entries are reported.
+        """
+        self.replay.max_age_days = 0
+        time.sleep(0.01)
+        self.replay.lookup(request_key("GET", "https://example.test/download/cat.jpg", {}))
+        report = self.replay.report()
+
+        assert report["entries"] == 3 and report["keys"] == 2
+        assert report["stale_urls"] == ["https://example.test/download/cat.jpg", "https://example.test/dynamic_content"]
+        assert report["unused_urls"] == ["https://example.test/dynamic_content"]
+
+    def test_invalid_mode(self):
+        """
+        Verify an unknown mode is rejected.
+        """
+        with pytest.raises(ValueError):
+            HttpCassette(self.directory, mode="rewind")
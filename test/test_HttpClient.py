@@ -0,0 +1,168 @@
+import hashlib
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from PageObject.BrokenImagePage import BrokenImagePage
+from PageObject.DynamicContentPage import DynamicContentPage
+from Utilities import HttpClient
+from Utilities.LocalSite import LocalSite
+
+logger = logging.getLogger(__name__)
+
+
+class SlowGetOnlyHandler(BaseHTTPRequestHandler):
+    """
+    Answers GET after a delay and has no HEAD support (501), like some image hosts.
+    """
+
+    def do_GET(self):
+        time.sleep(0.2)
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def get_only_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowGetOnlyHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+class TestHttpClient:
+    def test_head_request_statuses(self):
+        """
+        Verify HEAD checks report the status of each image of the broken images page.
+        """
+        with LocalSite() as site:
+            urls = [site.base_url + src for src in ("asdf.jpg", "hjkl.jpg", "img/avatar-blank.jpg")]
+            checks = HttpClient.check_urls(urls)
+
+        logger.info(f"Checks: {checks}")
+        assert [check.status for check in checks] == [404, 404, 200]
+        assert {check.method for check in checks} == {"HEAD"}
+
+    def test_get_fallback_when_head_is_unsupported(self, get_only_server):
+        """
+        Verify a server without HEAD support is checked with GET.
+        """
+        check = HttpClient.check_url(get_only_server)
+        assert check.status == 200 and check.method == "GET"
+
+    def test_checks_run_concurrently(self, get_only_server):
+        """
+        Verify many slow checks take about as long as one.
+        """
+        start = time.perf_counter()
+        checks = HttpClient.check_urls([f"{get_only_server}{n}.png" for n in range(8)])
+        elapsed = time.perf_counter() - start
+
+        assert all(check.status == 200 for check in checks)
+        assert elapsed < 1.0, f"8 checks of 0.2s took {elapsed:.2f}s"
+
+    def test_connection_error_is_reported(self):
+        """
+        Verify an unreachable URL is reported instead of raising.
+        """
+        check = HttpClient.check_url("http://127.0.0.1:9/missing.png", timeout=1)
+        assert check.status is None and check.error
+
+    def test_session_is_shared(self):
+        """
+        Verify every caller uses the same pooled session.
+        """
+        assert HttpClient.get_session() is HttpClient.get_session()
+
+
+class TestBrokenImageAudit:
+    def test_only_unrendered_images_are_checked(self, monkeypatch):
+        """
+        Verify audit_images reads the images once and checks only the unrendered ones over HTTP.
+        """
+        with LocalSite() as site:
+            images = [
+                {"src": site.base_url + "asdf.jpg", "complete": True, "naturalWidth": 0, "visible": True},
+                {"src": site.base_url + "img/avatar-blank.jpg", "complete": True, "naturalWidth": 160, "visible": True},
+                {"src": site.base_url + "hjkl.jpg", "complete": True, "naturalWidth": 0, "visible": True},
+            ]
+            page = BrokenImagePage(driver=None)
+            scripts = []
+            monkeypatch.setattr(page, "execute_script",
+                                lambda *args: scripts.append(args) or {page.image_xpath: images})
+            audits = page.audit_images()
+
+        assert len(scripts) == 1, "All images should be read in a single script"
+        assert [(a.index, a.rendered, a.status) for a in audits] == [(1, False, 404), (2, True, None), (3, False, 404)]
+
+
+class TestContentHashCache:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """
+        Run before each test — fresh cache and a local site serving images with ETags.
+        """
+        self.cache = HttpClient.ContentHashCache(max_entries=2)
+        with LocalSite() as site:
+            self.site = site
+            self.avatar = site.base_url + "img/avatars/Original-Facebook-Geek-Profile-Avatar-{}.jpg"
+            yield
+
+    def test_revalidates_instead_of_downloading_again(self):
+        """
+        Verify a cached URL is revalidated with its ETag and the cached digest reused on 304.
+        """
+        url = self.avatar.format(1)
+        first = self.cache.get(url)
+        second = self.cache.get(url)
+
+        expected = hashlib.md5(self.site.images["img/avatars/Original-Facebook-Geek-Profile-Avatar-1.jpg"]).hexdigest()
+        assert first == second == expected
+        assert self.cache.stats == {"hits": 1, "misses": 1}
+
+    def test_least_recently_used_url_is_evicted(self):
+        """
+        Verify the cache keeps at most max_entries URLs, dropping the least recently used.
+        """
+        for n in (1, 2, 1, 3):
+            self.cache.get(self.avatar.format(n))
+        assert list(self.cache._entries) == [self.avatar.format(1), self.avatar.format(3)]
+
+    def test_get_many_fetches_duplicates_once(self):
+        """
+        Verify rows sharing an avatar trigger a single fetch.
+        """
+        urls = [self.avatar.format(n) for n in (4, 5, 4)]
+        hashes = self.cache.get_many(urls)
+        assert set(hashes) == set(urls) and self.cache.stats["misses"] == 2
+
+    def test_dynamic_content_rows_are_read_in_one_script(self, monkeypatch):
+        """
+        Verify DynamicContentPage reads all rows in one script and keeps each image with its row's text,
+        also when a row has no image.
+        """
+        page = DynamicContentPage(driver=None)
+        monkeypatch.setattr(HttpClient, "content_hashes", self.cache)
+        scripts = []
+        rows = {page.content_row: [
+            {page.row_image: "", page.row_text: "first row"},
+            {page.row_image: self.avatar.format(6), page.row_text: "second row"},
+            {page.row_image: self.avatar.format(7), page.row_text: "third row"},
+        ]}
+        monkeypatch.setattr(page, "execute_script", lambda *args: scripts.append(args) or rows)
+        content = page.get_dynamic_content()
+
+        assert len(scripts) == 1
+        assert [row["text"] for row in content.values()] == ["first row", "second row", "third row"]
+        assert content["row_1"]["image"] is None
+        assert content["row_2"]["image"] == self.cache.get(self.avatar.format(6))
+        assert content["row_3"]["image"] != content["row_2"]["image"]
@@ -1,5 +1,4 @@
 import logging
-import time
 
 import pytest
 
@@ -8,22 +7,21 @@ from PageObject.LandingPage import LandingPage
 logger = logging.getLogger(__name__)
 
 
-@pytest.mark.usefixtures("browser_instance")
+@pytest.mark.usefixtures("page_session")
 class TestJqueryUIMenuPage:
     """
     Test class for the jQuery UI Menu page.
     """
 
     @pytest.fixture(autouse=True)
-    def setup(self, request, browser_instance):
+    def setup(self, page_session):
         """
-        Run before each test — creates fresh LandingPage instance.
+        Run before each test — gets the jQuery UI Menu page shared by the class, restored if a previous test changed it.
         """
-        self.driver = browser_instance
-        self.landing_page = LandingPage(self.driver)
-        self.landing_page.navigate_to_landing_page()
-        self.menu_page = self.landing_page.go_to_jquery_ui_menu()
+        self.driver = page_session.driver
+        self.menu_page = page_session.page(lambda: LandingPage(self.driver).go_to_jquery_ui_menu())
 
+    @pytest.mark.readonly
     def test_menu_page_heading(self):
         """
         Verify the jQuery UI Menu page heading.
@@ -33,6 +31,7 @@ class TestJqueryUIMenuPage:
         logger.info(f"Heading found: {actual_heading}")
         assert expected_heading in actual_heading, f"Expected heading to contain '{expected_heading}'"
 
+    @pytest.mark.readonly
     def test_menu_button_status(self):
         """
         Verify that the status of button is enabled/disabled.
@@ -59,8 +58,8 @@ class TestJqueryUIMenuPage:
         self.menu_page.click_menu_option("Enabled")
         self.menu_page.click_menu_option("Downloads")
         self.menu_page.click_menu_option(option)
-        time.sleep(10) #wait for the download to complete
-        downloaded_file = self.menu_page.get_download_path(request, filename)
-        assert downloaded_file is not None and downloaded_file.endswith(filename), \
+        download = self.menu_page.wait_for_download(request, filename)
+        assert download.path.endswith(filename) and download.size > 0, \
             f"Expected '{filename}' to be downloaded"
+        logger.info(f"File downloaded successfully to: {download.path} (sha256: {download.sha256})")
 
@@ -35,3 +35,18 @@ class TestLandingPage:
         actual_heading = self.landing_page.get_page_heading()
         logger.info(f"Heading found: {actual_heading}")
         assert expected_heading in actual_heading, f"Expected heading to contain '{expected_heading}'"
+
+    @pytest.mark.parametrize("go_to, path", [
+        ("go_to_checkboxes", "/checkboxes"),
+        ("go_to_dynamic_loading", "/dynamic_loading"),
+        ("go_to_jquery_ui_menu", "/jqueryui/menu"),
+    ])
+    def test_navigation_by_click(self, go_to, path):
+        """
+        Verify the landing page links still lead to their pages when navigating by click.
+        """
+        landing_page = LandingPage(self.driver, navigate_directly=False)
+        landing_page.navigate_to_landing_page()
+        page = getattr(landing_page, go_to)()
+        logger.info(f"URL after click: {page.get_url()}")
+        assert page.get_url().endswith(path), f"Expected to land on '{path}'"
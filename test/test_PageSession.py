@@ -0,0 +1,103 @@
+import logging
+import pytest
+
+from FakeDriver import FakeDriver
+from Utilities.PageSession import PageSession, CAPTURE_STATE_SCRIPT
+
+logger = logging.getLogger(__name__)
+
+PAGE_URL = "http://localhost/checkboxes"
+
+
+class FakePageDriver(FakeDriver):
+    """
+    Fake driver whose page either accepts or refuses a snapshot restore.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.restorable = True
+        self.restores = 0
+
+    def respond(self, driver_command, params):
+        if driver_command != "executeScript":
+            return None
+        if params["script"] == CAPTURE_STATE_SCRIPT:
+            return {"url": self.current_url, "markup": 1, "scroll": [0, 0], "controls": []}
+        self.restores += 1
+        return self.restorable
+
+
+class TestPageSession:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """
+        Run before each test — creates a page session over a fake driver.
+        """
+        self.driver = FakePageDriver()
+        self.opened = []
+
+        def open_page():
+            self.driver.get(PAGE_URL)
+            self.opened.append(PAGE_URL)
+            return object()
+
+        self.open_page = open_page
+        self.session = PageSession(self.driver)
+
+    def run_test(self, mutating: bool):
+        self.session.begin(mutating=mutating)
+        page = self.session.page(self.open_page)
+        self.session.end()
+        return page
+
+    def test_readonly_tests_share_the_page(self):
+        """
+        Verify the page is opened once and readonly tests reuse it untouched.
+        """
+        first = self.run_test(mutating=False)
+        second = self.run_test(mutating=False)
+
+        logger.info(f"Page session stats: {self.session.stats}")
+        assert first is second, "Expected the same page object"
+        assert self.opened == [PAGE_URL], "Expected a single page open"
+        assert self.driver.restores == 0 and self.driver.opened == [PAGE_URL], "Expected no restore"
+
+    def test_mutating_test_is_followed_by_a_snapshot_restore(self):
+        """
+        Verify the page is restored from the snapshot before the test after a mutating one.
+        """
+        self.run_test(mutating=True)
+        self.run_test(mutating=False)
+
+        assert self.driver.restores == 1, "Expected one snapshot restore"
+        assert self.session.stats["snapshot_restores"] == 1 and self.session.stats["reloads"] == 0
+
+    def test_reload_when_snapshot_cannot_restore(self):
+        """
+        Verify the page is loaded again when the markup changed beyond the snapshot.
+        """
+        self.run_test(mutating=True)
+        self.driver.restorable = False
+        self.run_test(mutating=True)
+
+        assert self.driver.opened == [PAGE_URL, PAGE_URL], f"Expected a reload, got {self.driver.opened}"
+        assert self.session.stats["reloads"] == 1
+
+    def test_navigation_away_is_detected_for_readonly_tests(self):
+        """
+        Verify a test that left the page (even if marked readonly) gets the page loaded back.
+        """
+        self.run_test(mutating=False)
+        self.driver.current_url = "http://localhost/"
+        self.session.restore, self.session._snapshot = "reload", None
+        self.run_test(mutating=False)
+
+        assert self.driver.current_url == PAGE_URL, "Expected the shared page to be loaded again"
+
+    def test_unknown_restore_is_rejected(self):
+        """
+        Verify an unknown restore strategy is reported.
+        """
+        with pytest.raises(ValueError):
+            PageSession(self.driver, restore="rewind")
@@ -0,0 +1,84 @@
+import logging
+import os
+import struct
+import zlib
+import pytest
+
+from FakeDriver import FakeDriver
+from Utilities.ScreenshotWriter import ScreenshotWriter
+
+logger = logging.getLogger(__name__)
+
+
+def tiny_png() -> bytes:
+    """
+    Build a valid 40x30 PNG without any imaging library.
+    """
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    rows = b"".join(b"\x00" + b"\xff\x00\x00" * 40 for _ in range(30))
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", struct.pack(">IIBBBBB", 40, 30, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(rows)) + chunk(b"IEND", b""))
+
+
+def screenshot_driver() -> FakeDriver:
+    """
+    Fake driver whose screenshots are a tiny PNG.
+    """
+    driver = FakeDriver()
+    driver.screenshot = tiny_png()
+    return driver
+
+
+class TestScreenshotWriter:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """
+        Run before each test — creates a writer storing into a temporary directory.
+        """
+        self.directory = str(tmp_path / "screenshots")
+        self.writer = ScreenshotWriter(directory=self.directory)
+        yield
+        self.writer.close()
+
+    def test_screenshot_is_written_in_background(self):
+        """
+        Verify the captured screenshot ends up in the store under its content hash.
+        """
+        screenshot = self.writer.capture(screenshot_driver(), "test_a::call")
+        self.writer.flush()
+
+        logger.info(f"Screenshot: {screenshot}")
+        assert os.path.isfile(screenshot.full_path), "Expected the full image to be written"
+        assert os.path.basename(screenshot.full_path) == f"{screenshot.sha256}.png"
+        assert os.path.isfile(screenshot.thumbnail_path), "Expected a thumbnail (or the full image) to link"
+        assert self.writer.index == {"test_a::call": screenshot.sha256}
+
+    def test_identical_screenshots_are_written_once(self):
+        """
+        Verify identical screenshots of different tests share one stored file.
+        """
+        driver = screenshot_driver()
+        first = self.writer.capture(driver, "test_a::call")
+        second = self.writer.capture(driver, "test_b::call")
+        self.writer.close()
+
+        stats = self.writer.stats
+        logger.info(f"Screenshot writer stats: {stats}")
+        assert first == second, "Expected the same stored files"
+        assert driver.commands.count("screenshot") == 2, "Expected one capture per test"
+        assert stats["captured"] == 2 and stats["written"] == 1 and stats["deduplicated"] == 1
+        assert len([f for f in os.listdir(self.directory) if f.endswith(".png")]) == 1
+
+    def test_thumbnail_is_smaller_than_the_full_image(self):
+        """
+        Verify the thumbnail fits the report's thumbnail size (needs Pillow).
+        """
+        image = pytest.importorskip("PIL.Image")
+        screenshot = self.writer.capture(screenshot_driver(), "test_a::call")
+        self.writer.flush()
+
+        with image.open(screenshot.thumbnail_path) as thumbnail:
+            assert thumbnail.format == "WEBP", f"Unexpected thumbnail format {thumbnail.format}"
+            assert thumbnail.width <= 304 and thumbnail.height <= 228
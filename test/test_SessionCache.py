@@ -0,0 +1,106 @@
+import logging
+import pytest
+
+from FakeDriver import FakeDriver, chrome
+from Utilities.SessionCache import SessionCache
+
+logger = logging.getLogger(__name__)
+
+SECURE_URL = "http://site.test/secure"
+
+
+class FakeSiteDriver(FakeDriver):
+    """
+    Fake driver on a site whose secure page needs a known session cookie.
+    """
+
+    def __init__(self, server_sessions):
+        super().__init__()
+        self.server_sessions = server_sessions
+        self.cookies = {}
+        self.loads = 0
+
+    def get(self, url):
+        super().get(url)
+        self.loads += 1
+        logged_in = self.cookies.get("session") in self.server_sessions
+        self.current_url = url if url != SECURE_URL or logged_in else "http://site.test/login"
+
+    def respond(self, driver_command, params):
+        if driver_command == "getCookies":
+            return [{"name": name, "value": value, "path": "/"} for name, value in self.cookies.items()]
+        if driver_command == "addCookie":
+            self.cookies[params["cookie"]["name"]] = params["cookie"]["value"]
+        return None
+
+    def respond_cdp(self, cmd, params):
+        assert cmd == "Network.setCookies"
+        self.cookies.update({c["name"]: c["value"] for c in params["cookies"]})
+        return {}
+
+
+FakeChromeSiteDriver = chrome(FakeSiteDriver)
+
+
+class TestSessionCache:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """
+        Run before each test — an empty cache and a server with no sessions.
+        """
+        self.cache = SessionCache()
+        self.server_sessions = set()
+
+    def open(self, driver):
+        def login():
+            session = f"s{len(self.server_sessions)}"
+            self.server_sessions.add(session)
+            driver.cookies.update(session=session, flash="success")
+            driver.get(SECURE_URL)
+
+        return self.cache.open(driver, SECURE_URL, "tomsmith", login, lambda: driver.current_url == SECURE_URL)
+
+    def test_later_browsers_skip_the_login(self):
+        """
+        Verify only the first browser logs in, and the others open the page in one navigation.
+        """
+        first, second = FakeChromeSiteDriver(self.server_sessions), FakeChromeSiteDriver(self.server_sessions)
+        assert self.open(first) and self.open(second)
+
+        assert self.cache.stats == {"logins": 1, "restores": 1, "invalidations": 0}
+        assert second.loads == 1
+        assert "flash" not in second.cookies, "One-shot cookies are not replayed"
+
+    def test_expired_session_is_replaced(self):
+        """
+        Verify a session the server no longer knows is detected on use and replaced by a new login.
+        """
+        self.open(FakeChromeSiteDriver(self.server_sessions))
+        self.server_sessions.clear()
+        driver = FakeChromeSiteDriver(self.server_sessions)
+
+        assert self.open(driver)
+        assert self.cache.stats == {"logins": 2, "restores": 0, "invalidations": 1}
+        assert driver.current_url == SECURE_URL
+
+    def test_invalidate_on_logout(self):
+        """
+        Verify an invalidated session is not restored again.
+        """
+        self.open(FakeChromeSiteDriver(self.server_sessions))
+        self.cache.invalidate("http://site.test/logout", "tomsmith")
+        self.open(FakeChromeSiteDriver(self.server_sessions))
+
+        assert self.cache.stats["logins"] == 2 and self.cache.stats["restores"] == 0
+
+    def test_remote_session_is_restored_through_webdriver(self):
+        """
+        Verify a grid session, which has no CDP, loads the site before adding the cached cookies.
+        """
+        self.open(FakeChromeSiteDriver(self.server_sessions))
+        driver = FakeSiteDriver(self.server_sessions)
+
+        assert self.open(driver)
+        assert self.cache.stats["restores"] == 1
+        assert driver.opened == ["http://site.test/", SECURE_URL]
+        assert driver.commands.count("addCookie") == 1 and driver.cdp_commands == []
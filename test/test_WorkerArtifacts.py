@@ -0,0 +1,62 @@
+import json
+import logging
+import os
+import pytest
+
+from Utilities import WorkerArtifacts
+
+logger = logging.getLogger(__name__)
+
+
+class TestMergeWorkerArtifacts:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path, monkeypatch):
+        """
+        Run before each test — a reports directory in a temporary directory.
+        """
+        self.reports_dir = str(tmp_path / "reports")
+        self.workers_dir = os.path.join(self.reports_dir, "workers")
+        monkeypatch.setattr(WorkerArtifacts, "REPORTS_DIR", self.reports_dir)
+        monkeypatch.setattr(WorkerArtifacts, "WORKERS_DIR", self.workers_dir)
+        os.makedirs(self.workers_dir)
+
+    def write(self, *parts):
+        path = os.path.join(self.workers_dir, *parts)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(parts[-1])
+
+    def test_artifacts_of_every_worker_are_indexed_per_test(self):
+        """
+        Verify each worker's per-test directories end up in one index, with report-relative links.
+        """
+        self.write("gw0", "downloads", "test_a", "some-file.txt")
+        self.write("gw1", "downloads", "test_b", "other-file.txt")
+        self.write("gw1", "screenshots", "test_b", "failure.png")
+        self.write("gw1", "browser_pool.json")
+        os.makedirs(os.path.join(self.workers_dir, "gw1", "downloads", "test_c"))
+
+        index = WorkerArtifacts.merge_worker_artifacts()
+
+        logger.info(f"Artifacts index: {index}")
+        assert index == {
+            "downloads": {
+                "test_a": ["workers/gw0/downloads/test_a/some-file.txt"],
+                "test_b": ["workers/gw1/downloads/test_b/other-file.txt"],
+            },
+            "screenshots": {"test_b": ["workers/gw1/screenshots/test_b/failure.png"]},
+        }
+        with open(os.path.join(self.reports_dir, "artifacts.json")) as f:
+            assert json.load(f) == index
+
+    def test_files_outside_test_directories_are_skipped(self):
+        """
+        Verify downloads saved straight into the worker's launch-time download directory
+        (grid or non-CDP sessions) do not break the merge.
+        """
+        self.write("gw0", "downloads", "stray-download.txt")
+        self.write("gw0", "downloads", "test_a", "some-file.txt")
+
+        index = WorkerArtifacts.merge_worker_artifacts()
+
+        assert index == {"downloads": {"test_a": ["workers/gw0/downloads/test_a/some-file.txt"]}}